@@ -0,0 +1,45 @@
+"""
+Benchmarks of the datashader operations.
+"""
+
+from holoviews.element import Curve, Image, Points
+
+from .synthetic import columns, grid
+
+
+class Datashader(object):
+    """
+    Benchmarks rasterizing and shading points, lines and images.
+    """
+
+    params = ([10000, 1000000],)
+
+    param_names = ['size']
+
+    def setup(self, size):
+        try:
+            from holoviews.operation.datashader import datashade, rasterize, regrid
+        except ImportError:
+            raise NotImplementedError('datashader not available')
+        self.datashade, self.rasterize, self.regrid = datashade, rasterize, regrid
+        data = columns(size)
+        self.points = Points(data, ['x', 'y'], ['z'])
+        self.curve = Curve(data, 'x', 'y')
+        self.image = Image(grid((1000, 1000)), ['x', 'y'], 'z')
+
+    def time_rasterize_points(self, size):
+        self.rasterize(self.points, width=400, height=400, dynamic=False)
+
+    def time_rasterize_points_mean(self, size):
+        import datashader as ds
+        self.rasterize(self.points, aggregator=ds.mean('z'),
+                       width=400, height=400, dynamic=False)
+
+    def time_datashade_points(self, size):
+        self.datashade(self.points, width=400, height=400, dynamic=False)
+
+    def time_rasterize_curve(self, size):
+        self.rasterize(self.curve, width=400, height=400, dynamic=False)
+
+    def time_regrid_image(self, size):
+        self.regrid(self.image, width=400, height=400, dynamic=False)
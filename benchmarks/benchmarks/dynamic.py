@@ -0,0 +1,88 @@
+"""
+Benchmarks of triggering streams and evaluating DynamicMaps.
+"""
+
+from holoviews.core import DynamicMap
+from holoviews.element import Curve, Points
+from holoviews.operation import histogram
+from holoviews.streams import Buffer, Pipe, RangeXY, Stream
+
+from .synthetic import columns
+
+
+class StreamEvents(object):
+    """
+    Benchmarks triggering events on streams attached to DynamicMaps,
+    including chains of DynamicMaps created by operations.
+    """
+
+    params = ([1000, 100000],)
+
+    param_names = ['size']
+
+    def setup(self, size):
+        self.stream = Stream.define('Seed', seed=0)()
+        self.dmap = DynamicMap(lambda seed: Points(columns(size, seed=seed)),
+                               streams=[self.stream])
+        self.dmap[()]
+        self.chained = histogram(self.dmap, dimension='x')
+        self.chained[()]
+        self.points = Points(columns(size))
+        self.range_stream = RangeXY(x_range=(0, 1), y_range=(0, 1))
+        self.ranged = DynamicMap(
+            lambda x_range, y_range: self.points.select(x=x_range, y=y_range),
+            streams=[self.range_stream])
+        self.ranged[()]
+        self.seed = 0
+
+    def _next_seed(self):
+        self.seed = (self.seed + 1) % 10
+        return self.seed
+
+    def time_event(self, size):
+        self.stream.event(seed=self._next_seed())
+        self.dmap[()]
+
+    def time_event_chained(self, size):
+        self.stream.event(seed=self._next_seed())
+        self.chained[()]
+
+    def time_event_range(self, size):
+        self.range_stream.event(x_range=(0.25, 0.75), y_range=(0.25, 0.75))
+        self.ranged[()]
+
+    def time_trigger_multiple(self, size):
+        streams = [self.stream, self.range_stream]
+        self.stream.update(seed=self._next_seed())
+        Stream.trigger(streams)
+
+
+class StreamingData(object):
+    """
+    Benchmarks sending data through Pipe and Buffer streams.
+    """
+
+    params = ([100, 10000],)
+
+    param_names = ['size']
+
+    def setup(self, size):
+        try:
+            import pandas as pd
+        except ImportError:
+            raise NotImplementedError('pandas not available')
+        self.chunk = pd.DataFrame(columns(size))
+        self.pipe = Pipe(data=self.chunk)
+        self.pipe_dmap = DynamicMap(lambda data: Curve(data, 'x', 'y'),
+                                    streams=[self.pipe])
+        self.pipe_dmap[()]
+        self.buffer = Buffer(self.chunk, length=size*10, index=False)
+        self.buffer_dmap = DynamicMap(lambda data: Curve(data, 'x', 'y'),
+                                      streams=[self.buffer])
+        self.buffer_dmap[()]
+
+    def time_pipe_send(self, size):
+        self.pipe.send(self.chunk)
+
+    def time_buffer_send(self, size):
+        self.buffer.send(self.chunk)
@@ -0,0 +1,28 @@
+"""
+Benchmarks of the graph layouts.
+"""
+
+from holoviews.element import Graph
+from holoviews.element.sankey import _layout_sankey
+
+from .synthetic import flows
+
+
+class SankeyLayout(object):
+    """
+    Benchmarks the dictionary and array based Sankey layouts.
+    """
+
+    params = ([(100, 1000), (1000, 10000)], ['dict', 'array'])
+
+    param_names = ['size', 'method']
+
+    def setup(self, size, method):
+        nnodes, nlinks = size
+        data = flows(10, nnodes//10, nlinks)
+        edges = list(zip(data['source'], data['target'], data['value']))
+        self.graph = Graph(edges, vdims='value')
+        self.layout = _layout_sankey.instance(method=method)
+
+    def time_sankey_layout(self, size, method):
+        self.layout.layout(self.graph)
@@ -0,0 +1,34 @@
+"""
+Benchmarks of the time taken to import HoloViews and to construct the
+first Dataset in a fresh interpreter.
+"""
+
+
+class Imports(object):
+    """
+    Benchmarks importing holoviews in a new interpreter, reporting
+    whether heavy optional dependencies were pulled in as a result.
+    """
+
+    def timeraw_import_holoviews(self):
+        return """
+        import holoviews
+        """
+
+    def timeraw_import_holoviews_dataset(self):
+        return """
+        import numpy as np
+        import holoviews as hv
+        hv.Dataset({'x': np.arange(10), 'y': np.arange(10)}, 'x', 'y')
+        """
+
+    def track_heavy_modules(self):
+        import subprocess
+        import sys
+        code = ("import sys, holoviews; "
+                "print(len([m for m in ('panel', 'bokeh', 'xarray', 'dask') "
+                "if m in sys.modules]))")
+        output = subprocess.check_output([sys.executable, '-c', code])
+        return int(output.decode('utf-8').strip().splitlines()[-1])
+
+    track_heavy_modules.unit = 'modules'
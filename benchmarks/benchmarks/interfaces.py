@@ -0,0 +1,186 @@
+"""
+Benchmarks of the core Dataset API across the data interfaces.
+"""
+
+import numpy as np
+
+from holoviews.core.data import Dataset
+from holoviews.element import Path
+
+from .synthetic import columns, grid, paths
+
+
+def native_data(data, datatype):
+    """
+    Converts a dictionary of columns to the native format of the
+    interface with the supplied datatype, skipping the benchmark if
+    the required library is not available.
+    """
+    try:
+        if datatype == 'dictionary':
+            return data
+        elif datatype == 'array':
+            return np.column_stack([data[c] for c in ['x', 'y', 'cat', 'z']])
+        import pandas as pd
+        df = pd.DataFrame(data, columns=['x', 'y', 'cat', 'z'])
+        if datatype == 'dataframe':
+            return df
+        elif datatype == 'dask':
+            import dask.dataframe as dd
+            return dd.from_pandas(df, npartitions=4)
+    except ImportError:
+        raise NotImplementedError('%s interface not available' % datatype)
+
+
+class TabularInterfaces(object):
+    """
+    Benchmarks the tabular interfaces with a dataset of x, y and
+    category key dimensions and a z value dimension. The xarray
+    interface requires the key dimensions to be coordinates of a
+    grid and is benchmarked by GriddedInterfaces instead.
+    """
+
+    params = ([1000, 100000],
+              ['dictionary', 'array', 'dataframe', 'dask'])
+
+    param_names = ['size', 'datatype']
+
+    kdims = ['x', 'y', 'cat']
+
+    vdims = ['z']
+
+    def setup(self, size, datatype):
+        self.data = native_data(columns(size), datatype)
+        self.dataset = Dataset(self.data, self.kdims, self.vdims,
+                               datatype=[datatype])
+        if self.dataset.interface.datatype != datatype:
+            raise NotImplementedError('%s interface not available' % datatype)
+
+    def time_construct(self, size, datatype):
+        Dataset(self.data, self.kdims, self.vdims, datatype=[datatype])
+
+    def time_select_range(self, size, datatype):
+        self.dataset.select(x=(0.25, 0.75), y=(0.25, 0.75)).data
+
+    def time_select_values(self, size, datatype):
+        self.dataset.select(cat=[1, 3, 5]).data
+
+    def time_groupby(self, size, datatype):
+        self.dataset.groupby('cat')
+
+    def time_aggregate(self, size, datatype):
+        self.dataset.aggregate('cat', np.mean).data
+
+    def time_range(self, size, datatype):
+        self.dataset.interface.range(self.dataset, 'z')
+
+    def time_dimension_values(self, size, datatype):
+        self.dataset.dimension_values('z')
+
+
+class GriddedInterfaces(object):
+    """
+    Benchmarks the gridded interfaces with a 2D array of z values
+    indexed by x and y coordinates.
+    """
+
+    params = ([(100, 100), (1000, 1000)], ['grid', 'xarray'])
+
+    param_names = ['shape', 'datatype']
+
+    def setup(self, shape, datatype):
+        data = grid(shape)
+        if datatype == 'xarray':
+            try:
+                import xarray as xr
+            except ImportError:
+                raise NotImplementedError('xarray interface not available')
+            data = xr.Dataset({'z': (('y', 'x'), data['z'])},
+                              coords={'x': data['x'], 'y': data['y']})
+        self.data = data
+        self.dataset = Dataset(data, ['x', 'y'], ['z'], datatype=[datatype])
+
+    def time_construct(self, shape, datatype):
+        Dataset(self.data, ['x', 'y'], ['z'], datatype=[self.dataset.interface.datatype])
+
+    def time_select_range(self, shape, datatype):
+        self.dataset.select(x=(0.25, 0.75), y=(0.25, 0.75)).data
+
+    def time_groupby(self, shape, datatype):
+        self.dataset.groupby('x')
+
+    def time_aggregate(self, shape, datatype):
+        self.dataset.aggregate('x', np.mean).data
+
+    def time_dimension_values_flat(self, shape, datatype):
+        self.dataset.dimension_values('z')
+
+
+class MultiInterface(object):
+    """
+    Benchmarks the multi-path interface with a list of paths each
+    declaring a scalar category.
+    """
+
+    params = ([10, 1000], ['dictionary', 'dataframe'])
+
+    param_names = ['npaths', 'subtype']
+
+    def setup(self, npaths, subtype):
+        data = paths(npaths, 100)
+        if subtype == 'dataframe':
+            try:
+                import pandas as pd
+            except ImportError:
+                raise NotImplementedError('dataframe interface not available')
+            data = [pd.DataFrame(d) for d in data]
+        self.data = data
+        self.path = Path(self.data, vdims=['z', 'cat'])
+
+    def time_construct(self, npaths, subtype):
+        Path(self.data, vdims=['z', 'cat'])
+
+    def time_select(self, npaths, subtype):
+        self.path.select(cat=[1, 3, 5]).data
+
+    def time_groupby(self, npaths, subtype):
+        self.path.groupby('cat')
+
+    def time_split(self, npaths, subtype):
+        self.path.split()
+
+
+class MethodOverhead(object):
+    """
+    Benchmarks the fixed overhead of chaining Dataset methods on small
+    data, with and without pipeline tracking.
+    """
+
+    params = ([True, False],)
+
+    param_names = ['track_pipelines']
+
+    def setup(self, track_pipelines):
+        from holoviews.core.util import config
+        self.config = config
+        self.track_pipelines = config.track_pipelines
+        config.track_pipelines = track_pipelines
+        self.dataset = Dataset(columns(100), ['x', 'y', 'cat'], 'z',
+                               datatype=['dictionary'])
+
+    def teardown(self, track_pipelines):
+        self.config.track_pipelines = self.track_pipelines
+
+    def time_select(self, track_pipelines):
+        self.dataset.select(x=(0.1, 0.9))
+
+    def time_chained_select(self, track_pipelines):
+        ds = self.dataset
+        for i in range(10):
+            ds = ds.select(x=(0, 1-i/20.))
+
+    def time_iloc(self, track_pipelines):
+        self.dataset.iloc[:50]
+
+    def time_sort(self, track_pipelines):
+        self.dataset.sort('x')
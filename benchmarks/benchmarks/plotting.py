@@ -0,0 +1,139 @@
+"""
+Benchmarks of the plotting hot paths, including range computation
+and updating bokeh plots.
+"""
+
+import numpy as np
+
+from holoviews.core import DynamicMap, HoloMap, NdOverlay, Store
+from holoviews.element import Curve, Image, Scatter
+from holoviews.streams import Stream
+
+from .synthetic import columns, grid
+
+
+def bokeh_renderer():
+    """
+    Returns the bokeh renderer, skipping the benchmark if bokeh is
+    not available.
+    """
+    try:
+        import holoviews.plotting.bokeh # noqa (Loads the bokeh backend)
+    except ImportError:
+        raise NotImplementedError('bokeh backend not available')
+    return Store.renderers['bokeh']
+
+
+def curve_holomap(nframes, ncurves, size):
+    """
+    Generates a HoloMap of NdOverlays of Curves.
+    """
+    return HoloMap({
+        i: NdOverlay({j: Curve(columns(size, seed=i*ncurves+j), 'x', 'y')
+                      for j in range(ncurves)})
+        for i in range(nframes)})
+
+
+class ComputeRanges(object):
+    """
+    Benchmarks computing the ranges of a HoloMap of overlays.
+    """
+
+    params = ([1, 10, 100], [1000, 100000])
+
+    param_names = ['nframes', 'size']
+
+    def setup(self, nframes, size):
+        renderer = bokeh_renderer()
+        self.hmap = curve_holomap(nframes, 5, size)
+        self.plot = renderer.get_plot(self.hmap)
+
+    def time_compute_ranges_mapwise(self, nframes, size):
+        self.plot.compute_ranges(self.hmap, None, None)
+
+    def time_compute_ranges_framewise(self, nframes, size):
+        key = self.hmap.keys()[0]
+        self.plot.compute_ranges(self.hmap, (key,), {})
+
+    def time_get_plot(self, nframes, size):
+        bokeh_renderer().get_plot(self.hmap)
+
+
+class BokehUpdateFrame(object):
+    """
+    Benchmarks updating bokeh plots with new frames.
+    """
+
+    params = ([1000, 100000],)
+
+    param_names = ['size']
+
+    def setup(self, size):
+        renderer = bokeh_renderer()
+        self.scatter = renderer.get_plot(HoloMap({
+            i: Scatter(columns(size, seed=i), 'x', ['y', 'z'])
+            for i in range(2)}))
+        self.curve = renderer.get_plot(curve_holomap(2, 5, size))
+        n = int(np.sqrt(size))
+        self.image = renderer.get_plot(HoloMap({
+            i: Image(grid((n, n), seed=i), ['x', 'y'], 'z')
+            for i in range(2)}))
+        self.frame = 0
+
+    def _next_key(self):
+        self.frame = (self.frame + 1) % 2
+        return (self.frame,)
+
+    def time_update_scatter(self, size):
+        self.scatter.update(self._next_key())
+
+    def time_update_overlay(self, size):
+        self.curve.update(self._next_key())
+
+    def time_update_image(self, size):
+        self.image.update(self._next_key())
+
+
+class BokehDynamicUpdate(object):
+    """
+    Benchmarks updating a bokeh plot of a DynamicMap in response to
+    a stream event.
+    """
+
+    params = ([1000, 100000],)
+
+    param_names = ['size']
+
+    def setup(self, size):
+        renderer = bokeh_renderer()
+        self.stream = Stream.define('Seed', seed=0)()
+        dmap = DynamicMap(lambda seed: Scatter(columns(size, seed=seed), 'x', 'y'),
+                          streams=[self.stream])
+        self.plot = renderer.get_plot(dmap)
+        self.seed = 0
+
+    def time_stream_event_update(self, size):
+        self.seed = (self.seed + 1) % 10
+        self.stream.event(seed=self.seed)
+
+
+class HexBinning(object):
+    """
+    Benchmarks the hexagonal binning applied when plotting HexTiles
+    with the bokeh backend.
+    """
+
+    params = ([100000, 1000000], ['size', 'sum', 'mean', 'median'])
+
+    param_names = ['size', 'aggregator']
+
+    def setup(self, size, aggregator):
+        bokeh_renderer()
+        from holoviews.element import HexTiles
+        from holoviews.plotting.bokeh.hex_tiles import hex_binning
+        self.hex_binning = hex_binning
+        self.tiles = HexTiles(columns(size), ['x', 'y'], 'z')
+        self.aggregator = getattr(np, aggregator)
+
+    def time_hex_binning(self, size, aggregator):
+        self.hex_binning(self.tiles, gridsize=50, aggregator=self.aggregator)
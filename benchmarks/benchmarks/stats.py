@@ -0,0 +1,58 @@
+"""
+Benchmarks of the statistical operations.
+"""
+
+from holoviews.element import Bivariate, Distribution
+from holoviews.operation.stats import bivariate_kde, univariate_kde
+
+from .synthetic import columns
+
+
+class KDE(object):
+    """
+    Benchmarks the exact and binned kernel density estimates of
+    univariate and bivariate distributions.
+    """
+
+    params = ([10000, 100000], ['exact', 'binned'])
+
+    param_names = ['size', 'method']
+
+    def setup(self, size, method):
+        if method == 'exact':
+            try:
+                import scipy # noqa
+            except ImportError:
+                raise NotImplementedError('scipy not available')
+        data = columns(size)
+        self.distribution = Distribution(data, 'z')
+        self.bivariate = Bivariate(data, ['x', 'z'])
+
+    def time_univariate_kde(self, size, method):
+        univariate_kde(self.distribution, method=method, n_samples=512)
+
+    def time_bivariate_kde(self, size, method):
+        bivariate_kde(self.bivariate, method=method, n_samples=100,
+                      contours=False)
+
+
+class Histogram(object):
+    """
+    Benchmarks computing histograms of one and multiple dimensions.
+    """
+
+    params = ([100000, 10000000],)
+
+    param_names = ['size']
+
+    def setup(self, size):
+        from holoviews.element import Dataset
+        from holoviews.operation import histogram
+        self.histogram = histogram
+        self.dataset = Dataset(columns(size), ['x', 'y'], ['z'])
+
+    def time_histogram(self, size):
+        self.histogram(self.dataset, dimension='z', num_bins=50)
+
+    def time_histogram_dimensions(self, size):
+        self.histogram(self.dataset, dimensions=['x', 'y', 'z'], num_bins=50)
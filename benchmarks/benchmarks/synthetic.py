@@ -0,0 +1,64 @@
+"""
+Generators of synthetic data used by the benchmarks, ensuring the
+benchmarks can be run without access to any external datasets.
+"""
+
+import numpy as np
+
+
+def columns(size, ncategories=10, seed=1):
+    """
+    Generates a dictionary of columns containing uniformly distributed
+    'x' and 'y' coordinates, a 'z' value and a 'cat' column of
+    integer categories.
+    """
+    rng = np.random.RandomState(seed)
+    return {
+        'x': rng.uniform(0, 1, size),
+        'y': rng.uniform(0, 1, size),
+        'z': rng.normal(0, 1, size),
+        'cat': rng.randint(0, ncategories, size)
+    }
+
+
+def grid(shape, seed=1):
+    """
+    Generates a dictionary of gridded data containing 'x' and 'y'
+    coordinates and a 2D 'z' array of the supplied (ny, nx) shape.
+    """
+    rng = np.random.RandomState(seed)
+    ny, nx = shape
+    return {
+        'x': np.linspace(0, 1, nx),
+        'y': np.linspace(0, 1, ny),
+        'z': rng.normal(0, 1, shape)
+    }
+
+
+def paths(npaths, length, seed=1):
+    """
+    Generates a list of dictionaries each defining a random walk
+    with 'x' and 'y' coordinates, a 'z' value and a scalar 'cat'
+    value.
+    """
+    rng = np.random.RandomState(seed)
+    return [{'x': np.arange(length),
+             'y': rng.normal(0, 1, length).cumsum(),
+             'z': rng.normal(0, 1, length),
+             'cat': i % 10} for i in range(npaths)]
+
+
+def flows(ncolumns, nodes_per_column, nlinks, seed=1):
+    """
+    Generates a dictionary of 'source', 'target' and 'value' columns
+    defining an acyclic flow between nodes arranged in ncolumns
+    columns, with each link pointing to a node in a later column.
+    """
+    rng = np.random.RandomState(seed)
+    column = rng.randint(0, ncolumns-1, nlinks)
+    offset = rng.randint(1, ncolumns-column)
+    return {
+        'source': column*nodes_per_column + rng.randint(0, nodes_per_column, nlinks),
+        'target': (column+offset)*nodes_per_column + rng.randint(0, nodes_per_column, nlinks),
+        'value': rng.uniform(1, 10, nlinks)
+    }
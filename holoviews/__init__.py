@@ -1,6 +1,6 @@
 
 from __future__ import print_function, absolute_import
-import os, io
+import os, io, sys
 
 import numpy as np # noqa (API import)
 import param
@@ -9,7 +9,6 @@ __version__ = str(param.version.Version(fpath=__file__, archive_commit="$Format:
                                         reponame="holoviews"))
 
 from . import util                                       # noqa (API import)
-from .annotators import annotate                         # noqa (API import)
 from .core import archive, config                        # noqa (API import)
 from .core.boundingregion import BoundingBox             # noqa (API import)
 from .core.dimension import OrderedDict, Dimension       # noqa (API import)
@@ -46,6 +45,18 @@ except ImportError:
         def __call__(self, *args, **opts): # noqa (dummy signature)
             raise Exception("IPython notebook not available: use hv.extension instead.")
 
+# The annotators import panel, so where module level __getattr__ is
+# supported they are only loaded on first access.
+if sys.version_info < (3, 7):
+    from .annotators import annotate                     # noqa (API import)
+
+def __getattr__(name):
+    if name != 'annotate':
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    from .annotators import annotate as value
+    globals()[name] = value
+    return value
+
 # A single holoviews.rc file may be executed if found.
 for rcfile in [os.environ.get("HOLOVIEWSRC", ''),
                os.path.abspath(os.path.join(os.path.split(__file__)[0],
@@ -90,4 +101,4 @@ def help(obj, visualization=True, ansi=True, backend=None,
         pydoc.help(obj)
 
 
-del absolute_import, io, np, os, print_function, rcfile, warnings
+del absolute_import, io, np, os, print_function, rcfile, sys, warnings
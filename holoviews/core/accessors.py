@@ -7,6 +7,7 @@ import copy
 import sys
 
 from collections import OrderedDict
+from functools import partial
 from types import FunctionType
 
 import param
@@ -32,11 +33,12 @@ class AccessorPipelineMeta(type):
             from .data import Dataset, MultiDimensionalMapping
             inst = args[0]
 
-            if not hasattr(inst._obj, '_pipeline'):
+            if not hasattr(inst._obj, '_pipeline') or not util.config.track_pipelines:
                 # Wrapped object doesn't support the pipeline property
+                # or pipelines are disabled
                 return __call__(*args, **kwargs)
 
-            inst_pipeline = copy.copy(inst._obj. _pipeline)
+            inst_pipeline = copy.copy(inst._obj.pipeline)
             in_method = inst._obj._in_method
             if not in_method:
                 inst._obj._in_method = True
@@ -87,6 +89,11 @@ class AccessorPipelineMeta(type):
         return pipelined_call
 
 
+def _apply_child(child, apply_function, **kwargs):
+    "Applies a function to a child of a container."
+    return child.apply(apply_function, **kwargs)
+
+
 @add_metaclass(AccessorPipelineMeta)
 class Apply(object):
     """
@@ -98,7 +105,7 @@ class Apply(object):
         self._obj = obj
 
     def __call__(self, apply_function, streams=[], link_inputs=True, dynamic=None,
-                 per_element=False, **kwargs):
+                 per_element=False, executor=None, max_workers=None, **kwargs):
         """Applies a function to all (Nd)Overlay or Element objects.
 
         Any keyword arguments are passed through to the function. If
@@ -127,6 +134,14 @@ class Apply(object):
                 By default apply works on the leaf nodes, which
                 includes both elements and overlays. If set it will
                 apply directly to elements.
+            executor (optional): How to process the children
+                By default the children of a container, e.g. the
+                frames of a HoloMap, are processed sequentially,
+                'threads' or 'processes' process them in parallel on a
+                pool of the corresponding type and a
+                concurrent.futures.Executor may also be supplied.
+            max_workers (int, optional): Maximum number of workers
+                Size of the pool if the executor is a string.
             kwargs (dict, optional): Additional keyword arguments
                 Keyword arguments which will be supplied to the
                 function.
@@ -150,7 +165,8 @@ class Apply(object):
             if not len(samples):
                 return self._obj[samples]
             return HoloMap(self._obj[samples]).apply(
-                apply_function, streams, link_inputs, dynamic, **kwargs)
+                apply_function, streams, link_inputs, dynamic,
+                executor=executor, max_workers=max_workers, **kwargs)
 
         if isinstance(apply_function, util.basestring):
             args = kwargs.pop('_method_args', ())
@@ -197,12 +213,14 @@ class Apply(object):
                 inner_kwargs['dynamic'] = False
             return apply_function(self._obj, **inner_kwargs)
         elif self._obj._deep_indexable:
-            mapped = []
-            for k, v in self._obj.data.items():
-                new_val = v.apply(apply_function, dynamic=dynamic, streams=streams,
+            items = list(self._obj.data.items())
+            apply_child = partial(_apply_child, apply_function=apply_function,
+                                  dynamic=dynamic, streams=streams,
                                   link_inputs=link_inputs, **kwargs)
-                if new_val is not None:
-                    mapped.append((k, new_val))
+            values = util.parallel_map(apply_child, [v for _, v in items],
+                                       executor=executor, max_workers=max_workers)
+            mapped = [(k, new_val) for (k, _), new_val in zip(items, values)
+                      if new_val is not None]
             return self._obj.clone(mapped, link=link_inputs)
 
     def aggregate(self, dimensions=None, function=None, spreadfn=None, **kwargs):
@@ -5,8 +5,17 @@ try:
 except ImportError:
     pass
 
+import sys
 import types
 import copy
+import importlib
+
+try:
+    from importlib.util import find_spec
+except ImportError: # Python 2
+    from pkgutil import find_loader as find_spec
+
+from contextlib import contextmanager
 
 import numpy as np
 import param
@@ -44,29 +53,55 @@ except Exception as e:
     param.main.param.warning('Pandas interface failed to import with '
                              'following error: %s' % e)
 
-try:
-    from .spatialpandas import SpatialPandasInterface # noqa (API import)
-    datatypes.append('spatialpandas')
-except ImportError:
-    pass
+# Interfaces wrapping optional libraries are only imported once their
+# datatype is requested or the library they wrap has been imported
+_deferred_interfaces = [
+    ('spatialpandas', 'SpatialPandasInterface', 'spatialpandas'),
+    ('xarray', 'XArrayInterface', 'xarray'),
+    ('cuDF', 'cuDFInterface', 'cudf'),
+    ('dask', 'DaskInterface', 'dask.dataframe')
+]
 
-try:
-    from .xarray import XArrayInterface # noqa (Conditional API import)
-    datatypes.append('xarray')
-except ImportError:
-    pass
-
-try:
-    from .cudf import cuDFInterface   # noqa (Conditional API import)
-    datatypes.append('cuDF')
-except ImportError:
-    pass
+def _importable(library):
+    """
+    Whether the library can be imported, without importing it.
+    """
+    try:
+        return find_spec(library) is not None
+    except ImportError:
+        return False
 
-try:
-    from .dask import DaskInterface   # noqa (Conditional API import)
-    datatypes.append('dask')
-except ImportError:
-    pass
+def _import_interface(interface, library):
+    """
+    Imports the module defining the interface wrapping the library
+    and returns the interface class.
+    """
+    module = '.'.join([__name__, library.split('.')[0]])
+    return getattr(importlib.import_module(module), interface)
+
+for _datatype, _interface, _library in _deferred_interfaces:
+    if _importable(_library):
+        _module = '.'.join([__name__, _library.split('.')[0]])
+        Interface.register_deferred(_datatype, _module, _library)
+        datatypes.append(_datatype)
+    if sys.version_info < (3, 7):
+        # Without module __getattr__ the API imports have to be eager
+        try:
+            globals()[_interface] = _import_interface(_interface, _library)
+        except ImportError:
+            pass
+
+def __getattr__(name):
+    """
+    Resolves the deferred interface classes on attribute access.
+    """
+    for _, interface, library in _deferred_interfaces:
+        if name == interface:
+            try:
+                return _import_interface(interface, library)
+            except ImportError:
+                break
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 if 'array' not in datatypes:
     datatypes.append('array')
@@ -185,6 +220,80 @@ class DataConversion(object):
             return group
 
 
+@contextmanager
+def disable_pipeline():
+    """
+    Context manager which disables the recording of pipelines on
+    Datasets, see the track_pipelines option on hv.config.
+    """
+    track_pipelines = util.config.track_pipelines
+    util.config.track_pipelines = False
+    try:
+        yield
+    finally:
+        util.config.track_pipelines = track_pipelines
+
+
+# Dataset methods which give the same result when applied repeatedly
+# with the same arguments
+_idempotent_methods = ['select', 'sort']
+
+
+def _equivalent(obj1, obj2):
+    try:
+        return bool(obj1 == obj2)
+    except Exception:
+        return False
+
+
+def _explicit_kwargs(op):
+    """
+    Returns the keyword arguments of a factory operation which differ
+    from the defaults of the parameters on the output type.
+    """
+    params = op.output_type.param.objects(False)
+    return {k: v for k, v in op.kwargs.items()
+            if k not in params or not _equivalent(params[k].default, v)}
+
+
+def _compact_operations(operations, op):
+    """
+    Appends an operation to a list of pipeline operations, compacting
+    it with the last operation if the two are equivalent to a single
+    operation, i.e. if the operation repeats an identical factory or
+    idempotent method call or if it is a select on dimensions
+    disjoint from those of a preceding select.
+    """
+    from ...operation.element import factory, method
+    if not operations or type(operations[-1]) is not type(op):
+        return operations + [op]
+
+    prev = operations[-1]
+    if type(op) is factory:
+        if (prev.output_type is op.output_type and
+            isinstance(op.output_type, ParameterizedMetaclass) and
+            _equivalent(prev.args, op.args) and
+            _equivalent(_explicit_kwargs(prev), _explicit_kwargs(op))):
+            return operations
+    elif type(op) is method:
+        if (prev.input_type is not op.input_type or
+            prev.method_name != op.method_name or
+            op.method_name not in _idempotent_methods):
+            return operations + [op]
+        elif _equivalent(prev.args, op.args) and _equivalent(prev.kwargs, op.kwargs):
+            return operations
+        elif (op.method_name == 'select' and not (prev.args or op.args) and
+              not any(k in kws for k in ('selection_expr', 'selection_specs')
+                      for kws in (prev.kwargs, op.kwargs)) and
+              not set(prev.kwargs) & set(op.kwargs)):
+            merged = method.instance(
+                input_type=op.input_type, output_type=op.output_type,
+                method_name='select', args=[], kwargs=dict(prev.kwargs, **op.kwargs)
+            )
+            return operations[:-1] + [merged]
+    return operations + [op]
+
+
 class PipelineMeta(ParameterizedMetaclass):
 
     # Public methods that should not be wrapped
@@ -205,6 +314,9 @@ class PipelineMeta(ParameterizedMetaclass):
     @staticmethod
     def pipelined(method_fn, method_name):
         def pipelined_fn(*args, **kwargs):
+            if not util.config.track_pipelines:
+                return method_fn(*args, **kwargs)
+
             from ...operation.element import method as method_op
             inst = args[0]
             inst_pipeline = copy.copy(getattr(inst, '_pipeline', None))
@@ -223,9 +335,11 @@ class PipelineMeta(ParameterizedMetaclass):
                 )
 
                 if not in_method:
+                    if inst_pipeline is None:
+                        inst_pipeline = inst.pipeline
                     if isinstance(result, Dataset):
                         result._pipeline = inst_pipeline.instance(
-                            operations=inst_pipeline.operations + [op],
+                            operations=_compact_operations(inst_pipeline.operations, op),
                             output_type=type(result),
                         )
 
@@ -354,26 +468,36 @@ class Dataset(Element):
         self.interface.validate(self, validate_vdims)
 
         # Handle _pipeline property
-        if input_pipeline is None:
-            input_pipeline = chain_op.instance()
+        track_pipelines = util.config.track_pipelines
+        if not track_pipelines:
+            self._pipeline = None
+        else:
+            if input_pipeline is None:
+                input_pipeline = chain_op.instance()
 
-        init_op = factory.instance(
-            output_type=type(self),
-            args=[],
-            kwargs=dict(kwargs, kdims=self.kdims, vdims=self.vdims),
-        )
-        self._pipeline = input_pipeline.instance(
-            operations=input_pipeline.operations + [init_op],
-            output_type=type(self),
-        )
+            init_op = factory.instance(
+                output_type=type(self),
+                args=[],
+                kwargs=dict(kwargs, kdims=self.kdims, vdims=self.vdims),
+            )
+            self._pipeline = input_pipeline.instance(
+                operations=_compact_operations(input_pipeline.operations, init_op),
+                output_type=type(self),
+            )
         self._transforms = input_transforms or []
 
+        # Share cached ranges with Datasets wrapping the same data
+        self._range_cache = None
+        if (isinstance(input_data, Dataset) and input_data.data is self.data and
+            self.interface is input_data.interface and self.interface.shared_ranges):
+            self._range_cache = input_data._get_range_cache()
+
         # Handle initializing the dataset property.
         self._dataset = input_dataset
         if self._dataset is None and isinstance(input_data, Dataset) and not dataset_provided:
             if input_data.data is self.data:
                 self._dataset = {'kdims': input_data.kdims, 'vdims': input_data.vdims}
-            else:
+            elif track_pipelines:
                 self._dataset = Dataset(input_data, dataset=None, pipeline=None,
                                         transforms=None, _validate_vdims=False)
                 if hasattr(self, '_binned'):
@@ -409,6 +533,14 @@ class Dataset(Element):
         used to create this object, starting with the Dataset stored in
         dataset property
         """
+        if getattr(self, '_pipeline', None) is None:
+            # Pipeline was not tracked, start a new one from this object
+            from ...operation.element import chain, factory
+            init_op = factory.instance(
+                output_type=type(self), args=[],
+                kwargs={'kdims': self.kdims, 'vdims': self.vdims}
+            )
+            return chain.instance(operations=[init_op], output_type=type(self))
         return self._pipeline
 
     def closest(self, coords=[], **kwargs):
@@ -481,7 +613,11 @@ class Dataset(Element):
         elif all(util.isfinite(v) for v in dim.range) and dimension_range:
             return dim.range
         elif dim in self.dimensions() and data_range and bool(self):
-            lower, upper = self.interface.range(self, dim)
+            cache = self._get_range_cache()[1]
+            key = ('range', dim.name, self.get_dimension_index(dim), self._binned)
+            if key not in cache:
+                cache[key] = self.interface.range(self, dim)
+            lower, upper = cache[key]
         else:
             lower, upper = (np.NaN, np.NaN)
         if not dimension_range:
@@ -489,6 +625,43 @@ class Dataset(Element):
         return util.dimension_range(lower, upper, dim.range, dim.soft_range)
 
 
+    def _get_range_cache(self):
+        """
+        Returns the cache of the data ranges and factors computed on
+        this Dataset as a tuple of the data and a dictionary of cached
+        values, discarding the cached values if the data was replaced.
+        Values are keyed by dimension name and index since unnamed
+        interfaces look up dimensions by position, ranges additionally
+        depend on whether the Dataset is binned.
+
+        Since the cache is keyed on the identity of the data, modifying
+        the data in place leaves stale values in the cache. Code that
+        mutates the data should reset ``_range_cache`` to None.
+        """
+        cache = getattr(self, '_range_cache', None)
+        if cache is None or cache[0] is not self.data:
+            cache = (self.data, {})
+            self._range_cache = cache
+        return cache
+
+
+    def _factors(self, dim):
+        """
+        Returns the (cached) unique values along the supplied
+        dimension, used to compute categorical ranges.
+        """
+        dim = self.get_dimension(dim, strict=True)
+        cache = self._get_range_cache()[1]
+        key = ('factors', dim.name, self.get_dimension_index(dim))
+        if key not in cache:
+            values = self.dimension_values(dim, expanded=False)
+            if (isinstance(values, np.ndarray) and values.dtype.kind == 'O' and
+                all(isinstance(v, (np.ndarray)) for v in values)):
+                values = np.concatenate(values)
+            cache[key] = util.unique_array(values)
+        return cache[key]
+
+
     def add_dimension(self, dimension, dim_pos, dim_val, vdim=False, **kwargs):
         """Adds a dimension and its values to the Dataset
 
@@ -103,6 +103,10 @@ class ArrayInterface(Interface):
     def dtype(cls, dataset, dimension):
         return dataset.data.dtype
 
+    @classmethod
+    def nbytes(cls, dataset):
+        return dataset.data.nbytes
+
 
     @classmethod
     def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
@@ -162,15 +166,10 @@ class ArrayInterface(Interface):
                  if kdim not in dimensions]
         vdims = dataset.vdims
 
-        # Find unique entries along supplied dimensions
-        # by creating a view that treats the selected
-        # groupby keys as a single object.
-        indices = data[:, dim_idxs].copy()
-        group_shape = indices.dtype.itemsize * indices.shape[1]
-        view = indices.view(np.dtype((np.void, group_shape)))
-        _, idx = np.unique(view, return_index=True)
-        idx.sort()
-        unique_indices = indices[idx]
+        # Factorize the keys along the supplied dimensions and sort
+        # the rows by group so each group is a contiguous slice
+        uniques, order, offsets = util.factorize_groups(
+            [data[:, d_idx] for d_idx in dim_idxs])
 
         # Get group
         group_kwargs = {}
@@ -179,15 +178,14 @@ class ArrayInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Iterate over the unique entries building masks
-        # to apply the group selection
+        # Iterate over the contiguous groups
         grouped_data = []
         col_idxs = [dataset.get_dimension_index(d) for d in dataset.dimensions()
                     if d not in dimensions]
-        for group in unique_indices:
-            mask = np.logical_and.reduce([data[:, d_idx] == group[i]
-                                          for i, d_idx in enumerate(dim_idxs)])
-            group_data = data[mask][:, col_idxs]
+        sorted_data = data[order][:, col_idxs]
+        for i, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+            group = [u[i] for u in uniques]
+            group_data = sorted_data[start:end]
             if not group_type == 'raw':
                 if issubclass(group_type, dict):
                     group_data = {d.name: group_data[:, i] for i, d in
@@ -254,6 +252,22 @@ class ArrayInterface(Interface):
     @classmethod
     def aggregate(cls, dataset, dimensions, function, **kwargs):
         reindexed = dataset.reindex(dimensions)
+        if len(dimensions) and not kwargs and len(reindexed.data):
+            # Reduce contiguous groups directly if the function supports it
+            data = reindexed.data
+            dim_idxs = [reindexed.get_dimension_index(d) for d in dimensions]
+            uniques, order, offsets = util.factorize_groups(
+                [data[:, d_idx] for d_idx in dim_idxs])
+            sorted_data = data[order]
+            reduced = []
+            for col in range(len(dimensions), data.shape[1]):
+                values = util.reduce_groups(sorted_data[:, col], offsets, function)
+                if values is None:
+                    break
+                reduced.append(values)
+            else:
+                return np.column_stack(uniques+reduced), []
+
         grouped = (cls.groupby(reindexed, dimensions, list, 'raw')
                    if len(dimensions) else [((), reindexed.data)])
 
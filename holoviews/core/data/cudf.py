@@ -214,13 +214,9 @@ class cuDFInterface(PandasInterface):
                 for imask in new_masks[1:]:
                     new_mask &= imask
             elif isinstance(sel, (set, list)):
-                for v in sel:
-                    new_masks.append(arr==v)
-                if not new_masks:
+                if not sel:
                     continue
-                new_mask = new_masks[0]
-                for imask in new_masks[1:]:
-                    new_mask |= imask
+                new_mask = arr.isin(list(sel))
             elif callable(sel):
                 new_mask = sel(arr)
             else:
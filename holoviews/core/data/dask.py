@@ -74,6 +74,11 @@ class DaskInterface(PandasInterface):
     def shape(cls, dataset):
         return (len(dataset.data), len(dataset.data.columns))
 
+    @classmethod
+    def nbytes(cls, dataset):
+        # Lazily evaluated partitions do not occupy memory
+        return 0
+
     @classmethod
     def range(cls, dataset, dimension):
         import dask.dataframe as dd
@@ -124,14 +129,7 @@ class DaskInterface(PandasInterface):
                     kval = util.numpy_scalar_to_python(k.stop)
                     masks.append(series < kval)
             elif isinstance(k, (set, list)):
-                iter_slc = None
-                for ik in k:
-                    mask = series == ik
-                    if iter_slc is None:
-                        iter_slc = mask
-                    else:
-                        iter_slc |= mask
-                masks.append(iter_slc)
+                masks.append(series.isin(list(k)))
             elif callable(k):
                 masks.append(k(series))
             else:
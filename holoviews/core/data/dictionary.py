@@ -180,6 +180,10 @@ class DictInterface(Interface):
                    if d in dataset.dimensions() and not isscalar(vals)]
         return max(lengths) if lengths else 1
 
+    @classmethod
+    def nbytes(cls, dataset):
+        return sum(getattr(vals, 'nbytes', 0) for vals in dataset.data.values())
+
     @classmethod
     def array(cls, dataset, dimensions):
         if not dimensions:
@@ -284,6 +288,19 @@ class DictInterface(Interface):
                             for d in dimensions])
 
 
+    @classmethod
+    def _group_rows(cls, dataset, dimensions):
+        """
+        Returns the unique values of the supplied dimensions, the
+        order of the rows sorted by group and the offsets of each
+        group, see util.factorize_groups.
+        """
+        if dimensions:
+            columns = [dataset.data[d.name] for d in dimensions]
+            return util.factorize_groups(columns)
+        offsets = [0, len(dataset)] if len(dataset) else [0]
+        return [], np.arange(len(dataset)), np.array(offsets)
+
     @classmethod
     def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
         # Get dimensions information
@@ -299,18 +316,21 @@ class DictInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Find all the keys along supplied dimensions
-        keys = (tuple(dataset.data[d.name] if isscalar(dataset.data[d.name])
-                      else dataset.data[d.name][i] for d in dimensions)
-                for i in range(len(dataset)))
+        # Factorize the keys along the supplied dimensions and sort
+        # the columns by group so each group is a contiguous slice
+        data = dataset.data
+        key_dims = [d for d in dimensions if not isscalar(data[d.name])]
+        uniques, order, offsets = cls._group_rows(dataset, key_dims)
+        columns = OrderedDict((d.name, data[d.name] if isscalar(data[d.name])
+                               else data[d.name][order]) for d in kdims+vdims)
 
-        # Iterate over the unique entries applying selection masks
         grouped_data = []
-        for unique_key in util.unique_iterator(keys):
-            mask = cls.select_mask(dataset, dict(zip(dimensions, unique_key)))
-            group_data = OrderedDict(((d.name, dataset.data[d.name] if isscalar(dataset.data[d.name])
-                                       else dataset.data[d.name][mask])
-                                      for d in kdims+vdims))
+        for i, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+            key_values = dict(zip(key_dims, (u[i] for u in uniques)))
+            unique_key = tuple(key_values[d] if d in key_values else data[d.name]
+                               for d in dimensions)
+            group_data = OrderedDict((k, v if isscalar(v) else v[start:end])
+                                     for k, v in columns.items())
             group_data = group_type(group_data, **group_kwargs)
             grouped_data.append((unique_key, group_data))
 
@@ -357,10 +377,44 @@ class DictInterface(Interface):
                 for k, col in dataset.data.items()}
 
 
+    @classmethod
+    def _aggregate_groups(cls, dataset, kdims, vdims, function):
+        """
+        Aggregates the value dimensions over the groups of the key
+        dimensions with util.reduce_groups, returning None if the
+        function or the value types are not supported.
+        """
+        data = dataset.data
+        if any(isscalar(data[vd]) for vd in vdims):
+            return None
+        key_dims = [dataset.get_dimension(kd) for kd in kdims]
+        key_dims = [kd for kd in key_dims if not isscalar(data[kd.name])]
+        uniques, order, offsets = cls._group_rows(dataset, key_dims)
+        if len(offsets) < 2:
+            return None
+        reduced = []
+        for vd in vdims:
+            values = util.reduce_groups(data[vd][order], offsets, function)
+            if values is None:
+                return None
+            reduced.append(values)
+        ngroups = len(offsets)-1
+        key_values = dict(zip([kd.name for kd in key_dims], uniques))
+        aggregated = OrderedDict(
+            (kd, key_values[kd] if kd in key_values else np.full(ngroups, data[kd]))
+            for kd in kdims)
+        aggregated.update(zip(vdims, reduced))
+        return aggregated
+
     @classmethod
     def aggregate(cls, dataset, kdims, function, **kwargs):
         kdims = [dataset.get_dimension(d, strict=True).name for d in kdims]
         vdims = dataset.dimensions('value', label='name')
+        if not kwargs and not isinstance(function, np.ufunc):
+            aggregated = cls._aggregate_groups(dataset, kdims, vdims, function)
+            if aggregated is not None:
+                return aggregated, []
+
         groups = cls.groupby(dataset, kdims, list, OrderedDict)
         aggregated = OrderedDict([(k, []) for k in kdims+vdims])
 
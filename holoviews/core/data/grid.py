@@ -496,6 +496,19 @@ class GridInterface(DictInterface):
             return container_type(grouped_data)
 
 
+    @classmethod
+    def _is_monotonic(cls, values):
+        """
+        Whether a 1D coordinate array is sorted in ascending or
+        descending order, since the grid does not enforce sorting.
+        """
+        if len(values) < 2:
+            return True
+        diffs = np.diff(values)
+        if values.dtype.kind == 'M':
+            diffs = diffs.astype('int64')
+        return bool(np.all(diffs >= 0) or np.all(diffs <= 0))
+
     @classmethod
     def key_select_mask(cls, dataset, values, ind):
         if util.pd and values.dtype.kind == 'M':
@@ -504,6 +517,10 @@ class GridInterface(DictInterface):
             ind = slice(*ind)
         if isinstance(ind, get_array_types()):
             mask = ind
+        elif (isinstance(ind, slice) and values.ndim == 1 and
+              values.dtype.kind in 'iufM' and ind.step is None and
+              cls._is_monotonic(values)):
+            mask = util.sorted_range_mask(values, ind.start, ind.stop)
         elif isinstance(ind, slice):
             mask = True
             if ind.start is not None:
@@ -514,10 +531,7 @@ class GridInterface(DictInterface):
             if mask is True:
                 mask = np.ones(values.shape, dtype=np.bool)
         elif isinstance(ind, (set, list)):
-            iter_slcs = []
-            for ik in ind:
-                iter_slcs.append(values == ik)
-            mask = np.logical_or.reduce(iter_slcs)
+            mask = util.isin(values, ind)
         elif callable(ind):
             mask = ind(values)
         elif ind is None:
@@ -22,6 +22,9 @@ class ImageInterface(GridInterface):
 
     named = False
 
+    # Ranges along the key dimensions are derived from the bounds
+    shared_ranges = False
+
     @classmethod
     def init(cls, eltype, data, kdims, vdims):
         if kdims is None:
@@ -92,6 +95,10 @@ class ImageInterface(GridInterface):
     def length(cls, dataset):
         return np.product(dataset.data.shape[:2], dtype=np.intp)
 
+    @classmethod
+    def nbytes(cls, dataset):
+        return dataset.data.nbytes
+
 
     @classmethod
     def validate(cls, dataset, vdims=True):
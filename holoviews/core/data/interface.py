@@ -2,6 +2,7 @@ from __future__ import absolute_import
 
 import sys
 import warnings
+import importlib
 
 import six
 import param
@@ -20,6 +21,9 @@ def get_array_types():
     return array_types
 
 def dask_array_module():
+    # Arrays can only be dask arrays if dask.array was already imported
+    if 'dask.array' not in sys.modules:
+        return None
     try:
         import dask.array as da
         return da
@@ -33,6 +37,81 @@ def is_dask(array):
     return da and isinstance(array, da.Array)
 
 
+class InterfaceRegistry(dict):
+    """
+    Dictionary of Interface classes indexed by datatype, which also
+    supports deferred registration of interfaces. A deferred interface
+    is declared by its datatype, the module which defines and
+    registers it and the library it wraps. The module is only
+    imported once the datatype is looked up, avoiding the cost of
+    importing interfaces for libraries which are not in use.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(InterfaceRegistry, self).__init__(*args, **kwargs)
+        self._deferred = {}
+
+    def defer(self, datatype, module, library):
+        """
+        Declares an interface for the datatype, defined in the
+        supplied module, wrapping the named library.
+        """
+        if not dict.__contains__(self, datatype):
+            self._deferred[datatype] = (module, library)
+
+    def deferred(self, datatype):
+        """
+        Whether the datatype has not been loaded yet and the library
+        it wraps has not been imported, i.e. the interface cannot
+        apply to any existing data.
+        """
+        if datatype not in self._deferred:
+            return False
+        return self._deferred[datatype][1] not in sys.modules
+
+    def _resolve(self, datatype):
+        if datatype not in self._deferred:
+            return
+        module, _ = self._deferred.pop(datatype)
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+        except Exception as e:
+            param.main.param.warning(
+                '%s interface failed to import with following error: %s'
+                % (datatype, e))
+
+    def _resolve_loaded(self):
+        for datatype in list(self._deferred):
+            if not self.deferred(datatype):
+                self._resolve(datatype)
+
+    def __getitem__(self, datatype):
+        self._resolve(datatype)
+        return super(InterfaceRegistry, self).__getitem__(datatype)
+
+    def __contains__(self, datatype):
+        return (datatype in self._deferred or
+                super(InterfaceRegistry, self).__contains__(datatype))
+
+    def get(self, datatype, default=None):
+        self._resolve(datatype)
+        return super(InterfaceRegistry, self).get(datatype, default)
+
+    def keys(self):
+        self._resolve_loaded()
+        return super(InterfaceRegistry, self).keys()
+
+    def values(self):
+        self._resolve_loaded()
+        return super(InterfaceRegistry, self).values()
+
+    def items(self):
+        self._resolve_loaded()
+        return super(InterfaceRegistry, self).items()
+
+
 class DataError(ValueError):
     "DataError is raised when the data cannot be interpreted"
 
@@ -54,7 +133,8 @@ class Accessor(object):
             self.dataset._in_method = True
         try:
             res = self._perform_getitem(self.dataset, index)
-            if not in_method and isinstance(res, Dataset):
+            if (not in_method and isinstance(res, Dataset) and
+                util.config.track_pipelines):
                 getitem_op = method.instance(
                     input_type=type(self),
                     output_type=type(self.dataset),
@@ -146,7 +226,7 @@ class ndloc(Accessor):
 
 class Interface(param.Parameterized):
 
-    interfaces = {}
+    interfaces = InterfaceRegistry()
 
     datatype = None
 
@@ -161,6 +241,10 @@ class Interface(param.Parameterized):
     # Whether the interface stores the names of the underlying dimensions
     named = True
 
+    # Whether the ranges are determined by the data alone, allowing
+    # cached ranges to be shared between Datasets sharing the same data
+    shared_ranges = True
+
     @classmethod
     def loaded(cls):
         """
@@ -183,6 +267,15 @@ class Interface(param.Parameterized):
     def register(cls, interface):
         cls.interfaces[interface.datatype] = interface
 
+    @classmethod
+    def register_deferred(cls, datatype, module, library):
+        """
+        Declares an interface for the datatype which is only imported
+        from the supplied module once the datatype is requested or
+        the library it wraps has been imported.
+        """
+        cls.interfaces.defer(datatype, module, library)
+
     @classmethod
     def cast(cls, datasets, datatype=None, cast_type=None):
         """
@@ -258,9 +351,11 @@ class Interface(param.Parameterized):
         if datatype is None:
             datatype = eltype.datatype
 
-        # Set interface priority order
-        prioritized = [cls.interfaces[p] for p in datatype
-                       if p in cls.interfaces]
+        # Set interface priority order, skipping deferred interfaces
+        # which cannot apply unless they were explicitly requested
+        prioritized = [cls.interfaces.get(p) for p in datatype
+                       if len(datatype) == 1 or not cls.interfaces.deferred(p)]
+        prioritized = [intfc for intfc in prioritized if intfc is not None]
         head = [intfc for intfc in prioritized if intfc.applies(data)]
         if head:
             # Prioritize interfaces which have matching types
@@ -361,12 +456,7 @@ class Interface(param.Parameterized):
                     if sel.stop is not None:
                         mask &= arr < sel.stop
             elif isinstance(sel, (set, list)):
-                iter_slcs = []
-                for ik in sel:
-                    with warnings.catch_warnings():
-                        warnings.filterwarnings('ignore', r'invalid value encountered')
-                        iter_slcs.append(arr == ik)
-                mask &= np.logical_or.reduce(iter_slcs)
+                mask &= util.isin(arr, sel)
             elif callable(sel):
                 mask &= sel(arr)
             else:
@@ -475,6 +565,16 @@ class Interface(param.Parameterized):
     def length(cls, dataset):
         return len(dataset.data)
 
+    @classmethod
+    def nbytes(cls, dataset):
+        """
+        Returns an estimate of the number of bytes held in memory by
+        the data of the supplied Dataset. Lazily evaluated data is
+        not loaded to compute the estimate.
+        """
+        return sum(cls.values(dataset, d, expanded=False).nbytes
+                   for d in dataset.dimensions())
+
     @classmethod
     def nonzero(cls, dataset):
         return bool(cls.length(dataset))
@@ -330,6 +330,17 @@ class MultiInterface(Interface):
             length += ds.interface.length(ds)
         return length
 
+    @classmethod
+    def nbytes(cls, dataset):
+        if not dataset.data:
+            return 0
+        nbytes = 0
+        ds = cls._inner_dataset_template(dataset)
+        for d in dataset.data:
+            ds.data = d
+            nbytes += ds.interface.nbytes(ds)
+        return nbytes
+
     @classmethod
     def dtype(cls, dataset, dimension):
         if not dataset.data:
@@ -145,6 +145,11 @@ class PandasInterface(Interface):
         return len(dataset.data[name].unique()) == 1
 
 
+    @classmethod
+    def nbytes(cls, dataset):
+        return int(dataset.data.memory_usage(index=True).sum())
+
+
     @classmethod
     def validate(cls, dataset, vdims=True):
         dim_types = 'all' if vdims else 'key'
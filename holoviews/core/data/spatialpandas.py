@@ -8,7 +8,7 @@ from collections import defaultdict
 import numpy as np
 
 from ..dimension import dimension_name
-from ..util import isscalar, unique_iterator, pd, unique_array
+from ..util import isscalar, unique_iterator, pd, unique_array, isin
 from .interface import DataError, Interface
 from .multipath import MultiInterface, ensure_ring
 from .pandas import PandasInterface
@@ -177,12 +177,7 @@ class SpatialPandasInterface(MultiInterface):
                     if k.stop is not None:
                         mask &= arr < k.stop
             elif isinstance(k, (set, list)):
-                iter_slcs = []
-                for ik in k:
-                    with warnings.catch_warnings():
-                        warnings.filterwarnings('ignore', r'invalid value encountered')
-                        iter_slcs.append(arr == ik)
-                mask &= np.logical_or.reduce(iter_slcs)
+                mask &= isin(arr, k)
             elif callable(k):
                 mask &= k(arr)
             else:
@@ -288,6 +283,11 @@ class SpatialPandasInterface(MultiInterface):
                 length += (len(geom.buffer_values)//2)
         return length
 
+
+    @classmethod
+    def nbytes(cls, dataset):
+        return PandasInterface.nbytes(dataset)
+
     @classmethod
     def nonzero(cls, dataset):
         return bool(cls.length(dataset))
@@ -573,6 +573,15 @@ class XArrayInterface(GridInterface):
     def length(cls, dataset):
         return np.product([len(dataset.data[d.name]) for d in dataset.kdims], dtype=np.intp)
 
+    @classmethod
+    def nbytes(cls, dataset):
+        import xarray as xr
+        if isinstance(dataset.data, xr.DataArray):
+            variables = [dataset.data.variable]+list(dataset.data.coords.variables.values())
+        else:
+            variables = list(dataset.data.variables.values())
+        return sum(var.nbytes for var in variables if not util.is_dask_array(var.data))
+
     @classmethod
     def dframe(cls, dataset, dimensions):
         import xarray as xr
@@ -440,6 +440,12 @@ class Dimension(param.Parameterized):
         return title_format.format(name=bytes_to_unicode(self.label), val=value, unit=unit)
 
 
+def _map_child(child, map_fn, specs, clone):
+    "Maps a function over a child of a Dimensioned container."
+    return child.map(map_fn, specs, clone)
+
+
+
 class LabelledData(param.Parameterized):
     """
     LabelledData is a mix-in class designed to introduce the group and
@@ -669,7 +675,7 @@ class LabelledData(param.Parameterized):
         return accumulator
 
 
-    def map(self, map_fn, specs=None, clone=True):
+    def map(self, map_fn, specs=None, clone=True, executor=None, max_workers=None):
         """Map a function to all objects matching the specs
 
         Recursively replaces elements using a map function when the
@@ -685,6 +691,13 @@ class LabelledData(param.Parameterized):
                 to select objects to return, by default applies to all
                 objects.
             clone: Whether to clone the object or transform inplace
+            executor (optional): How to process the children
+                By default the children of the object are processed
+                sequentially, 'threads' or 'processes' process them
+                in parallel on a pool of the corresponding type and
+                a concurrent.futures.Executor may also be supplied.
+            max_workers (int, optional): Maximum number of workers
+                Size of the pool if the executor is a string.
 
         Returns:
             Returns the object after the map_fn has been applied
@@ -695,8 +708,11 @@ class LabelledData(param.Parameterized):
 
         if self._deep_indexable:
             deep_mapped = self.clone(shared_data=False) if clone else self
-            for k, v in self.items():
-                new_val = v.map(map_fn, specs, clone)
+            items = list(self.items())
+            mapped = util.parallel_map(
+                partial(_map_child, map_fn=map_fn, specs=specs, clone=clone),
+                [v for _, v in items], executor=executor, max_workers=max_workers)
+            for (k, _), new_val in zip(items, mapped):
                 if new_val is not None:
                     deep_mapped[k] = new_val
             if applies: deep_mapped = map_fn(deep_mapped)
@@ -4,7 +4,10 @@ map types. The former class only allows indexing whereas the latter
 also enables slicing over multiple dimension ranges.
 """
 
-from itertools import cycle
+import weakref
+
+from bisect import bisect_left, bisect_right
+from itertools import cycle, islice
 from operator import itemgetter
 import numpy as np
 
@@ -13,7 +16,7 @@ import param
 from . import util
 from .dimension import OrderedDict, Dimension, Dimensioned, ViewableElement, asdim
 from .util import (unique_iterator, sanitize_identifier, dimension_sort,
-                   basestring, wrap_tuple, process_ellipses, get_ndmapping_label)
+                   dimension_sort_key, basestring, wrap_tuple, process_ellipses, get_ndmapping_label)
 
 class item_check(object):
     """
@@ -170,14 +173,19 @@ class MultiDimensionalMapping(Dimensioned):
                                ' specified dimension values.' % (dim, repr(val)))
 
         # Updates nested data structures rather than simply overriding them.
-        if (update and (dim_vals in self.data)
-            and isinstance(self.data[dim_vals], (MultiDimensionalMapping, OrderedDict))):
+        prev_data = self.data
+        exists = dim_vals in self.data
+        if (update and exists and
+            isinstance(self.data[dim_vals], (MultiDimensionalMapping, OrderedDict))):
             self.data[dim_vals].update(data)
         else:
             self.data[dim_vals] = data
 
-        if sort:
-            self._resort()
+        # Overriding an existing key does not change the sort order
+        if sort and not exists:
+            self._insert_sorted(dim_vals)
+        if not exists:
+            self._index_key(dim_vals, prev_data)
 
 
     def _apply_key_type(self, keys):
@@ -247,6 +255,171 @@ class MultiDimensionalMapping(Dimensioned):
     def _resort(self):
         self.data = OrderedDict(dimension_sort(self.data, self.kdims, self.vdims,
                                                range(self.ndims)))
+        self._build_sort_index()
+
+
+    def _build_sort_index(self):
+        """
+        Records the sort keys of the (sorted) data, allowing new keys
+        to be inserted by bisection rather than sorting all the
+        data. No index is kept if the keys are not mutually comparable,
+        e.g. when mixing types, in which case insertion falls back to
+        a full sort.
+        """
+        sort_key = dimension_sort_key(self.kdims, self.vdims, range(self.ndims))
+        keys = [sort_key((k,)) for k in self.data]
+        try:
+            ordered = all(k1 <= k2 for k1, k2 in zip(keys[:-1], keys[1:]))
+        except TypeError:
+            ordered = False
+        self._sort_index = (self._data_ref(), keys) if ordered else None
+
+
+    def __getstate__(self):
+        "Drops the key indexes, which are rebuilt when required."
+        state = super(MultiDimensionalMapping, self).__getstate__()
+        state.pop('_sort_index', None)
+        state.pop('_key_index', None)
+        return state
+
+
+    def _data_ref(self):
+        """
+        Returns a weak reference to the data, which is used to check
+        whether the indexes are in sync with the data without keeping
+        replaced data alive.
+        """
+        try:
+            return weakref.ref(self.data)
+        except TypeError:
+            return lambda: None
+
+
+    def _get_sort_index(self, added=0):
+        """
+        Returns the recorded sort keys if they are in sync with the
+        data, allowing for the supplied number of newly added keys,
+        otherwise returns None.
+        """
+        index = getattr(self, '_sort_index', None)
+        if (index is None or index[0]() is not self.data or
+            len(index[1]) != len(self.data)-added):
+            return None
+        return index[1]
+
+
+    def _insert_sorted(self, key):
+        """
+        Moves a newly added key to its sorted position. Keys appended
+        in order are inserted in logarithmic time while other keys
+        only require moving the keys that sort after them. Falls back
+        to a full sort if the sort index is out of sync with the data,
+        e.g. because the data was modified or replaced directly.
+        """
+        keys = self._get_sort_index(added=1)
+        if keys is None:
+            self._resort()
+            return
+
+        sort_key = dimension_sort_key(self.kdims, self.vdims, range(self.ndims))((key,))
+        try:
+            pos = bisect_right(keys, sort_key)
+        except TypeError:
+            self._resort()
+            return
+
+        keys.insert(pos, sort_key)
+        following = list(islice(reversed(self.data), 1, len(keys)-pos))
+        for k in following[::-1]:
+            self.data[k] = self.data.pop(k)
+
+
+    def _pop_item(self, key):
+        """
+        Removes the item with the supplied key from the data, keeping
+        the sort index in sync so subsequent insertions do not require
+        a full sort.
+        """
+        keys = self._get_sort_index()
+        if keys is None or key not in self.data:
+            return self.data.pop(key, None)
+
+        sort_key = dimension_sort_key(self.kdims, self.vdims, range(self.ndims))((key,))
+        pos = bisect_left(keys, sort_key)
+        if pos < len(keys) and keys[pos] == sort_key:
+            keys.pop(pos)
+        else:
+            self._sort_index = None
+        return self.data.pop(key)
+
+
+    def _build_key_index(self):
+        """
+        Builds an index for each key dimension, mapping each
+        dimension value (or its position for categorical dimensions)
+        to the keys containing it along with a sorted list of the
+        unique values, which is None if the values are not mutually
+        comparable.
+        """
+        dim_indexes = []
+        for i, dim in enumerate(self.kdims):
+            positions = None
+            if dim.values:
+                positions = {}
+                for pos, val in enumerate(dim.values):
+                    positions.setdefault(val, pos)
+            lookup = {}
+            for k in self.data:
+                v = k[i] if positions is None else positions.get(k[i])
+                if v in lookup:
+                    lookup[v].append(k)
+                else:
+                    lookup[v] = [k]
+            try:
+                ordered = sorted(lookup)
+            except TypeError:
+                ordered = None
+            dim_indexes.append((positions, lookup, ordered))
+        self._key_index = (self._data_ref(), len(self.data), dim_indexes)
+        return dim_indexes
+
+
+    def _get_key_index(self):
+        """
+        Returns the per dimension key indexes, rebuilding them if they
+        are out of sync with the data.
+        """
+        index = getattr(self, '_key_index', None)
+        if index is None or index[0]() is not self.data or index[1] != len(self.data):
+            return self._build_key_index()
+        return index[2]
+
+
+    def _index_key(self, key, prev_data):
+        """
+        Adds a newly inserted key to the key indexes if they are in
+        sync with the data before insertion, otherwise the indexes
+        are rebuilt lazily when next required.
+        """
+        index = getattr(self, '_key_index', None)
+        if (index is None or index[0]() is not prev_data or
+            index[1] != len(self.data)-1):
+            self._key_index = None
+            return
+
+        for i, (positions, lookup, ordered) in enumerate(index[2]):
+            v = key[i] if positions is None else positions.get(key[i])
+            if v in lookup:
+                lookup[v].append(key)
+                continue
+            lookup[v] = [key]
+            if ordered is None:
+                continue
+            try:
+                ordered.insert(bisect_left(ordered, v), v)
+            except TypeError:
+                index[2][i] = (positions, lookup, None)
+        self._key_index = (self._data_ref(), len(self.data), index[2])
 
 
     def clone(self, data=None, shared_data=True, *args, **overrides):
@@ -660,13 +833,11 @@ class NdMapping(MultiDimensionalMapping):
                for el in map_slice):
             return self._dataslice(self.data[map_slice], data_slice)
         else:
-            conditions = self._generate_conditions(map_slice)
-            items = self.data.items()
-            for cidx, (condition, dim) in enumerate(zip(conditions, self.kdims)):
-                values = dim.values
-                items = [(k, v) for k, v in items
-                         if condition(values.index(k[cidx])
-                                      if values else k[cidx])]
+            keys = self._select_keys(map_slice)
+            if keys is None:
+                items = self._filter_items(map_slice)
+            else:
+                items = [(k, self.data[k]) for k in keys]
             sliced_items = []
             for k, v in items:
                 val_slice = self._dataslice(v, data_slice)
@@ -678,6 +849,77 @@ class NdMapping(MultiDimensionalMapping):
                 return self.clone(sliced_items)
 
 
+    def _filter_items(self, map_slice):
+        """
+        Filters the items by evaluating the conditions generated from
+        the slice on each key.
+        """
+        conditions = self._generate_conditions(map_slice)
+        items = self.data.items()
+        for cidx, (condition, dim) in enumerate(zip(conditions, self.kdims)):
+            if dim.values:
+                positions = {}
+                for pos, val in enumerate(dim.values):
+                    positions.setdefault(val, pos)
+                items = [(k, v) for k, v in items
+                         if condition(positions[k[cidx]])]
+            else:
+                items = [(k, v) for k, v in items if condition(k[cidx])]
+        return items
+
+
+    def _select_keys(self, map_slice):
+        """
+        Looks up the keys matching the slice using the key indexes,
+        avoiding a scan over all the keys. Returns None if the slice
+        cannot be resolved using the indexes, e.g. because it contains
+        callables or values which are not mutually comparable.
+        """
+        dim_indexes = self._get_key_index()
+        selected = None
+        for dim, dim_slice, (positions, lookup, ordered) in zip(self.kdims, map_slice, dim_indexes):
+            if dim_slice is Ellipsis or (isinstance(dim_slice, slice) and
+                                         dim_slice == slice(None)):
+                continue
+            elif callable(dim_slice) or isinstance(dim_slice, tuple):
+                return None
+            try:
+                if isinstance(dim_slice, slice):
+                    start, stop = dim_slice.start, dim_slice.stop
+                    if positions is not None:
+                        start = None if start is None else dim.values.index(start)
+                        stop = None if stop is None else dim.values.index(stop)
+                    if ordered is None:
+                        return None
+                    lidx = 0 if start is None else bisect_left(ordered, start)
+                    ridx = len(ordered) if stop is None else bisect_left(ordered, stop)
+                    values = ordered[lidx:ridx]
+                else:
+                    values = dim_slice if isinstance(dim_slice, (set, list)) else [dim_slice]
+                    if positions is not None:
+                        values = [dim.values.index(v) for v in values
+                                  if v in dim.values]
+                    missing = [v for v in values if v not in lookup]
+                    if missing and ordered is None:
+                        return None
+                    # Values may compare equal to a key without sharing its hash
+                    for v in missing:
+                        idx = bisect_left(ordered, v)
+                        if idx < len(ordered) and ordered[idx] == v:
+                            return None
+                keys = set(k for v in values for k in lookup.get(v, []))
+            except TypeError:
+                return None
+            selected = keys if selected is None else (selected & keys)
+
+        if selected is None:
+            return list(self.data)
+        if self._get_sort_index() is not None:
+            sort_key = dimension_sort_key(self.kdims, self.vdims, range(self.ndims))
+            return sorted(selected, key=lambda k: sort_key((k,)))
+        return [k for k in self.data if k in selected]
+
+
     def _expand_slice(self, indices):
         """
         Expands slices containing steps into a list.
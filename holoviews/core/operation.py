@@ -2,12 +2,14 @@
 Operations manipulate Elements, HoloMaps and Layouts, typically for
 the purposes of analysis or visualization.
 """
+from functools import partial
+
 import param
 from .dimension import ViewableElement
 from .element import Element
 from .layout import Layout
 from .overlay import NdOverlay, Overlay
-from .spaces import Callable, HoloMap
+from .spaces import Callable, HoloMap, DynamicMap
 from . import util, Dataset
 
 
@@ -61,6 +63,19 @@ class Operation(param.ParameterizedFunction):
         List of streams that are applied if dynamic=True, allowing
         for dynamic interaction with the plot.""")
 
+    executor = param.Parameter(default=None, doc="""
+       Determines how the frames of a HoloMap are processed. By
+       default frames are processed sequentially, 'threads' or
+       'processes' will process them in parallel on a pool of the
+       corresponding type and a concurrent.futures.Executor instance
+       may be supplied to manage the workers directly. In parallel
+       each frame is processed by a separate copy of the operation,
+       and the frames retain the order of the keys.""")
+
+    max_workers = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+       The maximum number of workers used when the executor is
+       declared as 'threads' or 'processes'.""")
+
     # Hooks to allow external libraries to extend existing operations.
     # Preprocessor hooks should accept the operation and input element
     # and return a dictionary of data which will be made available to
@@ -77,6 +92,13 @@ class Operation(param.ParameterizedFunction):
     # the input of the operation to the result
     _propagate_dataset = True
 
+    # The Buffer stream supplying the data of the processed elements,
+    # declared by Dynamic if the operation has an incremental parameter
+    _buffer = None
+
+    # State retained between incremental updates of a Buffer window
+    _buffer_state = None
+
     @classmethod
     def search(cls, element, pattern):
         """
@@ -118,6 +140,16 @@ class Operation(param.ParameterizedFunction):
             raise ValueError("Extents across the overlay are inconsistent")
 
 
+    def __reduce__(self):
+        """
+        Drops the parameter overrides of the last call, which cannot
+        be pickled, e.g. to send the operation to a process pool.
+        """
+        reconstruct, args, state = super(Operation, self).__reduce__()
+        state.pop('p', None)
+        return reconstruct, args, state
+
+
     def _apply(self, element, key=None):
         """
         Applies the operation to the element, executing any pre- and
@@ -129,18 +161,25 @@ class Operation(param.ParameterizedFunction):
 
         element_pipeline = getattr(element, '_pipeline', None)
 
-        ret = self._process(element, key)
+        if (self._buffer is not None and self.p.get('incremental', False)
+            and isinstance(element, Dataset)):
+            ret = self._process_buffered(element, key)
+        else:
+            ret = self._process(element, key)
         for hook in self._postprocess_hooks:
             ret = hook(self, ret, **kwargs)
 
         if (self._propagate_dataset and isinstance(ret, Dataset)
             and isinstance(element, Dataset)):
-            ret._dataset = element.dataset
-            ret._pipeline = element_pipeline.instance(
-                operations=element_pipeline.operations + [
-                    self.instance(**self.p)
-                ],
-            )
+            if util.config.track_pipelines:
+                if element_pipeline is None:
+                    element_pipeline = element.pipeline
+                ret._dataset = element.dataset
+                ret._pipeline = element_pipeline.instance(
+                    operations=element_pipeline.operations + [
+                        self.instance(**self.p)
+                    ],
+                )
             ret._transforms = element._transforms
         return ret
 
@@ -155,6 +194,58 @@ class Operation(param.ParameterizedFunction):
         return element
 
 
+    def _process_buffered(self, element, key=None):
+        """
+        Processes an element holding the current window of a Buffer
+        stream. If the window only changed by a newly streamed chunk
+        of rows appended to the end and any rows evicted from the
+        start, the retained accumulator of the previous window is
+        updated with the chunk by _process_chunk, otherwise the
+        result and accumulator are recomputed by _process_accumulate.
+        Assumes the rows of the element match the rows of the buffer.
+        """
+        buffer, state = self._buffer, self._buffer_state
+        self._buffer_state = None
+        params = util.deephash({k: v for k, v in self.p.items()
+                                if k not in ('dynamic', 'streams')})
+        nrows, chunk = len(element), buffer._chunk_length
+        ret = None
+        if (state is not None and params is not None and state['buffer'] is buffer and
+            state['params'] == params and state['key'] == key and
+            buffer._count == state['count']+1 and 0 < chunk <= nrows and
+            nrows == min(state['nrows']+chunk, buffer.length)):
+            accumulator = state['accumulator']
+            ret = self._process_chunk(element, key, accumulator, element.iloc[nrows-chunk:],
+                                      state['nrows']+chunk-nrows)
+        if ret is None:
+            ret, accumulator = self._process_accumulate(element, key)
+        if accumulator is not None and params is not None:
+            self._buffer_state = dict(buffer=buffer, params=params, key=key, nrows=nrows,
+                                      count=buffer._count, accumulator=accumulator)
+        return ret
+
+
+    def _process_accumulate(self, element, key=None):
+        """
+        Processes the complete window of a Buffer stream, returning
+        the result and an accumulator which may be updated in place by
+        _process_chunk, or None if the result cannot be updated
+        incrementally.
+        """
+        return self._process(element, key), None
+
+
+    def _process_chunk(self, element, key, accumulator, chunk, evicted):
+        """
+        Updates the accumulator in place with the rows of the newly
+        streamed chunk, removing the contribution of the supplied
+        number of rows evicted from the start of the window, and
+        returns the updated result. Returning None falls back to
+        recomputing the result from the complete window.
+        """
+        return None
+
+
     def process_element(self, element, key, **params):
         """
         The process_element method allows a single element to be
@@ -173,24 +264,75 @@ class Operation(param.ParameterizedFunction):
         return self._apply(element, key)
 
 
+    def _process_frames(self, holomap):
+        """
+        Processes the frames of a HoloMap, in parallel if an executor
+        has been declared. The first frame is always processed
+        sequentially so that any state it sets on the operation (e.g.
+        the histogram bins) is copied to the separate operations
+        processing the remaining frames.
+        """
+        keys, elements = list(holomap.keys()), list(holomap.values())
+        params = dict(self.p, executor=None)
+        processed = [self._apply(el, key=k) for k, el in zip(keys[:1], elements[:1])]
+        if self.p.executor is None:
+            processed += [self._apply(el, key=k) for k, el in zip(keys[1:], elements[1:])]
+        else:
+            operations = [self.instance(**params) for _ in keys[1:]]
+            processed += util.parallel_map(
+                _process_frame, operations, elements[1:], keys[1:],
+                executor=self.p.executor, max_workers=self.p.max_workers)
+        return holomap.clone(list(zip(keys, processed)))
+
+
+    def _apply_frames(self, holomap, **kwargs):
+        """
+        Applies the operation to the frames of a HoloMap in parallel,
+        returning the same result as applying it sequentially. As in
+        _process_frames the first frame is processed before a separate
+        copy of the operation is applied to each remaining frame by
+        the executor.
+        """
+        executor, max_workers = self.p.executor, self.p.max_workers
+        kwargs['per_element'] = self._per_element
+        items = list(holomap.data.items())
+        head = holomap.clone(items[:1]).apply(self, **kwargs)
+        params = dict(self.p, executor=None)
+        operations = [self.instance(**params) for _ in items[1:]]
+        frames = util.parallel_map(
+            partial(_apply_frame, **kwargs), operations, [v for _, v in items[1:]],
+            executor=executor, max_workers=max_workers)
+        tail = [(k, frame) for (k, _), frame in zip(items[1:], frames)
+                if frame is not None]
+        return holomap.clone(list(head.data.items())+tail)
+
+
     def __call__(self, element, **kwargs):
         params = dict(kwargs)
+        dynamic_kwargs = False
         for k, v in kwargs.items():
             if util.is_param_method(v, has_deps=True):
                 params[k] = v()
+                dynamic_kwargs = True
             elif isinstance(v, param.Parameter) and isinstance(v.owner, param.Parameterized):
                 params[k] = getattr(v.owner, v.name)
+                dynamic_kwargs = True
         self.p = param.ParamOverrides(self, params,
                                       allow_extra_keywords=self._allow_extra_keywords)
+        for k in ('executor', 'max_workers'):
+            kwargs.pop(k, None)
         if not self.p.dynamic:
             kwargs['dynamic'] = False
             if isinstance(element, HoloMap):
                 # Backwards compatibility for key argument
-                return element.clone([(k, self._apply(el, key=k))
-                                      for k, el in element.items()])
+                return self._process_frames(element)
             elif ((self._per_element and isinstance(element, Element)) or
                   (not self._per_element and isinstance(element, ViewableElement))):
                 return self._apply(element)
+        elif (self.p.executor is not None and self.p.dynamic == 'default' and
+              isinstance(element, HoloMap) and not isinstance(element, DynamicMap)
+              and not (self.p.streams or dynamic_kwargs)):
+            return self._apply_frames(element, **kwargs)
         elif 'streams' not in kwargs:
             kwargs['streams'] = self.p.streams
         kwargs['per_element'] = self._per_element
@@ -198,6 +340,24 @@ class Operation(param.ParameterizedFunction):
 
 
 
+def _process_frame(operation, element, key):
+    """
+    Processes a single frame of a HoloMap, defined at the module level
+    so that it may be sent to the workers of a process pool.
+    """
+    return operation.process_element(element, key)
+
+
+def _apply_frame(operation, frame, **kwargs):
+    """
+    Applies an operation to a single frame of a HoloMap, defined at
+    the module level so that it may be sent to the workers of a
+    process pool.
+    """
+    return frame.apply(operation, **kwargs)
+
+
+
 class OperationCallable(Callable):
     """
     OperationCallable allows wrapping an Operation and the objects it is
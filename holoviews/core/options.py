@@ -34,6 +34,7 @@ Store:
 """
 import pickle
 import traceback
+import weakref
 import difflib
 import inspect
 from contextlib import contextmanager
@@ -613,6 +614,10 @@ class OptionTree(AttrTree):
     approach method may only be used with the group lists format.
     """
 
+    # Counter incremented whenever the tree or one of its subtrees is
+    # modified, used to invalidate the options resolved on the tree
+    _generation = 0
+
     def __init__(self, items=None, identifier=None, parent=None,
                  groups=None, options=None, **kwargs):
 
@@ -666,6 +671,11 @@ class OptionTree(AttrTree):
                               group_name=group_name,
                               path = self.path)
 
+    def _propagate(self, path, val):
+        self.__dict__['_generation'] = self._generation + 1
+        super(OptionTree, self)._propagate(path, val)
+
+
     def __getitem__(self, item):
         if item in self.groups:
             return self.groups[item]
@@ -1146,6 +1156,11 @@ class Store(object):
 
     _backend_switch_hooks = []
 
+    # Cache of the Options resolved by lookup_options on each
+    # OptionTree, invalidated when the tree or the default tree of
+    # the backend is modified
+    _lookup_cache = weakref.WeakKeyDictionary()
+
     @classmethod
     def set_current_backend(cls, backend):
         "Use this method to set the backend to run the switch hooks"
@@ -1254,14 +1269,26 @@ class Store(object):
     @classmethod
     def lookup_options(cls, backend, obj, group, defaults=True):
         # Current custom_options dict may not have entry for obj.id
-        if obj.id in cls._custom_options[backend]:
-            return cls._custom_options[backend][obj.id].closest(
-                obj, group, defaults, backend=backend)
-        elif defaults:
-            return cls._options[backend].closest(obj, group, defaults, backend=backend)
-        else:
+        custom_tree = cls._custom_options[backend].get(obj.id)
+        if custom_tree is None and not defaults:
             return OptionTree(groups=cls._options[backend].groups)
 
+        default_tree = cls._options[backend]
+        tree = default_tree if custom_tree is None else custom_tree
+        generations = (tree._generation, default_tree._generation)
+        cache = cls._lookup_cache.get(tree)
+        if cache is None:
+            cache = cls._lookup_cache[tree] = {}
+        key = (backend, type(obj).__name__, obj.group, obj.label, group, defaults)
+        cached = cache.get(key)
+        if (cached is not None and cached[0]() is default_tree and
+            cached[1] == generations):
+            return cached[2]
+
+        options = tree.closest(obj, group, defaults, backend=backend)
+        cache[key] = (weakref.ref(default_tree), generations, options)
+        return options
+
     @classmethod
     def lookup(cls, backend, obj):
         """
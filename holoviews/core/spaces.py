@@ -1,6 +1,7 @@
 import itertools
 import types
 import inspect
+import time
 
 from numbers import Number
 from itertools import groupby
@@ -14,7 +15,7 @@ import param
 
 from . import traversal, util
 from .accessors import Opts, Redim
-from .dimension import OrderedDict, Dimension, ViewableElement
+from .dimension import OrderedDict, Dimension, Dimensioned, ViewableElement
 from .layout import Layout, AdjointLayout, NdLayout, Empty
 from .ndmapping import UniformNdMapping, NdMapping, item_check
 from .overlay import Overlay, CompositeOverlay, NdOverlay, Overlayable
@@ -549,11 +550,15 @@ class Callable(param.Parameterized):
     to a DynamicMap.
 
     Additionally, if the memoize attribute is True, a Callable will
-    memoize the last returned value based on the arguments to the
+    memoize the last returned values based on the arguments to the
     function and the state of all streams on its inputs, to avoid
-    calling the function unnecessarily. Note that because memoization
-    includes the streams found on the inputs it may be disabled if the
-    stream requires it and is triggering.
+    calling the function unnecessarily. The number of values that are
+    retained and how long they remain valid may be controlled with
+    the memoize_size and memoize_timeout parameters. When memoizing
+    multiple values they are shared with clones wrapping the same
+    callable, e.g. on chained DynamicMaps. Note that because memoization includes the
+    streams found on the inputs it may be disabled if the stream
+    requires it and is triggering.
 
     A Callable may also specify a stream_mapping which specifies the
     objects that are associated with interactive (i.e linked) streams
@@ -599,6 +604,15 @@ class Callable(param.Parameterized):
          based on the call arguments and any streams attached to the
          inputs.""")
 
+    memoize_size = param.Integer(default=1, bounds=(1, None), doc="""
+         The number of return values to memoize. This is an LRU cache
+         where the least recently used value is discarded once the
+         limit is reached.""")
+
+    memoize_timeout = param.Number(default=None, allow_None=True, bounds=(0, None), doc="""
+         The time in seconds after which a memoized value expires. By
+         default memoized values never expire.""")
+
     operation = param.Callable(default=None, doc="""
          The function being applied by the Callable. May be used
          to record the transform(s) being applied inside the
@@ -611,7 +625,7 @@ class Callable(param.Parameterized):
     def __init__(self, callable, **params):
         super(Callable, self).__init__(callable=callable,
                                        **dict(params, name=util.callable_name(callable)))
-        self._memoized = {}
+        self._memoized = OrderedDict()
         self._is_overlay = False
         self.args = None
         self.kwargs = None
@@ -641,8 +655,37 @@ class Callable(param.Parameterized):
         old = {k: v for k, v in self.param.get_param_values()
                if k not in ['callable', 'name']}
         params = dict(old, **overrides)
+        shared = callable is None or callable is self.callable
         callable = self.callable if callable is None else callable
-        return self.__class__(callable, **params)
+        clone = self.__class__(callable, **params)
+        if shared and clone.memoize_size > 1:
+            clone._memoized = self._memoized
+        return clone
+
+
+    def _memoized_value(self, hashed_key):
+        """
+        Looks up a memoized value, marking it as most recently used.
+        Raises a KeyError if the value was not memoized or has expired.
+        """
+        timestamp, value = self._memoized.pop(hashed_key)
+        if (self.memoize_timeout is not None and
+            time.time()-timestamp > self.memoize_timeout):
+            raise KeyError(hashed_key)
+        self._memoized[hashed_key] = (timestamp, value)
+        return value
+
+
+    def _memoize(self, hashed_key, value):
+        """
+        Memoizes a value, discarding the least recently used values
+        if the memoize_size is exceeded.
+        """
+        memoized = self._memoized
+        memoized.pop(hashed_key, None)
+        while memoized and len(memoized) >= self.memoize_size:
+            memoized.pop(next(iter(memoized)))
+        memoized[hashed_key] = (time.time(), value)
 
 
     def __call__(self, *args, **kwargs):
@@ -672,8 +715,11 @@ class Callable(param.Parameterized):
         key = args + kwarg_hash + values
 
         hashed_key = util.deephash(key) if self.memoize else None
-        if hashed_key is not None and memoize and hashed_key in self._memoized:
-            return self._memoized[hashed_key]
+        if hashed_key is not None and memoize:
+            try:
+                return self._memoized_value(hashed_key)
+            except KeyError:
+                pass
 
         if self.argspec.varargs is not None:
             # Missing information on positional argument names, cannot promote to keywords
@@ -707,7 +753,7 @@ class Callable(param.Parameterized):
             raise
 
         if hashed_key is not None:
-            self._memoized = {hashed_key : ret}
+            self._memoize(hashed_key, ret)
         return ret
 
 
@@ -873,6 +919,12 @@ class DynamicMap(HoloMap):
        cache where the least recently used item is overwritten once
        the cache is full.""")
 
+    cache_bytes = param.Integer(default=None, allow_None=True, bounds=(0, None), doc="""
+       Optional memory budget for the cache in bytes. The size of each
+       cached item is estimated using the data interfaces of the
+       Datasets it contains and the least recently used items are
+       evicted once the budget would be exceeded.""")
+
     def __init__(self, callback, initial_items=None, streams=None, **params):
         streams = (streams or [])
 
@@ -912,6 +964,9 @@ class DynamicMap(HoloMap):
             if stream.source is None:
                 stream.source = self
         self.periodic = periodic(self)
+        self._cache_usage = OrderedDict()
+        self._cache_nbytes = 0
+        self._cache_stats = dict(hits=0, misses=0, evictions=0)
 
     @property
     def opts(self):
@@ -921,6 +976,18 @@ class DynamicMap(HoloMap):
     def redim(self):
         return Redim(self, mode='dynamic')
 
+    @property
+    def cache_info(self):
+        """
+        Returns a dictionary summarizing the state of the cache,
+        reporting the number of hits, misses and evictions since the
+        cache was last reset along with the number of cached items
+        and their estimated size in bytes.
+        """
+        self._sync_cache_usage()
+        return dict(self._cache_stats, size=len(self.data),
+                    nbytes=self._cache_nbytes)
+
     @property
     def unbounded(self):
         """
@@ -1144,9 +1211,19 @@ class DynamicMap(HoloMap):
     def reset(self):
         "Clear the DynamicMap cache"
         self.data = OrderedDict()
+        self._cache_usage = OrderedDict()
+        self._cache_nbytes = 0
+        self._cache_stats = dict(hits=0, misses=0, evictions=0)
         return self
 
 
+    def __getstate__(self):
+        "Drops the reference used to check that the cache usage is in sync."
+        state = super(DynamicMap, self).__getstate__()
+        state.pop('_cache_data_ref', None)
+        return state
+
+
     def _cross_product(self, tuple_key, cache, data_slice):
         """
         Returns a new DynamicMap if the key (tuple form) expresses a
@@ -1175,8 +1252,10 @@ class DynamicMap(HoloMap):
             key = util.wrap_tuple(inner_key)
             if key in cache:
                 val = cache[key]
+                self._cache_hit(key)
             else:
                 val = self._execute_callback(*key)
+                self._cache_stats['misses'] += 1
             if data_slice:
                 val = self._dataslice(val, data_slice)
             data.append((key, val))
@@ -1283,8 +1362,11 @@ class DynamicMap(HoloMap):
             return product
 
         # Not a cross product and nothing cached so compute element.
-        if cache is not None: return cache
+        if cache is not None:
+            self._cache_hit(tuple_key)
+            return cache
         val = self._execute_callback(*tuple_key)
+        self._cache_stats['misses'] += 1
         if data_slice:
             val = self._dataslice(val, data_slice)
         self._cache(tuple_key, val)
@@ -1350,16 +1432,78 @@ class DynamicMap(HoloMap):
             return dmap
 
 
+    @classmethod
+    def _estimate_nbytes(cls, obj):
+        """
+        Estimates the memory held by an object returned by the callback
+        by summing the size of all the Datasets it contains.
+        """
+        if not isinstance(obj, Dimensioned):
+            return 0
+        return sum(obj.traverse(lambda x: x.interface.nbytes(x),
+                                [lambda x: hasattr(x, 'interface')]))
+
+
+    def _sync_cache_usage(self):
+        """
+        Ensures the recency order and size estimates of the cached
+        items match the cache contents, which may also be populated
+        or cleared by replacing the data directly. Items that were not
+        inserted via the cache are considered least recently used. The
+        keys are only compared if the data was replaced or its length
+        changed since the cache was last updated.
+        """
+        usage = self._cache_usage
+        ref = getattr(self, '_cache_data_ref', None)
+        if ref is not None and ref() is self.data and len(usage) == len(self.data):
+            return usage
+        for key in [k for k in usage if k not in self.data]:
+            self._cache_nbytes -= usage.pop(key)
+        untracked = [(k, self._estimate_nbytes(v)) for k, v in self.data.items()
+                     if k not in usage]
+        if untracked:
+            usage = OrderedDict(untracked + list(usage.items()))
+            self._cache_usage = usage
+            self._cache_nbytes += sum(nbytes for _, nbytes in untracked)
+        self._cache_data_ref = self._data_ref()
+        return usage
+
+
+    def _cache_hit(self, key):
+        """
+        Records a cache hit, marking the key as most recently used.
+        """
+        self._cache_stats['hits'] += 1
+        usage = self._cache_usage
+        if key in usage:
+            usage[key] = usage.pop(key)
+
+
     def _cache(self, key, val):
         """
-        Request that a key/value pair be considered for caching.
+        Request that a key/value pair be considered for caching,
+        evicting the least recently used items if the cache_size or
+        cache_bytes budget would be exceeded.
         """
         cache_size = (1 if util.dimensionless_contents(self.streams, self.kdims)
                       else self.cache_size)
-        if len(self) >= cache_size:
-            first_key = next(k for k in self.data)
-            self.data.pop(first_key)
+        usage = self._sync_cache_usage()
+        if key in usage:
+            self._cache_nbytes -= usage.pop(key)
+            self._pop_item(key)
+
+        nbytes = self._estimate_nbytes(val)
+        while usage and (len(self.data) >= cache_size or
+                         (self.cache_bytes is not None and
+                          self._cache_nbytes + nbytes > self.cache_bytes)):
+            lru_key = next(iter(usage))
+            self._cache_nbytes -= usage.pop(lru_key)
+            self._pop_item(lru_key)
+            self._cache_stats['evictions'] += 1
         self[key] = val
+        usage[key] = nbytes
+        self._cache_nbytes += nbytes
+        self._cache_data_ref = self._data_ref()
 
 
     def map(self, map_fn, specs=None, clone=True, link_inputs=True):
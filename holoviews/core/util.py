@@ -1,6 +1,8 @@
 import sys, warnings, operator
 import json
 import time
+import hashlib
+import weakref
 import types
 import numbers
 import inspect
@@ -143,6 +145,20 @@ class Config(param.ParameterizedFunction):
     no_padding = param.Boolean(default=False, doc="""
        Disable default padding (introduced in 1.13.0).""")
 
+    spatial_index = param.Boolean(default=False, doc="""
+       Whether Points and Scatter elements build a spatial index of
+       their x- and y-coordinates the first time they are selected by
+       a bounding box or snapped to the closest point. The index is
+       cached on the element and speeds up subsequent selections,
+       e.g. when decimating the data on each zoom or pan.""")
+
+    track_pipelines = param.Boolean(default=True, doc="""
+       Whether Dataset methods, accessors and operations record the
+       pipeline of operations used to create each element. Disabling
+       it reduces the overhead of each method call, e.g. in streaming
+       applications, but breaks features which replay the pipeline
+       such as linked selections.""")
+
     warn_options_call = param.Boolean(default=True, doc="""
        Whether to warn when the deprecated __call__ options syntax is
        used (the opts method should now be used instead). It is
@@ -170,6 +186,9 @@ class HashableJSON(json.JSONEncoder):
     or numpy arrays, HashableJSON has to convert these types to
     datastructures that can normally be represented as JSON.
 
+    Arrays, DataFrames and other data containers are represented by
+    a digest of their contents computed by the fingerprint function.
+
     Support for other object types may need to be introduced in
     future. By default, unrecognized object types are represented by
     their id.
@@ -183,10 +202,9 @@ class HashableJSON(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, set):
             return hash(frozenset(obj))
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        if pd and isinstance(obj, (pd.Series, pd.DataFrame)):
-            return obj.to_csv(header=True).encode('utf-8')
+        digest = fingerprint(obj)
+        if digest is not None:
+            return digest
         elif isinstance(obj, self.string_hashable):
             return str(obj)
         elif isinstance(obj, self.repr_hashable):
@@ -353,6 +371,171 @@ def deephash(obj):
         return None
 
 
+# Use the fastest digest available in the standard library
+_digest = getattr(hashlib, 'blake2b', hashlib.md5)
+
+# Fingerprints of read-only arrays indexed by id
+_array_fingerprints = {}
+
+
+def _hash_array(hasher, arr):
+    """
+    Updates the hasher with the dtype, shape and contents of an array,
+    hashing the underlying buffer directly unless the array holds
+    Python objects.
+    """
+    hasher.update(('%s%s' % (arr.dtype.str, arr.shape)).encode('utf-8'))
+    if arr.dtype.hasobject:
+        try:
+            arr = pd.util.hash_array(arr.ravel())
+        except Exception:
+            hasher.update(json.dumps(arr.tolist(), cls=HashableJSON,
+                                     sort_keys=True).encode('utf-8'))
+            return
+    hasher.update(np.ascontiguousarray(arr).reshape(-1).view(np.uint8))
+
+
+def _hash_ndarray(hasher, arr):
+    """
+    Hashes a NumPy array, reusing the fingerprint of arrays which own
+    their data and are flagged as read-only since their contents
+    cannot change. The fingerprint is discarded if the array is found
+    to be writeable again, however modifying an array which is only
+    temporarily made writeable in between two hashes is not detected.
+    """
+    key = id(arr)
+    if key in _array_fingerprints and arr.flags.writeable:
+        del _array_fingerprints[key]
+    if key in _array_fingerprints:
+        digest = _array_fingerprints[key][1]
+    else:
+        array_hasher = _digest()
+        _hash_array(array_hasher, arr)
+        digest = array_hasher.hexdigest()
+        if not arr.flags.writeable and arr.flags.owndata:
+            ref = weakref.ref(arr, lambda r: _array_fingerprints.pop(key, None))
+            _array_fingerprints[key] = (ref, digest)
+    hasher.update(digest.encode('utf-8'))
+
+
+def _hash_pandas(hasher, obj):
+    """
+    Hashes pandas Index, Series and DataFrame objects column by
+    column, hashing the buffers of NumPy backed columns directly.
+    """
+    if isinstance(obj, pd.DataFrame):
+        hasher.update(repr(list(obj.columns)).encode('utf-8'))
+        columns = [obj.iloc[:, i] for i in range(len(obj.columns))]
+        for column in columns:
+            _hash_pandas_values(hasher, column)
+        _hash_pandas(hasher, obj.index)
+    elif isinstance(obj, pd.Series):
+        hasher.update(repr(obj.name).encode('utf-8'))
+        _hash_pandas_values(hasher, obj)
+        _hash_pandas(hasher, obj.index)
+    elif isinstance(obj, pd.RangeIndex):
+        hasher.update(repr((obj.start, obj.stop, obj.step)).encode('utf-8'))
+    else:
+        hasher.update(repr(obj.names).encode('utf-8'))
+        _hash_pandas_values(hasher, obj)
+
+
+def _hash_pandas_values(hasher, obj):
+    """
+    Hashes the values of a pandas Series or Index.
+    """
+    values = obj.values
+    if isinstance(values, np.ndarray) and not values.dtype.hasobject:
+        _hash_ndarray(hasher, values)
+    else:
+        hasher.update(str(obj.dtype).encode('utf-8'))
+        _hash_array(hasher, pd.util.hash_pandas_object(obj, index=False).values)
+
+
+def _hash_xarray(hasher, obj):
+    """
+    Hashes the names, dimensions and data of all variables on an
+    xarray DataArray or Dataset.
+    """
+    import xarray as xr
+    if isinstance(obj, xr.DataArray):
+        variables = [(obj.name, obj.variable)] + list(obj.coords.variables.items())
+    else:
+        variables = list(obj.variables.items())
+    for name, var in sorted(variables, key=lambda x: str(x[0])):
+        hasher.update(repr((name, var.dims)).encode('utf-8'))
+        if is_dask_array(var.data):
+            hasher.update(var.data.name.encode('utf-8'))
+        else:
+            _hash_ndarray(hasher, var.values)
+
+
+def fingerprint(obj):
+    """
+    Computes a digest of the contents of array-like data containers
+    including NumPy arrays, pandas, xarray and dask objects, returning
+    None for any other type. Arrays are hashed via their underlying
+    buffers, pandas objects column by column and lazy dask objects
+    by the token identifying their task graph, avoiding conversion
+    of the data to Python types.
+    """
+    hasher = _digest()
+    hasher.update(type(obj).__name__.encode('utf-8'))
+    if isinstance(obj, np.ndarray):
+        _hash_ndarray(hasher, obj)
+    elif is_dask_array(obj):
+        hasher.update(obj.name.encode('utf-8'))
+    elif pd and isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        _hash_pandas(hasher, obj)
+    elif is_dataframe(obj) or is_series(obj):
+        hasher.update(obj._name.encode('utf-8'))
+    elif ('xarray' in sys.modules and
+          isinstance(obj, (sys.modules['xarray'].DataArray,
+                           sys.modules['xarray'].Dataset))):
+        _hash_xarray(hasher, obj)
+    else:
+        return None
+    return hasher.hexdigest()
+
+
+def parallel_map(fn, *iterables, **kwargs):
+    """
+    Applies the function to the items of the supplied iterables,
+    returning a list of the results in the same order as the inputs.
+    The executor keyword determines how the items are processed:
+
+    * None: Items are processed sequentially (default).
+    * 'threads': Items are processed on a thread pool.
+    * 'processes': Items are processed on a process pool, requiring
+      the function and items to be picklable.
+    * Executor: Items are submitted to the supplied
+      concurrent.futures.Executor instance.
+
+    The max_workers keyword sets the size of the pools created when
+    the executor is declared as a string. Any exception raised by
+    the function is re-raised in the calling thread.
+    """
+    executor = kwargs.pop('executor', None)
+    max_workers = kwargs.pop('max_workers', None)
+    if kwargs:
+        raise TypeError('parallel_map got unexpected keyword arguments: %s'
+                        % ', '.join(kwargs))
+    if executor is None:
+        return [fn(*args) for args in zip(*iterables)]
+
+    from concurrent import futures
+    if isinstance(executor, futures.Executor):
+        return list(executor.map(fn, *iterables))
+    pools = {'threads': futures.ThreadPoolExecutor,
+             'processes': futures.ProcessPoolExecutor}
+    if executor not in pools:
+        raise ValueError("Executor must be one of 'threads', 'processes' or "
+                         "a concurrent.futures.Executor instance, found %r."
+                         % executor)
+    with pools[executor](max_workers=max_workers) as pool:
+        return list(pool.map(fn, *iterables))
+
+
 def tree_attribute(identifier):
     """
     Predicate that returns True for custom attributes added to AttrTrees
@@ -966,7 +1149,7 @@ def max_range(ranges, combined=True):
 
             arr = np.array(values)
             if not len(arr):
-                return np.NaN, np.NaN
+                return np.nan, np.nan
             elif arr.dtype.kind in 'OSU':
                 arr = list(python2sort([
                     v for r in values for v in r
@@ -1166,6 +1349,240 @@ def unique_array(arr):
         return arr[np.sort(uniq_inds)]
 
 
+def _factorize(arr):
+    """
+    Returns integer codes for the values of an array and the number
+    of distinct values.
+    """
+    try:
+        _, codes = np.unique(arr, return_inverse=True)
+        codes = codes.ravel()
+    except TypeError:
+        # Values which cannot be sorted, e.g. mixed types
+        lookup = {}
+        codes = np.array([lookup.setdefault(v, len(lookup)) for v in arr],
+                         dtype='int64')
+        return codes, len(lookup)
+    return codes, (int(codes.max())+1 if len(codes) else 0)
+
+
+def factorize_groups(columns):
+    """
+    Groups the rows of the supplied key columns, factorizing each
+    column and packing the codes into a single integer key per row.
+    Instead of building a mask per group the rows are sorted by group
+    once so each group is a contiguous run.
+
+    Args:
+       columns: List of equal length arrays to group by
+
+    Returns:
+       A tuple of the unique values of each column in order of first
+       occurrence, the stable sort order of the rows by group and the
+       offsets of each group in the sorted rows (with an additional
+       final offset).
+    """
+    length = len(columns[0]) if columns else 0
+    if not length:
+        empty = np.array([], dtype='int64')
+        return [np.asarray(c)[:0] for c in columns], empty, np.zeros(1, dtype='int64')
+
+    keys, nkeys = None, 1
+    for column in columns:
+        codes, ncodes = _factorize(np.asarray(column))
+        if keys is None:
+            keys, nkeys = codes, ncodes
+            continue
+        elif nkeys * ncodes >= 2**62:
+            # Compact the key space to avoid overflow
+            keys, nkeys = _factorize(keys)
+        keys, nkeys = keys * ncodes + codes, nkeys * ncodes
+
+    # Number groups in order of first occurrence
+    uniq, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    ranks = np.empty(len(uniq), dtype='int64')
+    ranks[np.argsort(first)] = np.arange(len(uniq))
+    groups = ranks[inverse.ravel()]
+    first = np.sort(first)
+
+    order = np.argsort(groups, kind='mergesort')
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(groups))])
+    uniques = [np.asarray(column)[first] for column in columns]
+    return uniques, order, offsets
+
+
+# Reductions which can be computed on contiguous groups by reduce_groups
+_group_reductions = [
+    (np.sum, 'sum'), (np.mean, 'mean'), (np.size, 'size'),
+    (np.min, 'min'), (np.amin, 'min'), (np.max, 'max'), (np.amax, 'max')
+]
+
+
+def reduce_groups(values, offsets, function):
+    """
+    Applies a reduction to contiguous groups of values given the
+    offsets of each group, as returned by factorize_groups, using
+    ufunc.reduceat. Supports sum, mean, min, max and size reductions
+    of numeric arrays with the same output types as the equivalent
+    NumPy functions, returning None for any other function or type.
+    """
+    reduction = None
+    for fn, name in _group_reductions:
+        if function is fn:
+            reduction = name
+    values = np.asarray(values)
+    counts = np.diff(offsets)
+    if reduction is None or not len(counts):
+        return None
+    elif reduction == 'size':
+        return counts
+    elif values.dtype.kind not in 'iuf':
+        return None
+    elif reduction in ('sum', 'mean'):
+        # Only types which NumPy sums without promotion
+        if values.dtype not in (np.dtype('float64'), np.dtype('int64')):
+            return None
+        sums = np.add.reduceat(values, offsets[:-1])
+        return sums/counts if reduction == 'mean' else sums
+    ufunc = np.minimum if reduction == 'min' else np.maximum
+    return ufunc.reduceat(values, offsets[:-1])
+
+
+# Number of rows processed at once by the chunked histogram kernels
+histogram_chunksize = 2**20
+
+
+def _chunk_range(values):
+    """
+    Returns the finite minimum and maximum of an array chunk.
+    """
+    if not len(values):
+        return np.nan, np.nan
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+        lower, upper = np.nanmin(values), np.nanmax(values)
+    if not (np.isfinite(lower) and np.isfinite(upper)):
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return np.nan, np.nan
+        lower, upper = values.min(), values.max()
+    return lower, upper
+
+
+def _chunk_bin_counts(values, start, end, bins, weights=None, nonzero=False):
+    """
+    Counts the values of an array chunk falling into the uniform
+    bins between start and end, computing the bin indexes directly
+    and correcting them against the bin edges exactly like
+    np.histogram. Non-finite values never fall into a bin.
+    """
+    keep = (values >= start) & (values <= end)
+    if nonzero:
+        keep &= values > 0
+    values = values[keep]
+    if weights is not None:
+        weights = weights[keep]
+    edges = np.linspace(start, end, bins+1)
+    indices = ((values - start) * (bins / (end - start))).astype(np.intp)
+    indices[indices == bins] -= 1
+    indices[values < edges[indices]] -= 1
+    indices[(values >= edges[indices+1]) & (indices != bins-1)] += 1
+    return np.bincount(indices, weights=weights, minlength=bins)
+
+
+def _reduce_chunks(columns, function, combine, args=None, chunksize=None, compute=True):
+    """
+    Applies a function to aligned chunks of each column and of any
+    array arguments supplied for that column, combining the partial
+    results per column. NumPy arrays are processed in chunks of
+    chunksize rows, while the blocks of all dask arrays are reduced
+    in parallel in a single compute, so the data is only read once.
+    If compute is disabled the combined results of dask arrays are
+    returned as dask Delayed objects instead.
+    """
+    chunksize = chunksize or histogram_chunksize
+    args = args or [()]*len(columns)
+    results, lazy = [None]*len(columns), []
+    for i, (column, colargs) in enumerate(zip(columns, args)):
+        if is_dask_array(column):
+            import dask
+            import dask.array as da
+            blocks = column.to_delayed().ravel()
+            blockargs = []
+            for arg in colargs:
+                if isinstance(arg, np.ndarray):
+                    arg = da.from_array(arg, chunks=column.chunks)
+                if is_dask_array(arg):
+                    if arg.numblocks != column.numblocks:
+                        arg = arg.rechunk(column.chunks)
+                    blockargs.append(arg.to_delayed().ravel())
+                else:
+                    blockargs.append([arg]*len(blocks))
+            lazy.append((i, [dask.delayed(function)(block, *[a[j] for a in blockargs])
+                             for j, block in enumerate(blocks)]))
+            continue
+        colargs = [arg.compute() if is_dask_array(arg) else arg for arg in colargs]
+        results[i] = combine([
+            function(column[j:j+chunksize], *[arg[j:j+chunksize] if isinstance(arg, np.ndarray)
+                                              else arg for arg in colargs])
+            for j in range(0, max(len(column), 1), chunksize)])
+    if lazy and not compute:
+        import dask
+        for i, partials in lazy:
+            results[i] = dask.delayed(combine)(partials)
+    elif lazy:
+        import dask
+        computed = dask.compute(*[partials for _, partials in lazy])
+        for (i, _), partials in zip(lazy, computed):
+            results[i] = combine(partials)
+    return results
+
+
+def finite_ranges(columns, chunksize=None):
+    """
+    Computes the finite minimum and maximum of each of the supplied
+    NumPy or dask arrays in a single chunked pass over the data,
+    without allocating a finite mask of the full array. Returns a
+    list of (min, max) tuples, which are NaN if a column contains no
+    finite values.
+    """
+    def combine(ranges):
+        lowers, uppers = zip(*ranges)
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+            return np.nanmin(lowers), np.nanmax(uppers)
+    return _reduce_chunks(columns, _chunk_range, combine, chunksize=chunksize)
+
+
+def uniform_bin_counts(columns, ranges, bins, weights=None, nonzero=False,
+                       chunksize=None, compute=True):
+    """
+    Computes histograms of each of the supplied NumPy or dask arrays
+    over uniform bins spanning the corresponding (start, end) range,
+    in a single chunked pass over the data. Rather than searching the
+    bin edges, the bin of each value is computed directly from its
+    offset from the start, producing the same counts as np.histogram.
+    Values outside the range or non-finite values are ignored, as are
+    values <= 0 if nonzero is enabled. Optionally accepts an array of
+    weights aligned with all the columns or a list of weights (which
+    may be None) for each column. If compute is disabled the counts
+    of dask arrays are returned as lazy dask arrays.
+    """
+    if not isinstance(weights, list):
+        weights = [weights]*len(columns)
+    args = [(start, end, bins, w, nonzero) for (start, end), w in zip(ranges, weights)]
+    counts = _reduce_chunks(columns, _chunk_bin_counts, lambda c: np.sum(c, axis=0),
+                            args, chunksize, compute)
+    if compute:
+        return counts
+    for i, (column, w) in enumerate(zip(columns, weights)):
+        if is_dask_array(column):
+            import dask.array as da
+            dtype = 'int64' if w is None else 'float64'
+            counts[i] = da.from_delayed(counts[i], (bins,), dtype)
+    return counts
+
+
 def match_spec(element, specification):
     """
     Matches the group.label specification of the supplied
@@ -1228,12 +1645,12 @@ def merge_dimensions(dimensions_list):
     return [d.clone(values=dvalues.get(d.name, [])) for d in dimensions]
 
 
-def dimension_sort(odict, kdims, vdims, key_index):
+def dimension_sort_key(kdims, vdims, key_index):
     """
-    Sorts data by key using usual Python tuple sorting semantics
-    or sorts in categorical order for any categorical Dimensions.
+    Returns a function computing the sort key of an item using the
+    usual Python tuple sorting semantics or the categorical order
+    for any categorical Dimensions.
     """
-    sortkws = {}
     ndims = len(kdims)
     dimensions = kdims+vdims
     indexes = [(dimensions[i], int(i not in range(ndims)),
@@ -1243,10 +1660,17 @@ def dimension_sort(odict, kdims, vdims, key_index):
 
     if len(set(key_index)) != len(key_index):
         raise ValueError("Cannot sort on duplicated dimensions")
-    else:
-       sortkws['key'] = lambda x: tuple(cached_values[dim.name].index(x[t][d])
-                                        if dim.values else x[t][d]
-                                        for i, (dim, t, d) in enumerate(indexes))
+    return lambda x: tuple(cached_values[dim.name].index(x[t][d])
+                           if dim.values else x[t][d]
+                           for i, (dim, t, d) in enumerate(indexes))
+
+
+def dimension_sort(odict, kdims, vdims, key_index):
+    """
+    Sorts data by key using usual Python tuple sorting semantics
+    or sorts in categorical order for any categorical Dimensions.
+    """
+    sortkws = {'key': dimension_sort_key(kdims, vdims, key_index)}
     if sys.version_info.major == 3:
         return python2sort(odict.items(), **sortkws)
     else:
@@ -2030,6 +2454,46 @@ def parse_datetime_selection(sel):
     return sel
 
 
+def isin(values, selection):
+    """
+    Returns a boolean mask of the array values which are contained in
+    the selection. Uses sorted (numpy) or hashed (pandas) membership
+    tests instead of comparing the array against each item in turn.
+    """
+    selection = list(selection)
+    if not selection:
+        return np.zeros(values.shape, dtype=bool)
+    sel_kind = np.asarray(selection).dtype.kind
+    if values.dtype.kind not in 'OSU' and sel_kind not in 'OSU':
+        return np.isin(values, selection)
+    elif pd is not None:
+        flat = pd.Series(values.ravel()) if values.ndim != 1 else pd.Series(values)
+        return flat.isin(selection).values.reshape(values.shape)
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', r'invalid value encountered')
+        return np.logical_or.reduce([values == v for v in selection])
+
+
+def sorted_range_mask(values, start=None, stop=None):
+    """
+    Returns a boolean mask of the values in the half-open interval
+    [start, stop) for a one-dimensional array sorted in ascending or
+    descending order. The bounds are located by binary search, so
+    the array is only traversed once to fill the mask.
+    """
+    mask = np.zeros(len(values), dtype=bool)
+    if not len(values):
+        return mask
+    descending = values[0] > values[-1]
+    ordered = values[::-1] if descending else values
+    lower = 0 if start is None else np.searchsorted(ordered, start, 'left')
+    upper = len(values) if stop is None else np.searchsorted(ordered, stop, 'left')
+    if descending:
+        lower, upper = len(values)-upper, len(values)-lower
+    mask[lower:upper] = True
+    return mask
+
+
 def dt_to_int(value, time_unit='us'):
     """
     Converts a datetime type to an integer with the supplied time unit.
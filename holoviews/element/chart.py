@@ -6,7 +6,7 @@ from ..core import Dimension, Dataset, Element2D
 from ..core.data import GridInterface
 from ..streams import SelectionXY
 from .geom import Rectangles, Points, VectorField # noqa: backward compatible import
-from .selection import Selection1DExpr, Selection2DExpr
+from .selection import Selection1DExpr, Selection2DExpr, SpatialIndexSelection
 
 
 class Chart(Dataset, Element2D):
@@ -48,7 +48,7 @@ class Chart(Dataset, Element2D):
         return super(Chart, self).__getitem__(index)
 
 
-class Scatter(Selection2DExpr, Chart):
+class Scatter(SpatialIndexSelection, Selection2DExpr, Chart):
     """
     Scatter is a Chart element representing a set of points in a 1D
     coordinate system where the key dimension maps to the points
@@ -3,7 +3,7 @@ import numpy as np
 import param
 
 from ..core import Dimension, Dataset, Element2D
-from .selection import Selection2DExpr, SelectionGeomExpr
+from .selection import Selection2DExpr, SelectionGeomExpr, SpatialIndexSelection
 
 
 class Geometry(Dataset, Element2D):
@@ -27,7 +27,7 @@ class Geometry(Dataset, Element2D):
     __abstract = True
 
 
-class Points(Selection2DExpr, Geometry):
+class Points(SpatialIndexSelection, Selection2DExpr, Geometry):
     """
     Points represents a set of coordinates in 2D space, which may
     optionally be associated with any number of value dimensions.
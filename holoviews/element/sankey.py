@@ -37,6 +37,14 @@ class _layout_sankey(Operation):
     node_sort = param.Boolean(default=True, doc="""
         Sort nodes in ascending breadth.""")
 
+    method = param.ObjectSelector(default='dict', objects=['dict', 'array'], doc="""
+        Whether to compute the layout on dictionaries of node and link
+        attributes as in d3-sankey or on NumPy arrays of the node and
+        link attributes, relaxing and resolving the collisions of all
+        nodes in a column at once. Both methods produce the same layout
+        up to floating point rounding but the array method scales to
+        much larger graphs.""")
+
     def _process(self, element, key=None):
         nodes, edges, graph = self.layout(element, **self.p)
         params = get_param_values(element)
@@ -44,13 +52,16 @@ class _layout_sankey(Operation):
 
     def layout(self, element, **params):
         self.p = param.ParamOverrides(self, params)
-        graph = {'nodes': [], 'links': []}
-        self.computeNodeLinks(element, graph)
-        self.computeNodeValues(graph)
-        self.computeNodeDepths(graph)
-        self.computeNodeBreadths(graph)
-        self.computeLinkBreadths(graph)
-        paths = self.computePaths(graph)
+        if self.p.method == 'array':
+            graph, paths = self.computeArrayLayout(element)
+        else:
+            graph = {'nodes': [], 'links': []}
+            self.computeNodeLinks(element, graph)
+            self.computeNodeValues(graph)
+            self.computeNodeDepths(graph)
+            self.computeNodeBreadths(graph)
+            self.computeLinkBreadths(graph)
+            paths = self.computePaths(graph)
 
         node_data = []
         for node in graph['nodes']:
@@ -307,6 +318,235 @@ class _layout_sankey(Operation):
                 link['y1'] = y1
                 y1 += link['width']
 
+    def computeArrayLayout(self, element):
+        """
+        Computes the same layout as the dictionary based methods with
+        the node and link attributes stored in NumPy arrays, returning
+        the graph dictionary and the link paths.
+        """
+        index = element.nodes.kdims[-1]
+        node_index = element.nodes.dimension_values(index)
+        if element.nodes.vdims:
+            node_values = list(zip(*(element.nodes.dimension_values(d)
+                                     for d in element.nodes.vdims)))
+        else:
+            node_values = [tuple()]*len(node_index)
+        src, tgt, link_values = [element.dimension_values(d)
+                                 for d in element.dimensions()[:3]]
+        node_map = {idx: i for i, idx in enumerate(node_index)}
+        nnodes = len(node_index)
+        source = np.array([node_map[s] for s in src], dtype='int64')
+        target = np.array([node_map[t] for t in tgt], dtype='int64')
+        value = np.asarray(link_values, dtype='float64')
+
+        # Node values and depths
+        node_value = np.maximum(np.bincount(source, value, minlength=nnodes),
+                                np.bincount(target, value, minlength=nnodes))
+        has_source = np.bincount(source, minlength=nnodes) > 0
+        has_target = np.bincount(target, minlength=nnodes) > 0
+        depth, ndepths = self._array_depths(source, target, nnodes)
+        height, _ = self._array_depths(target, source, nnodes)
+
+        x0, _, x1, _ = self.p.bounds
+        dx = self.p.node_width
+        kx = (x1 - x0 - dx) / (ndepths - 1)
+        d = np.where(has_source, depth, ndepths - 1)
+        node_x0 = x0 + np.maximum(0, np.minimum(ndepths-1, np.floor(d)) * kx)
+        node_x1 = node_x0 + dx
+
+        node_y0, node_y1, width = self._array_node_breadths(
+            source, target, value, node_value, node_x0, depth, has_source, has_target)
+        source_order, link_y0 = self._array_link_breadths(source, target, width, node_y0)
+        target_order, link_y1 = self._array_link_breadths(target, source, width, node_y0)
+
+        # Populate the graph dictionaries expected by the plots
+        nodes = [{'index': idx, 'values': vals, 'sourceLinks': [], 'targetLinks': [],
+                  'value': v, 'depth': dp, 'height': h, 'x0': nx0, 'x1': nx1,
+                  'y0': ny0, 'y1': ny1}
+                 for idx, vals, v, dp, h, nx0, nx1, ny0, ny1 in zip(
+                         node_index, node_values, node_value.tolist(), depth.tolist(),
+                         height.tolist(), node_x0.tolist(), node_x1.tolist(),
+                         node_y0.tolist(), node_y1.tolist())]
+        links = [dict(index=i, source=nodes[s], target=nodes[t], value=v,
+                      width=w, y0=ly0, y1=ly1)
+                 for i, (s, t, v, w, ly0, ly1) in enumerate(zip(
+                         source.tolist(), target.tolist(), link_values,
+                         width.tolist(), link_y0.tolist(), link_y1.tolist()))]
+        for i in source_order.tolist():
+            links[i]['source']['sourceLinks'].append(links[i])
+        for i in target_order.tolist():
+            links[i]['target']['targetLinks'].append(links[i])
+        graph = {'nodes': nodes, 'links': links}
+
+        paths = self._array_paths(node_x1[source], link_y0, node_x0[target], link_y1, width)
+        return graph, paths
+
+    @classmethod
+    def _array_depths(cls, source, target, nnodes):
+        """
+        Assigns each node the length of the longest path leading to it
+        by propagating the frontier of all nodes along the links.
+        """
+        depth = np.zeros(nnodes, dtype='int64')
+        frontier = np.ones(nnodes, dtype=bool)
+        ndepths = 0
+        while frontier.any():
+            depth[frontier] = ndepths
+            next_frontier = np.zeros(nnodes, dtype=bool)
+            next_frontier[target[frontier[source]]] = True
+            frontier = next_frontier
+            ndepths += 1
+            if ndepths > 10000:
+                raise RecursionError('Sankey diagrams only support acyclic graphs.')
+        return depth, ndepths
+
+    def _array_node_breadths(self, source, target, value, node_value, node_x0,
+                             depth, has_source, has_target):
+        """
+        Computes the breadths (y-positions) of the nodes, relaxing and
+        resolving the collisions of all the nodes in a column at once.
+        Since the links always connect nodes in different columns the
+        nodes in a column are independent while relaxing.
+        """
+        nnodes = len(node_x0)
+        _, first, column = np.unique(node_x0, return_index=True, return_inverse=True)
+        rank = np.empty(len(first), dtype='int64')
+        rank[np.argsort(first)] = np.arange(len(first))
+        column = rank[column.ravel()]
+        by_column = np.argsort(column, kind='mergesort')
+        counts = np.bincount(column, minlength=len(first))
+        columns = np.split(by_column, np.cumsum(counts)[:-1]) if nnodes else []
+        position = np.empty(nnodes, dtype='int64')
+        for nodes in columns:
+            position[nodes] = np.arange(len(nodes))
+
+        _, y0, _, y1 = self.p.bounds
+        py = self.p.node_padding
+        if py is None:
+            max_depth = np.bincount(depth).max() - 1 if nnodes else 1
+            height = self.p.bounds[3] - self.p.bounds[1]
+            py = min((height * 0.1) / max_depth, 20) if max_depth else 20
+
+        # Initialize the node breadths
+        kys = [(y1 - y0 - (len(nodes)-1) * py) / np.sum(node_value[nodes])
+               for nodes in columns]
+        ky = np.min(kys) if len(kys) else np.nan
+        node_y0 = position.astype('float64')
+        node_y1 = node_y0 + node_value * ky
+        width = value * ky
+
+        # Group the links by the column of the node being relaxed, i.e.
+        # the target when relaxing left to right and the source when
+        # relaxing right to left
+        relax = []
+        for ends, others, linked in [(target, source, has_target), (source, target, has_source)]:
+            link_order = np.argsort(column[ends], kind='mergesort')
+            counts = np.bincount(column[ends], minlength=len(columns))
+            groups = []
+            for nodes, links in zip(columns, np.split(link_order, np.cumsum(counts)[:-1])):
+                pos = position[ends[links]]
+                total = np.bincount(pos, value[links], minlength=len(nodes))
+                mask = linked[nodes]
+                groups.append((nodes[mask], mask, pos, others[links], value[links], total[mask]))
+            relax.append(groups)
+
+        def relaxColumns(groups, alpha):
+            for nodes, mask, pos, others, val, total in groups:
+                if not len(nodes):
+                    continue
+                center = (node_y0[others] + node_y1[others]) / 2
+                weighted = np.bincount(pos, center * val, minlength=len(mask))[mask]
+                dy = (weighted/total - (node_y0[nodes] + node_y1[nodes]) / 2)*alpha
+                node_y0[nodes] += dy
+                node_y1[nodes] += dy
+
+        def resolveCollisions():
+            for c, nodes in enumerate(columns):
+                if self.p.node_sort and len(nodes) > 1:
+                    ys = node_y0[nodes]
+                    # The nodes are only reordered if not already in
+                    # ascending breadth according to the comparator
+                    if (np.diff(ys) <= -1).any():
+                        ys = ys.tolist()
+                        cmp = lambda a, b: int(ys[a] - ys[b])
+                        nodes = nodes[sorted(range(len(nodes)), key=cmp_to_key(cmp))]
+                        columns[c] = nodes
+                top, bottom = node_y0[nodes], node_y1[nodes]
+                offsets = np.concatenate([[0], np.cumsum(bottom - top + py)[:-1]])
+                start = np.maximum(np.maximum.accumulate(top - offsets), y0) + offsets
+                bottom = bottom + (start - top)
+                dy = bottom[-1] - y1
+                if dy > 0:
+                    end = start - offsets
+                    end[-1] -= dy
+                    end = np.minimum.accumulate(end[::-1])[::-1] + offsets
+                    bottom = bottom + (end - start)
+                    start = end
+                node_y0[nodes] = start
+                node_y1[nodes] = bottom
+
+        left_to_right, right_to_left = relax[0], relax[1][::-1]
+        resolveCollisions()
+        alpha = 1
+        for _ in range(self.p.iterations):
+            alpha = alpha*0.99
+            relaxColumns(right_to_left, alpha)
+            resolveCollisions()
+            relaxColumns(left_to_right, alpha)
+            resolveCollisions()
+        return node_y0, node_y1, width
+
+    @classmethod
+    def _array_link_breadths(cls, nodes, other, width, node_y0):
+        """
+        Sorts the links of each node by the breadth of the node on the
+        other end, returning the sorted link indexes and the breadth
+        at which each link is attached to the node.
+        """
+        order = np.argsort(nodes, kind='mergesort')
+        ys = node_y0[other[order]]
+        same = nodes[order][1:] == nodes[order][:-1]
+        unsorted = np.unique(nodes[order][1:][same & (np.diff(ys) <= -1)])
+        if len(unsorted):
+            ys = node_y0[other].tolist()
+            cmp = lambda a, b: int(ys[a] - ys[b]) | a - b
+            starts = np.searchsorted(nodes[order], unsorted)
+            ends = np.searchsorted(nodes[order], unsorted, side='right')
+            for start, end in zip(starts, ends):
+                order[start:end] = sorted(order[start:end].tolist(), key=cmp_to_key(cmp))
+        widths = width[order]
+        offsets = np.cumsum(widths) - widths
+        first = np.concatenate([[True], ~same]) if len(order) else np.array([], dtype=bool)
+        starts = np.maximum.accumulate(np.where(first, np.arange(len(order)), 0))
+        breadths = np.empty(len(order))
+        breadths[order] = node_y0[nodes[order]] + (offsets - offsets[starts])
+        return order, breadths
+
+    @classmethod
+    def _array_paths(cls, x0, y0, x1, y1, width, steps=50):
+        """
+        Computes the paths of all links at once, evaluating the same
+        bezier splines as quadratic_bezier.
+        """
+        steps = np.linspace(0, 1, steps)
+        x0, y0, x1, y1, width = (a[:, None] for a in (x0, y0, x1, y1, width))
+        xmid = (x0+x1)/2.
+
+        def bezier(sx, sy, ex, ey, cx0, cy0, cx1, cy1):
+            xs = ((1-steps)**3*sx + 3*((1-steps)**2)*steps*cx0 +
+                  3*(1-steps)*steps**2*cx1 + steps**3*ex)
+            ys = ((1-steps)**3*sy + 3*((1-steps)**2)*steps*cy0 +
+                  3*(1-steps)*steps**2*cy1 + steps**3*ey)
+            return np.stack([xs, ys], axis=-1)
+
+        start = np.stack([np.repeat(x0, 2, axis=1),
+                          np.concatenate([width+y0, y0], axis=1)], axis=-1)
+        bottom = bezier(x0, y0, x1, y1, xmid, y0, xmid, y1)
+        mid = np.stack([np.repeat(x1, 2, axis=1),
+                        np.concatenate([y1, y1+width], axis=1)], axis=-1)
+        top = bezier(x1, y1+width, x0, y0+width, xmid, y1+width, xmid, y0+width)
+        return list(np.concatenate([start, bottom, mid, top], axis=1))
+
 
 
 class Sankey(Graph):
@@ -249,3 +249,50 @@ class Selection1DExpr(Selection2DExpr):
             new = len(contiguous)
             data = contiguous
         return NdOverlay([(i, region1.last.clone(l, u)) for i, (l, u) in enumerate(data)])
+
+
+class SpatialIndexSelection(object):
+    """
+    Mixin class for point elements which uses a spatial index of the
+    x- and y-coordinates to apply bounding box selections and to find
+    the closest points if enabled with config.spatial_index.
+    """
+
+    def select(self, selection_expr=None, selection_specs=None, **selection):
+        specs = selection_specs
+        if specs is not None and not isinstance(specs, (list, tuple)):
+            specs = [specs]
+        if (util.config.spatial_index and selection_expr is None and
+            (specs is None or any(self.matches(sp) for sp in specs))):
+            from .util import spatial_select
+            indices = spatial_select(self, selection)
+            if indices is not None:
+                return self.iloc[indices]
+        return super(SpatialIndexSelection, self).select(
+            selection_expr, selection_specs, **selection)
+
+    def closest(self, coords=[], **kwargs):
+        """Snaps coordinate(s) to closest coordinate in the element
+
+        Supports snapping (x, y) coordinates to the closest point on
+        2D elements, using the spatial index if enabled.
+
+        Args:
+            coords: List of coordinates expressed as tuples
+            **kwargs: Coordinates defined as keyword pairs
+
+        Returns:
+            List of tuples of the snapped coordinates
+        """
+        if self.ndims < 2 or kwargs:
+            return super(SpatialIndexSelection, self).closest(coords, **kwargs)
+        from .util import spatial_index
+        xs, ys = (self.dimension_values(d) for d in self.kdims[:2])
+        index = spatial_index(self) if util.config.spatial_index else None
+        snapped = []
+        for x, y in coords:
+            idx = None if index is None else index.nearest(x, y)
+            if idx is None:
+                idx = np.nanargmin(np.hypot(xs-x, ys-y))
+            snapped.append((xs[idx], ys[idx]))
+        return snapped
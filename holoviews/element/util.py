@@ -288,12 +288,9 @@ def connect_edges_pd(graph):
     df = df.rename(columns={x.name: 'dst_x', y.name: 'dst_y'})
     df = df.sort_values('graph_edge_index').drop(['graph_edge_index'], axis=1)
 
-    edge_segments = []
-    for i, edge in df.iterrows():
-        start = edge['src_x'], edge['src_y']
-        end = edge['dst_x'], edge['dst_y']
-        edge_segments.append(np.array([start, end]))
-    return edge_segments
+    starts = df[['src_x', 'src_y']].values
+    ends = df[['dst_x', 'dst_y']].values
+    return list(np.stack([starts, ends], axis=1))
 
 
 def connect_tri_edges_pd(trimesh):
@@ -324,17 +321,161 @@ def connect_tri_edges_pd(trimesh):
 def connect_edges(graph):
     """
     Given a Graph element containing abstract edges compute edge
-    segments directly connecting the source and target nodes.  This
-    operation just uses internal HoloViews operations and will be a
-    lot slower than the pandas equivalent.
+    segments directly connecting the source and target nodes. The
+    node positions are looked up for all edges at once by searching
+    the sorted node indices.
     """
-    paths = []
-    for start, end in graph.array(graph.kdims):
-        start_ds = graph.nodes[:, :, start]
-        end_ds = graph.nodes[:, :, end]
-        if not len(start_ds) or not len(end_ds):
+    src_ids, tgt_ids = (graph.dimension_values(i) for i in range(2))
+    if not len(src_ids):
+        return []
+    nodes = graph.nodes
+    node_ids = nodes.dimension_values(2)
+    positions = nodes.array(nodes.kdims[:2])
+    if not len(node_ids):
+        raise ValueError('Could not find node positions for all edges')
+
+    order = np.argsort(node_ids, kind='mergesort')
+    sorted_ids = node_ids[order]
+    endpoints = []
+    for ids in (src_ids, tgt_ids):
+        indices = np.searchsorted(sorted_ids, ids).clip(0, len(sorted_ids)-1)
+        if not (sorted_ids[indices] == ids).all():
             raise ValueError('Could not find node positions for all edges')
-        start = start_ds.array(start_ds.kdims[:2])
-        end = end_ds.array(end_ds.kdims[:2])
-        paths.append(np.array([start[0], end[0]]))
-    return paths
+        endpoints.append(positions[order[indices]])
+    return list(np.stack(endpoints, axis=1))
+
+
+class SpatialIndex(object):
+    """
+    A grid bucket index of 2D points, which sorts the points by the
+    cell of a regular grid they fall into so that the points in a
+    range of cells can be looked up without scanning all points.
+    Points with non-finite coordinates are not indexed.
+    """
+
+    def __init__(self, xs, ys, points_per_cell=8):
+        self.xs = xs = np.asarray(xs, dtype='float64')
+        self.ys = ys = np.asarray(ys, dtype='float64')
+        valid = np.isfinite(xs) & np.isfinite(ys)
+        indices = np.flatnonzero(valid)
+        if len(indices):
+            vxs, vys = xs[indices], ys[indices]
+            self.x0, self.x1 = vxs.min(), vxs.max()
+            self.y0, self.y1 = vys.min(), vys.max()
+        else:
+            vxs = vys = indices
+            self.x0 = self.x1 = self.y0 = self.y1 = 0
+        self.nbins = max(int(np.sqrt(len(indices) / float(points_per_cell))), 1)
+        self.xstep = ((self.x1 - self.x0) / self.nbins) or 1
+        self.ystep = ((self.y1 - self.y0) / self.nbins) or 1
+        cells = self._cell(vys, self.y0, self.ystep)*self.nbins + self._cell(vxs, self.x0, self.xstep)
+        order = np.argsort(cells, kind='mergesort')
+        self.indices = indices[order]
+        counts = np.bincount(cells, minlength=self.nbins**2)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    def _cell(self, values, start, step):
+        cells = np.floor((np.asarray(values) - start) / step)
+        return np.clip(cells, 0, self.nbins-1).astype('int64')
+
+    def _candidates(self, ix0, ix1, iy0, iy1):
+        """
+        Returns the indices of the points in the supplied (inclusive)
+        range of cells.
+        """
+        starts = self.offsets[np.arange(iy0, iy1+1)*self.nbins + ix0]
+        ends = self.offsets[np.arange(iy0, iy1+1)*self.nbins + ix1 + 1]
+        if not len(starts):
+            return self.indices[:0]
+        return np.concatenate([self.indices[s:e] for s, e in zip(starts, ends)])
+
+    def query(self, x_range, y_range):
+        """
+        Returns the sorted indices of the points within the x- and
+        y-ranges, where the ranges include the lower bound but not the
+        upper bound, matching the semantics of Dataset.select. Either
+        bound may be None.
+        """
+        (xl, xu), (yl, yu) = x_range, y_range
+        xl = -np.inf if xl is None else xl
+        yl = -np.inf if yl is None else yl
+        xu = np.inf if xu is None else xu
+        yu = np.inf if yu is None else yu
+        if xl > self.x1 or xu < self.x0 or yl > self.y1 or yu < self.y0:
+            return self.indices[:0]
+        ix0, ix1 = self._cell([max(xl, self.x0), min(xu, self.x1)], self.x0, self.xstep)
+        iy0, iy1 = self._cell([max(yl, self.y0), min(yu, self.y1)], self.y0, self.ystep)
+        candidates = self._candidates(ix0, ix1, iy0, iy1)
+        xs, ys = self.xs[candidates], self.ys[candidates]
+        mask = (xl <= xs) & (xs < xu) & (yl <= ys) & (ys < yu)
+        return np.sort(candidates[mask])
+
+    def nearest(self, x, y):
+        """
+        Returns the index of the point closest to the supplied
+        coordinate or None if no points are indexed.
+        """
+        if not len(self.indices):
+            return None
+        ix, iy = self._cell([x], self.x0, self.xstep)[0], self._cell([y], self.y0, self.ystep)[0]
+        radius = 0
+        while True:
+            ix0, ix1 = max(ix-radius, 0), min(ix+radius, self.nbins-1)
+            iy0, iy1 = max(iy-radius, 0), min(iy+radius, self.nbins-1)
+            candidates = self._candidates(ix0, ix1, iy0, iy1)
+            covered = (ix0 == 0 and iy0 == 0 and ix1 == self.nbins-1 and iy1 == self.nbins-1)
+            if len(candidates):
+                distances = np.hypot(self.xs[candidates]-x, self.ys[candidates]-y)
+                closest = distances.argmin()
+                # Points outside the searched cells are at least as far
+                # away as the distance to the edge of the searched cells
+                margin = min(x - (self.x0 + ix0*self.xstep) if ix0 else np.inf,
+                             (self.x0 + (ix1+1)*self.xstep) - x if ix1 < self.nbins-1 else np.inf,
+                             y - (self.y0 + iy0*self.ystep) if iy0 else np.inf,
+                             (self.y0 + (iy1+1)*self.ystep) - y if iy1 < self.nbins-1 else np.inf)
+                if covered or distances[closest] <= margin:
+                    return candidates[closest]
+            radius += 1
+
+
+def spatial_index(element):
+    """
+    Returns a SpatialIndex of the first two dimensions of a columnar
+    element, which is built the first time it is requested and cached
+    on the element. Returns None if the coordinates are not numeric.
+    """
+    cached = getattr(element, '_spatial_index', None)
+    if cached is not None and cached[0] is element.data:
+        return cached[1]
+    xdim, ydim = element.dimensions()[:2]
+    xs, ys = element.dimension_values(xdim), element.dimension_values(ydim)
+    if xs.dtype.kind not in 'uif' or ys.dtype.kind not in 'uif':
+        return None
+    index = SpatialIndex(xs, ys)
+    element._spatial_index = (element.data, index)
+    return index
+
+
+def spatial_select(element, selection):
+    """
+    Applies a selection of ranges along the first two dimensions of an
+    element using its spatial index, returning the selected row
+    indices or None if the selection is not a pair of numeric ranges.
+    """
+    xdim, ydim = element.dimensions()[:2]
+    ranges = []
+    for d in (xdim, ydim):
+        sel = selection.get(d.name, selection.get(d.label))
+        if isinstance(sel, slice) and sel.step is None:
+            sel = (sel.start, sel.stop)
+        if not (isinstance(sel, tuple) and len(sel) == 2 and
+                all(v is None or (np.isscalar(v) and np.asarray(v).dtype.kind in 'uif')
+                    for v in sel)):
+            return None
+        ranges.append(sel)
+    if len(selection) != 2:
+        return None
+    index = spatial_index(element)
+    if index is None:
+        return None
+    return index.query(*ranges)
@@ -1,9 +1,11 @@
 from __future__ import absolute_import, division
 
 import warnings
+import weakref
 
-from collections import Callable
+from collections import Callable, deque
 from functools import partial
+from threading import Lock
 
 import param
 import numpy as np
@@ -33,6 +35,7 @@ from ..element import (Image, Path, Curve, RGB, Graph, TriMesh,
                        Segments, Scatter, Points, Polygons)
 from ..element.util import connect_tri_edges_pd
 from ..streams import RangeXY, PlotSize
+from .element import block_downsample
 
 ds_version = LooseVersion(ds.__version__)
 
@@ -227,6 +230,15 @@ class AggregationOperation(ResamplingOperation):
         no column is defined the first value dimension of the element
         will be used. May also be defined as a string.""")
 
+    incremental = param.Boolean(default=False, doc="""
+        Whether to update the aggregate incrementally when the input
+        is a DynamicMap fed by a Buffer stream, adding the aggregate
+        of each newly streamed chunk and subtracting the aggregate of
+        the rows evicted from the window instead of aggregating the
+        whole window. Only supported for count and sum aggregates of
+        Points and Scatter elements with an explicit x_range and
+        y_range, otherwise the whole window is aggregated.""")
+
     _agg_methods = {
         'any':   rd.any,
         'count': rd.count,
@@ -463,6 +475,82 @@ class aggregate(AggregationOperation):
             return NdOverlay(layers, kdims=[data.get_dimension(agg_fn.column)])
 
 
+    def _process_accumulate(self, element, key=None):
+        ret = self._process(element, key)
+        agg_fn = self._get_aggregator(element)
+        if (type(agg_fn) not in (ds.count, ds.sum) or not isinstance(element, (Points, Scatter))
+            or isinstance(ret, NdOverlay) or not (self.p.x_range and self.p.y_range)
+            or self.p.precompute or element.interface is DaskInterface):
+            return ret, None
+        x, y = element.dimensions()[:2]
+        (x_range, y_range), _, (width, height), (xtype, ytype) = self._get_sampling(element, x, y)
+        if 'datetime' in (xtype, ytype) or not (width and height):
+            return ret, None
+
+        # Retain a copy of the rows to subtract them once evicted
+        columns = [x.name, y.name] + ([agg_fn.column] if agg_fn.column else [])
+        df = PandasInterface.as_dframe(element)[columns].copy()
+        cvs = ds.Canvas(plot_width=width, plot_height=height,
+                        x_range=x_range, y_range=y_range)
+        vdim = ret.vdims[0].name
+        values = ret.data[vdim].transpose(y.name, x.name).values
+        valid = None
+        if isinstance(agg_fn, ds.sum):
+            # Sums of bins without valid values are masked as NaN
+            valid = cvs.points(df, x.name, y.name, ds.count(agg_fn.column)).values.astype('int64')
+            values = np.nan_to_num(values).astype('float64')
+        else:
+            values = values.astype('int64')
+        accumulator = dict(canvas=cvs, columns=columns, agg_fn=agg_fn, result=ret,
+                           values=values, valid=valid, chunks=deque([df]))
+        return ret, accumulator
+
+
+    def _process_chunk(self, element, key, accumulator, chunk, evicted):
+        cvs, agg_fn, chunks = accumulator['canvas'], accumulator['agg_fn'], accumulator['chunks']
+        columns = accumulator['columns']
+        x, y = columns[:2]
+
+        # Pop the rows evicted from the start of the window
+        removed = []
+        while evicted:
+            df = chunks[0]
+            if len(df) > evicted:
+                chunks[0], df = df.iloc[evicted:], df.iloc[:evicted]
+            else:
+                chunks.popleft()
+            removed.append(df)
+            evicted -= len(df)
+        df = PandasInterface.as_dframe(chunk)[columns].copy()
+        chunks.append(df)
+
+        frames = [(df, 1)]
+        if removed:
+            frames.append((pd.concat(removed), -1))
+        values, valid = accumulator['values'], accumulator['valid']
+        for frame, sign in frames:
+            if not len(frame):
+                continue
+            agg = cvs.points(frame, x, y, agg_fn).values
+            if valid is None:
+                values += sign*agg.astype('int64')
+            else:
+                values += sign*np.nan_to_num(agg)
+                counts = cvs.points(frame, x, y, ds.count(agg_fn.column)).values
+                valid += sign*counts.astype('int64')
+
+        ret = accumulator['result']
+        vdim = ret.vdims[0].name
+        agg = ret.data[vdim]
+        if valid is None:
+            result = values.astype(agg.dtype)
+        else:
+            result = values.copy()
+            result[valid == 0] = np.nan
+        data = ret.data.assign(**{vdim: ((y, x), result)})
+        return ret.clone(data)
+
+
 
 class overlay_aggregate(aggregate):
     """
@@ -801,6 +889,74 @@ class regrid(AggregationOperation):
         the width and height are clipped to what is available on the
         source array.""")
 
+    pyramid = param.Boolean(default=False, doc="""
+        Whether to regrid from a multi-resolution pyramid of the
+        source array. The levels of the pyramid are downsampled by
+        powers of two, built lazily and cached, and each regridding
+        uses the coarsest level which still provides at least one
+        sample per output pixel, so the output is unchanged at full
+        zoom. Only applies to mean, min and max aggregators on
+        regularly sampled, numeric coordinates.""")
+
+    # The number of elements for which pyramid levels are cached,
+    # shared by all instances and discarding the least recently used
+    # elements first
+    pyramid_cache_size = 4
+
+    # LRU cache of weak references to the element data and its
+    # pyramid levels indexed by the element _plot_id
+    _pyramid_cache = OrderedDict()
+
+    _pyramid_lock = Lock()
+
+    _pyramid_aggregators = [(rd.mean, 'mean'), (rd.min, 'min'), (rd.max, 'max')]
+
+    def _get_pyramid_level(self, element, agg_fn, x_range, y_range, width, height):
+        """
+        Returns the coarsest pyramid level of the element with at
+        least width x height samples across the supplied ranges.
+        """
+        aggregator = [name for agg_type, name in self._pyramid_aggregators
+                      if type(agg_fn) is agg_type]
+        if not aggregator or not width or not height:
+            return element
+
+        ny, nx = element.interface.shape(element, gridded=True)[:2]
+        factors = []
+        for n, (start, end), (low, high), pixels in zip(
+                (ny, nx), (y_range, x_range), (element.range(1), element.range(0)),
+                (height, width)):
+            span = float(high-low)
+            nview = n * min((end-start)/span, 1) if span > 0 else n
+            factors.append(2**int(np.log2(nview/pixels)) if nview >= 2*pixels else 1)
+        factors = tuple(factors)
+        if factors == (1, 1):
+            return element
+
+        # Hold weak references to the data, or to the values of
+        # dictionaries, which cannot be weakly referenced
+        data = element.data
+        values = list(data.values()) if isinstance(data, dict) else [data]
+        try:
+            refs = [weakref.ref(v) for v in values]
+        except TypeError:
+            return block_downsample(element, factors, aggregator[0])
+
+        cache = self._pyramid_cache
+        with self._pyramid_lock:
+            cached_refs, levels = cache.pop(element._plot_id, ([], {}))
+            if (len(cached_refs) != len(values) or
+                any(ref() is not v for ref, v in zip(cached_refs, values))):
+                levels = {}
+            cache[element._plot_id] = (refs, levels)
+            while len(cache) > type(self).pyramid_cache_size:
+                cache.popitem(last=False)
+
+        key = (aggregator[0], factors)
+        if key not in levels:
+            levels[key] = block_downsample(element, factors, aggregator[0])
+        return levels[key]
+
     def _get_xarrays(self, element, coords, xtype, ytype):
         x, y = element.kdims
         dims = [y.name, x.name]
@@ -886,10 +1042,21 @@ class regrid(AggregationOperation):
         cvs = ds.Canvas(plot_width=width, plot_height=height,
                         x_range=x_range, y_range=y_range)
 
+        agg_fn = self._get_aggregator(element, add_field=False)
+        irregular = any(element.interface.irregular(element, d)
+                        for d in element.kdims)
+        if (self.p.pyramid and not irregular and 'datetime' not in (xtype, ytype)
+            and self.p.target is None):
+            level = self._get_pyramid_level(element, agg_fn, x_range, y_range,
+                                            width, height)
+            if level is not element:
+                element = level
+                coords = tuple(element.dimension_values(d, expanded=False)
+                               for d in [x, y])
+
         # Apply regridding to each value dimension
         regridded = {}
         arrays = self._get_xarrays(element, coords, xtype, ytype)
-        agg_fn = self._get_aggregator(element, add_field=False)
         for vd, xarr in arrays.items():
             rarray = cvs.raster(xarr, upsample_method=interp,
                                 downsample_method=agg_fn)
@@ -1389,6 +1556,9 @@ class rasterize(AggregationOperation):
                    (type(None), shade) # To handle parameters of datashade
     ]
 
+    # Operations retained to process the elements of a Buffer stream
+    _buffered_ops = None
+
     def _process(self, element, key=None):
         # Potentially needs traverse to find element types first?
         all_allowed_kws = set()
@@ -1409,10 +1579,23 @@ class rasterize(AggregationOperation):
             all_supplied_kws |= set(extended_kws)
             all_allowed_kws |= set(transform.param)
             # Collect union set of consumed. Versus union of available.
-            op = transform.instance(**{k:v for k,v in extended_kws.items()
-                                       if k in transform.param})
-            op._precomputed = self._precomputed
-            element = element.map(op, predicate)
+            op_kws = {k:v for k,v in extended_kws.items() if k in transform.param}
+            if (self._buffer is not None and self.p.incremental and
+                'incremental' in transform.param):
+                # Retain the operation to update the result incrementally
+                if self._buffered_ops is None:
+                    self._buffered_ops = {}
+                op = self._buffered_ops.get(transform)
+                if op is None:
+                    op = self._buffered_ops[transform] = transform.instance()
+                op._buffer = self._buffer
+                op._precomputed = self._precomputed
+                element = element.map(partial(op.process_element, key=key, **op_kws),
+                                      predicate)
+            else:
+                op = transform.instance(**op_kws)
+                op._precomputed = self._precomputed
+                element = element.map(op, predicate)
             self._precomputed = op._precomputed
 
         unused_params = list(all_supplied_kws - all_allowed_kws)
@@ -4,22 +4,26 @@ examples.
 """
 from __future__ import division
 
+from collections import deque
+
 import numpy as np
 
 import param
 from param import _is_number
 
-from ..core import (Operation, NdOverlay, Overlay, GridMatrix,
+from ..core import (Operation, NdOverlay, Overlay, GridMatrix, Layout,
                     HoloMap, Dataset, Element, Collator, Dimension)
 from ..core.data import ArrayInterface, DictInterface, default_datatype
-from ..core.util import (group_sanitizer, label_sanitizer, pd,
+from ..core.util import (config, group_sanitizer, label_sanitizer, pd,
                          basestring, datetime_types, isfinite, dt_to_int,
-                         isdatetime, is_dask_array)
+                         isdatetime, is_dask_array, dimension_range,
+                         finite_ranges, uniform_bin_counts)
 from ..element.chart import Histogram, Scatter
-from ..element.raster import Image, RGB
+from ..element.raster import Image, RGB, QuadMesh
 from ..element.path import Contours, Polygons
 from ..element.util import categorical_aggregate2d # noqa (API import)
-from ..streams import RangeXY
+from ..element.util import spatial_select
+from ..streams import RangeXY, PlotSize
 
 column_interfaces = [ArrayInterface, DictInterface]
 if pd:
@@ -646,12 +650,29 @@ class histogram(Operation):
     dimension = param.String(default=None, doc="""
       Along which dimension of the Element to compute the histogram.""")
 
+    dimensions = param.List(default=None, doc="""
+      Computes histograms along each of the listed dimensions of the
+      Element, returning a Layout of Histograms. The data ranges and
+      bin counts of all dimensions are computed in shared passes over
+      the data.""")
+
     frequency_label = param.String(default=None, doc="""
       Format string defining the label of the frequency dimension of the Histogram.""")
 
     groupby = param.ClassSelector(default=None, class_=(basestring, Dimension), doc="""
       Defines a dimension to group the Histogram returning an NdOverlay of Histograms.""")
 
+    incremental = param.Boolean(default=False, doc="""
+      Whether to update the Histogram incrementally when the input is
+      a DynamicMap fed by a Buffer stream, adding the counts of each
+      newly streamed chunk and subtracting the counts of the rows
+      evicted from the window instead of recomputing the counts over
+      the whole window. As when the operation is applied dynamically
+      without incremental updates, the bins computed for the first
+      window are reused for all subsequent windows. Only supported
+      for uniform bins and not in combination with groupby or
+      dimensions.""")
+
     log = param.Boolean(default=False, doc="""
       Whether to use base 10 logarithmic samples for the bin edges.""")
 
@@ -687,17 +708,175 @@ class histogram(Operation):
             self.p.groupby = None
             return grouped.map(self._process, Dataset)
 
-        if self.p.dimension:
+        if self.p.dimensions:
+            return Layout(self._histograms(element, self.p.dimensions))
+        elif self.p.dimension:
             selected_dim = self.p.dimension
         else:
             selected_dim = [d.name for d in element.vdims + element.kdims][0]
-        dim = element.get_dimension(selected_dim)
-
+        return self._histograms(element, [selected_dim])[0]
+
+    def _process_accumulate(self, element, key=None):
+        if self.p.groupby or self.p.dimensions:
+            return self._process(element, key), None
+        dim = element.get_dimension(self.p.dimension or
+                                    [d.name for d in element.vdims + element.kdims][0])
+        (data, weights, is_dt, edges, hist, hist_mean), = self._counts(element, [dim])
+        ret = self._histogram(element, dim, edges, hist.copy(),
+                              None if hist_mean is None else hist_mean.copy(), is_dt)
+        # The counts in uniform bins may be updated by the chunked kernel
+        uniform = (len(edges) > 1 and edges[-1] > edges[0] and
+                   np.array_equal(edges, np.linspace(edges[0], edges[-1], len(edges))))
+        if is_dt or is_dask_array(data) or not uniform:
+            return ret, None
+
+        # Retain a copy of the values to subtract them once evicted
+        values = (np.array(data), None if weights is None else np.array(weights))
+        accumulator = dict(dim=dim, edges=edges, hist=hist, hist_mean=hist_mean,
+                           chunks=deque([values]))
+        return ret, accumulator
+
+    def _process_chunk(self, element, key, accumulator, chunk, evicted):
+        dim, chunks = accumulator['dim'], accumulator['chunks']
+        data, weights = np.array(self._values(chunk, dim)), None
+        if self.p.weight_dimension:
+            weights = np.array(self._values(chunk, self.p.weight_dimension))
+
+        # Pop the values evicted from the start of the window
+        removed = []
+        while evicted:
+            values, w = chunks[0]
+            if len(values) > evicted:
+                chunks[0] = (values[evicted:], None if w is None else w[evicted:])
+                values, w = values[:evicted], None if w is None else w[:evicted]
+            else:
+                chunks.popleft()
+            removed.append((values, w))
+            evicted -= len(values)
+        chunks.append((data, weights))
+        evicted = np.concatenate([v for v, _ in removed]) if removed else data[:0]
+        evicted_weights = None
+        if weights is not None:
+            evicted_weights = np.concatenate([w for _, w in removed]) if removed else weights[:0]
+
+        edges, hist, hist_mean = accumulator['edges'], accumulator['hist'], accumulator['hist_mean']
+        columns, col_weights = [data, evicted], [weights, evicted_weights]
+        if hist_mean is not None:
+            columns, col_weights = columns*2, col_weights+[None, None]
+        counts = uniform_bin_counts(columns, [(edges[0], edges[-1])]*len(columns),
+                                    len(edges)-1, col_weights, self.p.nonzero)
+        hist += counts[0] - counts[1]
+        if hist_mean is not None:
+            hist_mean += counts[2] - counts[3]
+            hist_mean = hist_mean.copy()
+        return self._histogram(element, dim, edges, hist.copy(), hist_mean, False)
+
+    def _values(self, element, dimension):
         if hasattr(element, 'interface'):
-            data = element.interface.values(element, selected_dim, compute=False)
-        else:
-            data = element.dimension_values(selected_dim)
+            return element.interface.values(element, dimension, compute=False)
+        return element.dimension_values(dimension)
+
+    def _fused_range(self, element, dim, datetimes):
+        """
+        Whether the range along the dimension should be computed from
+        the data by the finite_ranges kernel rather than Element.range.
+        """
+        return not (self.p.bin_range or datetimes or not hasattr(element, 'interface') or
+                    all(isfinite(r) for r in dim.range) or
+                    (getattr(element, '_binned', False) and dim in element.kdims))
+
+    def _histograms(self, element, dimensions):
+        """
+        Computes histograms along each of the supplied dimensions.
+        """
+        dims = [element.get_dimension(d) for d in dimensions]
+        return [self._histogram(element, d, edges, hist, hist_mean, is_dt)
+                for d, (_, _, is_dt, edges, hist, hist_mean)
+                in zip(dims, self._counts(element, dims))]
+
+    def _counts(self, element, dims):
+        """
+        Computes the bin counts along each of the supplied dimensions,
+        returning a tuple of the values, weights, whether the values
+        are datetimes, the bin edges, the counts and the unweighted
+        counts for each dimension. The data ranges and the counts for
+        uniform bins of all dimensions are each computed in a single
+        chunked pass over the data.
+        """
+        weights = None
+        if self.p.weight_dimension:
+            weights = self._values(element, self.p.weight_dimension)
+
+        columns, col_weights, datetimes = [], [], []
+        for d in dims:
+            data, w = self._values(element, d), weights
+            is_dt = isdatetime(data)
+            if is_dt:
+                mask = isfinite(data)
+                data = data[mask].astype('datetime64[ns]').astype('int64')
+                w = None if w is None else w[mask]
+            columns.append(data)
+            col_weights.append(w)
+            datetimes.append(is_dt)
+
+        # Compute the data ranges which are required in a single pass
+        ranges = [self.p.bin_range]*len(dims)
+        fused = [i for i, (d, is_dt) in enumerate(zip(dims, datetimes))
+                 if self._fused_range(element, d, is_dt)]
+        for i, (lower, upper) in zip(fused, finite_ranges([columns[i] for i in fused])):
+            ranges[i] = dimension_range(lower, upper, dims[i].range, dims[i].soft_range)
+
+        edges, uniform = [], []
+        steps = self.p.num_bins + 1
+        for i, (d, data, is_dt) in enumerate(zip(dims, columns, datetimes)):
+            hist_range = ranges[i] or element.range(d)
+            # Avoids range issues including zero bin range and empty bins
+            if hist_range == (0, 0) or any(not isfinite(r) for r in hist_range):
+                hist_range = (0, 1)
+            start, end = hist_range
+            if is_dt:
+                start, end = dt_to_int(start, 'ns'), dt_to_int(end, 'ns')
+
+            if self.p.bins:
+                bins = np.asarray(self.p.bins)
+                edges.append(bins.astype('datetime64[ns]').astype('int64') if is_dt else bins)
+            elif self.p.log:
+                positive = data[isfinite(data) & (data > 0)]
+                bin_min = max([abs(start), positive.min()])
+                edges.append(np.logspace(np.log10(bin_min), np.log10(end), steps))
+            else:
+                edges.append(np.linspace(start, end, steps))
+                if end > start:
+                    uniform.append(i)
+
+        # Count the values in uniform bins with direct index arithmetic,
+        # computing the unweighted counts for mean weighting alongside
+        mean_weighted = self.p.mean_weighted and self.p.weight_dimension
+        batch = uniform + (uniform if mean_weighted else [])
+        batch_weights = ([col_weights[i] for i in uniform] +
+                         [None for i in uniform if mean_weighted])
+        counts = uniform_bin_counts([columns[i] for i in batch],
+                                    [(edges[i][0], edges[i][-1]) for i in batch],
+                                    self.p.num_bins, batch_weights, self.p.nonzero,
+                                    compute=False)
+        uniform_counts = dict(zip(uniform, counts))
+        unweighted = dict(zip(uniform, counts[len(uniform):]))
+
+        counts = []
+        for i, (data, is_dt) in enumerate(zip(columns, datetimes)):
+            if i in uniform_counts:
+                hist, hist_mean = uniform_counts[i], unweighted.get(i)
+            else:
+                hist, hist_mean = self._bin_counts(data, col_weights[i], edges[i])
+            counts.append((data, col_weights[i], is_dt, edges[i], hist, hist_mean))
+        return counts
 
+    def _bin_counts(self, data, weights, edges):
+        """
+        Counts the finite values in arbitrary bins using np.histogram
+        or dask.array.histogram, returning the counts and the
+        unweighted counts if mean weighting is enabled.
+        """
         if is_dask_array(data):
             import dask.array as da
             histogram = da.histogram
@@ -708,58 +887,33 @@ class histogram(Operation):
         if self.p.nonzero:
             mask = mask & (data > 0)
         data = data[mask]
-        if self.p.weight_dimension:
-            if hasattr(element, 'interface'):
-                weights = element.interface.values(element, self.p.weight_dimension, compute=False)
-            else:
-                weights = element.dimension_values(self.p.weight_dimension)
-            if self.p.nonzero:
-                weights = weights[mask]
-        else:
-            weights = None
-
-        hist_range = self.p.bin_range or element.range(selected_dim)
-        # Avoids range issues including zero bin range and empty bins
-        if hist_range == (0, 0) or any(not isfinite(r) for r in hist_range):
-            hist_range = (0, 1)
-
-        datetimes = False
-        bins = None if self.p.bins is None else np.asarray(self.p.bins)
-        steps = self.p.num_bins + 1
-        start, end = hist_range
-        if isdatetime(data):
-            start, end = dt_to_int(start, 'ns'), dt_to_int(end, 'ns')
-            datetimes = True
-            data = data.astype('datetime64[ns]').astype('int64')
-            if bins is not None:
-                bins = bins.astype('datetime64[ns]').astype('int64')
-            else:
-                hist_range = start, end
-
-        if self.p.bins:
-            edges = bins
-        elif self.p.log:
-            bin_min = max([abs(start), data[data>0].min()])
-            edges = np.logspace(np.log10(bin_min), np.log10(end), steps)
-        else:
-            edges = np.linspace(start, end, steps)
+        if weights is not None:
+            weights = weights[mask]
+
+        hist_mean = None
+        if not (is_dask_array(data) or len(data)):
+            hist = np.zeros(len(edges)-1)
+            return hist, (hist if self.p.mean_weighted and weights is not None else None)
+        hist, _ = histogram(data, weights=weights, bins=edges)
+        if self.p.mean_weighted and weights is not None:
+            hist_mean, _ = histogram(data, bins=edges)
+        return hist, hist_mean
+
+    def _histogram(self, element, dim, edges, hist, hist_mean, datetimes):
+        """
+        Normalizes the counts and constructs the Histogram.
+        """
         normed = False if self.p.mean_weighted and self.p.weight_dimension else self.p.normed
-
-        if is_dask_array(data) or len(data):
+        with np.errstate(invalid='ignore', divide='ignore'):
             if normed:
                 # This covers True, 'height', 'integral'
-                hist, edges = histogram(data, density=True,
-                                        weights=weights, bins=edges)
+                hist = hist / np.diff(edges).astype('float64') / hist.sum()
                 if normed == 'height':
                     hist /= hist.max()
-            else:
-                hist, edges = histogram(data, normed=normed, weights=weights, bins=edges)
-                if self.p.weight_dimension and self.p.mean_weighted:
-                    hist_mean, _ = histogram(data, density=False, bins=self.p.num_bins)
-                    hist /= hist_mean
-        else:
-            hist = np.zeros(self.p.num_bins)
-        hist[np.isnan(hist)] = 0
+            elif hist_mean is not None:
+                hist = hist / hist_mean
+        if hist.dtype.kind == 'f':
+            hist[np.isnan(hist)] = 0
         if datetimes:
             edges = (edges/1e3).astype('datetime64[us]')
 
@@ -786,8 +940,7 @@ class histogram(Operation):
         # is used to compute another histogram, it will default to the same
         # bin edges.
         self.bins = list(edges)
-        return Histogram((edges, hist), kdims=[element.get_dimension(selected_dim)],
-                         label=element.label, **params)
+        return Histogram((edges, hist), kdims=[dim], label=element.label, **params)
 
 
 class decimate(Operation):
@@ -837,8 +990,16 @@ class decimate(Operation):
 
         # Slice element to current ranges
         xdim, ydim = element.dimensions(label=True)[0:2]
-        sliced = element.select(**{xdim: (xstart, xend),
-                                   ydim: (ystart, yend)})
+        selection = {xdim: (xstart, xend), ydim: (ystart, yend)}
+        indices = spatial_select(element, selection) if config.spatial_index else None
+        if indices is None:
+            sliced = element.select(**selection)
+        elif len(indices) > self.p.max_samples:
+            # Sample the indices before slicing the element
+            prng = np.random.RandomState(self.p.random_seed)
+            return element.iloc[indices[prng.choice(len(indices), self.p.max_samples, False)]]
+        else:
+            return element.iloc[indices]
 
         if len(sliced) > self.p.max_samples:
             prng = np.random.RandomState(self.p.random_seed)
@@ -849,6 +1010,173 @@ class decimate(Operation):
         return element.map(self._process_layer, Element)
 
 
+def block_reduce(array, factors, aggregator='mean'):
+    """
+    Reduces non-overlapping blocks of a 2D array, where the factors
+    define the (rows, columns) shape of each block. Trailing blocks
+    are padded if the shape of the array is not divisible by the
+    factors. NaNs are ignored by all aggregators except 'first',
+    which simply subsamples the array.
+    """
+    fy, fx = factors
+    if aggregator == 'first' or array.dtype.kind not in 'buif':
+        return array[::fy, ::fx]
+    ny, nx = array.shape
+    py, px = -ny % fy, -nx % fx
+    shape = ((ny+py)//fy, fy, (nx+px)//fx, fx)
+    if aggregator == 'mean':
+        if array.dtype.kind != 'f':
+            array = array.astype('float64')
+        padded = np.pad(array, ((0, py), (0, px)), mode='constant',
+                        constant_values=np.nan).reshape(shape)
+        valid = ~np.isnan(padded)
+        sums = np.where(valid, padded, 0).sum(axis=(1, 3))
+        counts = valid.sum(axis=(1, 3))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (sums / counts).astype(array.dtype)
+    # Padding with the edge values does not affect the min or max
+    padded = np.pad(array, ((0, py), (0, px)), mode='edge').reshape(shape)
+    ufunc = np.fmin if aggregator == 'min' else np.fmax
+    return ufunc.reduce(ufunc.reduce(padded, axis=3), axis=1)
+
+
+def block_downsample(element, factors, aggregator='mean'):
+    """
+    Downsamples an Image or a regularly gridded QuadMesh by reducing
+    blocks of (y, x) factors samples of each value dimension with
+    block_reduce, returning a clone of the element.
+    """
+    xdim, ydim = element.kdims
+    arrays = [block_reduce(element.dimension_values(vd, flat=False),
+                           factors, aggregator)
+              for vd in element.vdims]
+    if isinstance(element, RGB) and aggregator == 'mean':
+        dtypes = [element.interface.dtype(element, vd) for vd in element.vdims]
+        arrays = [arr if dt.kind == 'f' else np.rint(arr).astype(dt)
+                  for arr, dt in zip(arrays, dtypes)]
+    ny, nx = arrays[0].shape
+    fy, fx = factors
+    if isinstance(element, Image):
+        l, b, r, t = element.bounds.lbrt()
+        shape = element.interface.shape(element, gridded=True)
+        xstep = (r-l) / float(shape[1]) * fx
+        ystep = (t-b) / float(shape[0]) * fy
+        xs = l + (np.arange(nx)+0.5) * xstep
+        ys = b + (np.arange(ny)+0.5) * ystep
+        bounds = (l, b, l+nx*xstep, b+ny*ystep)
+        return element.clone((xs, ys)+tuple(arrays), bounds=bounds)
+    xedges, yedges = [element.interface.coords(element, d, ordered=True, edges=True)
+                      for d in (xdim, ydim)]
+    xedges = xedges[np.minimum(np.arange(nx+1)*fx, len(xedges)-1)]
+    yedges = yedges[np.minimum(np.arange(ny+1)*fy, len(yedges)-1)]
+    return element.clone((xedges, yedges)+tuple(arrays))
+
+
+class downsample_image(Operation):
+    """
+    Downsamples an Image or a regularly gridded QuadMesh to roughly
+    the resolution of the plot by aggregating blocks of samples,
+    avoiding sending the full resolution array to the browser. Unlike
+    the datashader based regrid operation it only depends on NumPy.
+
+    The block size is always a power of two, so each downsampled
+    level of the input is computed once and cached, and then sliced
+    to the current x_range and y_range. By default the operation
+    returns a DynamicMap with PlotSize and RangeXY streams, updating
+    the level as the plot is resized and zoomed.
+    """
+
+    aggregator = param.ObjectSelector(default='mean', objects=[
+        'mean', 'min', 'max', 'first'], doc="""
+        Aggregation applied to each block of samples, 'first' simply
+        subsamples the data.""")
+
+    dynamic = param.Boolean(default=True, doc="""
+       Enables dynamic processing by default.""")
+
+    link_inputs = param.Boolean(default=True, doc="""
+         By default, the link_inputs parameter is set to True so that
+         when applying the operation, backends that support linked
+         streams update RangeXY streams on the inputs of the
+         operation.""")
+
+    height = param.Integer(default=400, doc="""
+       The height of the plot in pixels.""")
+
+    width = param.Integer(default=400, doc="""
+       The width of the plot in pixels.""")
+
+    streams = param.List(default=[PlotSize, RangeXY], doc="""
+        List of streams that are applied if dynamic=True, allowing
+        for dynamic interaction with the plot.""")
+
+    x_range  = param.Tuple(default=None, length=2, doc="""
+       The x_range as a tuple of min and max x-value. Auto-ranges
+       if set to None.""")
+
+    y_range  = param.Tuple(default=None, length=2, doc="""
+       The y_range as a tuple of min and max y-value. Auto-ranges
+       if set to None.""")
+
+    _per_element = True
+
+    # The most recent input and its cached downsampled levels
+    _levels = (None, {})
+
+    @classmethod
+    def _block_factor(cls, nsamples, span, view_range, pixels):
+        """
+        Returns the power of two block size which reduces the number
+        of samples in the viewport to at most the number of pixels.
+        """
+        if view_range is not None and span:
+            start, end = view_range
+            if isinstance(start, datetime_types) or isinstance(end, datetime_types):
+                start, end = dt_to_int(start, 'ns'), dt_to_int(end, 'ns')
+            if isfinite(start) and isfinite(end):
+                nsamples = nsamples * min(abs(end-start) / float(span), 1)
+        if not pixels or nsamples <= pixels:
+            return 1
+        return 2**int(np.ceil(np.log2(nsamples / float(pixels))))
+
+    def _process(self, element, key=None):
+        if not isinstance(element, (Image, QuadMesh)):
+            return element
+        elif isinstance(element, QuadMesh) and (element.interface.irregular(element, element.kdims[0]) or
+                                              element.interface.irregular(element, element.kdims[1])):
+            return element
+
+        xdim, ydim = element.kdims
+        ny, nx = element.interface.shape(element, gridded=True)[:2]
+        (x0, x1), (y0, y1) = element.range(xdim), element.range(ydim)
+        if isinstance(x0, datetime_types):
+            x0, x1 = dt_to_int(x0, 'ns'), dt_to_int(x1, 'ns')
+        if isinstance(y0, datetime_types):
+            y0, y1 = dt_to_int(y0, 'ns'), dt_to_int(y1, 'ns')
+        factors = (self._block_factor(ny, y1-y0, self.p.y_range, self.p.height),
+                   self._block_factor(nx, x1-x0, self.p.x_range, self.p.width))
+
+        # Cache the downsampled levels of the most recent input
+        source, levels = self._levels
+        if source is not element:
+            levels = {}
+            self._levels = (element, levels)
+        if factors == (1, 1):
+            downsampled = element
+        elif factors in levels:
+            downsampled = levels[factors]
+        else:
+            downsampled = levels[factors] = block_downsample(
+                element, factors, self.p.aggregator)
+
+        selection = {}
+        if self.p.x_range and None not in self.p.x_range:
+            selection[xdim.name] = self.p.x_range
+        if self.p.y_range and None not in self.p.y_range:
+            selection[ydim.name] = self.p.y_range
+        return downsampled.select(**selection) if selection else downsampled
+
+
 class interpolate_curve(Operation):
     """
     Resamples a Curve using the defined interpolation method, e.g.
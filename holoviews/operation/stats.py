@@ -20,6 +20,107 @@ def _kde_support(bin_range, bw, gridsize, cut, clip):
     return np.linspace(kmin, kmax, gridsize)
 
 
+def _fft_convolve(array, kernel):
+    """
+    Computes the full linear convolution of two N-D arrays using
+    real FFTs, padding to avoid circular wrap-around.
+    """
+    shape = [a+k-1 for a, k in zip(array.shape, kernel.shape)]
+    fshape = [int(2**np.ceil(np.log2(n))) for n in shape]
+    axes = list(range(array.ndim))
+    conv = np.fft.irfftn(np.fft.rfftn(array, fshape, axes=axes) *
+                         np.fft.rfftn(kernel, fshape, axes=axes), fshape, axes=axes)
+    return conv[tuple(slice(0, n) for n in shape)]
+
+
+def _kde_covariance(data, bandwidth=None):
+    """
+    Computes the kernel covariance matching scipy.stats.gaussian_kde
+    for samples of shape (ndims, nsamples), using Scott's rule unless
+    an explicit bandwidth factor is supplied.
+    """
+    ndim, n = data.shape
+    factor = bandwidth or n**(-1./(ndim+4))
+    return np.atleast_2d(np.cov(data, ddof=1)) * factor**2
+
+
+def binned_kde(data, grids, covariance, truncate=5, max_step=0.2):
+    """
+    Approximates a Gaussian kernel density estimate of N-D samples
+    (in the format of scipy.stats.gaussian_kde, with shape (ndims,
+    nsamples)) on a regular grid, defined by a list of evenly spaced
+    coordinates along each dimension. The samples are linearly
+    binned onto the grid (extended to cover the kernel support), which
+    is then convolved with the Gaussian kernel using FFTs, reducing
+    the cost from O(N*M) to O(N + M log M) for N samples and M grid
+    points.
+
+    The linear binning error is O(step**2/bandwidth**2) relative to the
+    peak density, so grids with a spacing above max_step kernel
+    standard deviations are refined before binning and the density is
+    sampled at the supplied grid points, which keeps the error below
+    1% of the peak density by default. The kernel is truncated
+    at truncate standard deviations, which drops a relative mass below
+    1e-6 by default. Returns the density with the shape of the grid,
+    or None if the grid cannot represent the kernel.
+    """
+    ndim = len(grids)
+    data = np.atleast_2d(data)
+    covariance = np.atleast_2d(covariance)
+    steps = [g[1]-g[0] if len(g) > 1 else 0 for g in grids]
+    if any(step <= 0 for step in steps):
+        return None
+    sigmas = np.sqrt(np.diag(covariance))
+    factors = [int(np.ceil(step/(max_step*sigma))) if sigma > 0 else 1
+               for sigma, step in zip(sigmas, steps)]
+    if any(factor > 1 for factor in factors):
+        if np.prod([len(g)*factor for g, factor in zip(grids, factors)]) > 2**22:
+            return None
+        fine = [g[0] + np.arange((len(g)-1)*factor+1) * (step/factor)
+                for g, factor, step in zip(grids, factors, steps)]
+        density = binned_kde(data, fine, covariance, truncate, max_step)
+        if density is None:
+            return None
+        return density[tuple(slice(None, None, factor) for factor in factors)]
+    pads = [int(np.ceil(truncate*sigma/step)) for sigma, step in zip(sigmas, steps)]
+    if any(pad > 50*len(g) for pad, g in zip(pads, grids)):
+        return None
+
+    # Linearly bin the samples onto the grid extended by the padding,
+    # dropping samples outside of the kernel support
+    shape = tuple(len(g)+2*pad for g, pad in zip(grids, pads))
+    positions = [(values - (g[0]-pad*step)) / step
+                 for values, g, pad, step in zip(data, grids, pads, steps)]
+    valid = np.logical_and.reduce([(pos >= 0) & (pos < size-1)
+                                   for pos, size in zip(positions, shape)])
+    positions = [pos[valid] for pos in positions]
+    lowers = [np.floor(pos) for pos in positions]
+    fracs = [pos-lower for pos, lower in zip(positions, lowers)]
+    lowers = [lower.astype('int64') for lower in lowers]
+    counts = np.zeros(int(np.prod(shape)))
+    for corner in np.ndindex(*((2,)*ndim)):
+        weights = np.ones(valid.sum())
+        for frac, c in zip(fracs, corner):
+            weights *= frac if c else 1-frac
+        indices = [lower+c for lower, c in zip(lowers, corner)]
+        counts += np.bincount(np.ravel_multi_index(indices, shape), weights,
+                              minlength=len(counts))
+    counts = counts.reshape(shape)
+
+    # Evaluate the kernel on the grid offsets
+    offsets = [np.arange(-pad, pad+1)*step for pad, step in zip(pads, steps)]
+    mesh = np.meshgrid(*offsets, indexing='ij')
+    points = np.stack([m.ravel() for m in mesh])
+    inv_cov = np.linalg.inv(covariance)
+    norm = np.sqrt(np.linalg.det(2*np.pi*covariance))
+    kernel = np.exp(-0.5*np.sum(points*np.dot(inv_cov, points), axis=0)) / norm
+    kernel = kernel.reshape(mesh[0].shape)
+
+    conv = _fft_convolve(counts, kernel)
+    density = conv[tuple(slice(2*pad, 2*pad+len(g)) for pad, g in zip(pads, grids))]
+    return np.clip(density, 0, None) / data.shape[1]
+
+
 class univariate_kde(Operation):
     """
     Computes a 1D kernel density estimate (KDE) along the supplied
@@ -56,6 +157,15 @@ class univariate_kde(Operation):
     groupby = param.ClassSelector(default=None, class_=(basestring, Dimension), doc="""
       Defines a dimension to group the Histogram returning an NdOverlay of Histograms.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'binned'], doc="""
+        Method used to compute the KDE. 'exact' evaluates the kernel
+        of every sample at every grid point with scipy, while 'binned'
+        linearly bins the samples onto the grid and convolves them
+        with the kernel using FFTs. The binned method scales to
+        millions of samples, refining the grid for small bandwidths to
+        keep the error below 1% of the peak density, see
+        binned_kde.""")
+
     _per_element = True
 
     def _process(self, element, key=None):
@@ -66,11 +176,14 @@ class univariate_kde(Operation):
             self.p.groupby = None
             return grouped.map(self._process, Dataset)
 
+        binned = self.p.method == 'binned'
         try:
             from scipy import stats
             from scipy.linalg import LinAlgError
         except ImportError:
-            raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
+            if not binned:
+                raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
+            stats, LinAlgError = None, np.linalg.LinAlgError
 
         params = {}
         if isinstance(element, Distribution):
@@ -104,18 +217,34 @@ class univariate_kde(Operation):
         element_type = Area if self.p.filled else Curve
         data = data[isfinite(data)] if len(data) else []
         if len(data) > 1:
-            try:
-                kde = stats.gaussian_kde(data)
-            except LinAlgError:
-                return element_type([], selected_dim, vdims, **params)
-            if self.p.bandwidth:
-                kde.set_bandwidth(self.p.bandwidth)
-            bw = kde.scotts_factor() * data.std(ddof=1)
+            if binned:
+                covariance = _kde_covariance(data[np.newaxis], self.p.bandwidth)
+                bw = len(data)**(-1./5) * data.std(ddof=1)
+            else:
+                try:
+                    kde = stats.gaussian_kde(data)
+                except LinAlgError:
+                    return element_type([], selected_dim, vdims, **params)
+                if self.p.bandwidth:
+                    kde.set_bandwidth(self.p.bandwidth)
+                bw = kde.scotts_factor() * data.std(ddof=1)
             if self.p.bin_range:
                 xs = np.linspace(bin_range[0], bin_range[1], self.p.n_samples)
             else:
                 xs = _kde_support(bin_range, bw, self.p.n_samples, self.p.cut, selected_dim.range)
-            ys = kde.evaluate(xs)
+            ys = None
+            if binned:
+                if not covariance[0, 0] > 0:
+                    return element_type([], selected_dim, vdims, **params)
+                ys = binned_kde(data[np.newaxis], [xs], covariance)
+            if ys is None:
+                if stats is None:
+                    raise ImportError('%s operation requires SciPy to be installed '
+                                      'if the binned method cannot be applied.'
+                                      % type(self).__name__)
+                if binned:
+                    kde = stats.gaussian_kde(data, self.p.bandwidth)
+                ys = kde.evaluate(xs)
         else:
             xs = np.linspace(bin_range[0], bin_range[1], self.p.n_samples)
             ys = np.full_like(xs, 0)
@@ -168,13 +297,22 @@ class bivariate_kde(Operation):
        The x_range as a tuple of min and max y-value. Auto-ranges
        if set to None.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'binned'], doc="""
+        Method used to compute the KDE. 'exact' evaluates the kernel
+        of every sample at every grid point with scipy, while 'binned'
+        linearly bins the samples onto the grid and convolves them
+        with the kernel using FFTs, see binned_kde.""")
+
     _per_element = True
 
     def _process(self, element, key=None):
+        binned = self.p.method == 'binned'
         try:
             from scipy import stats
         except ImportError:
-            raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
+            if not binned:
+                raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
+            stats = None
 
         if len(element.dimensions()) < 2:
             raise ValueError("bivariate_kde can only be computed on elements "
@@ -203,10 +341,14 @@ class bivariate_kde(Operation):
 
         data = data[:, isfinite(data).min(axis=0)] if data.shape[1] > 1 else np.empty((2, 0))
         if data.shape[1] > 1:
-            kde = stats.gaussian_kde(data)
-            if self.p.bandwidth:
-                kde.set_bandwidth(self.p.bandwidth)
-            bw = kde.scotts_factor() * data.std(ddof=1)
+            if binned:
+                covariance = _kde_covariance(data, self.p.bandwidth)
+                bw = data.shape[1]**(-1./6) * data.std(ddof=1)
+            else:
+                kde = stats.gaussian_kde(data)
+                if self.p.bandwidth:
+                    kde.set_bandwidth(self.p.bandwidth)
+                bw = kde.scotts_factor() * data.std(ddof=1)
             if self.p.x_range:
                 xs = np.linspace(xmin, xmax, self.p.n_samples)
             else:
@@ -215,9 +357,22 @@ class bivariate_kde(Operation):
                 ys = np.linspace(ymin, ymax, self.p.n_samples)
             else:
                 ys = _kde_support((ymin, ymax), bw, self.p.n_samples, self.p.cut, ydim.range)
-            xx, yy = cartesian_product([xs, ys], False)
-            positions = np.vstack([xx.ravel(), yy.ravel()])
-            f = np.reshape(kde(positions).T, xx.shape)
+            f = None
+            if binned:
+                try:
+                    f = binned_kde(data, [xs, ys], covariance)
+                except np.linalg.LinAlgError:
+                    f = None
+            if f is None:
+                if stats is None:
+                    raise ImportError('%s operation requires SciPy to be installed '
+                                      'if the binned method cannot be applied.'
+                                      % type(self).__name__)
+                if binned:
+                    kde = stats.gaussian_kde(data, self.p.bandwidth)
+                xx, yy = cartesian_product([xs, ys], False)
+                positions = np.vstack([xx.ravel(), yy.ravel()])
+                f = np.reshape(kde(positions).T, xx.shape)
         elif self.p.contours:
             eltype = Polygons if self.p.filled else Contours
             return eltype([], kdims=[xdim, ydim], vdims=[vdim])
@@ -4,16 +4,15 @@ import types
 import param
 import numpy as np
 
-try:
-    from bokeh.util.hex import cartesian_to_axial
-except:
-    cartesian_to_axial = None
-
 from ...core import Dimension, Operation
 from ...core.options import Compositor
-from ...core.util import basestring, isfinite
+from ...core.util import OrderedDict, basestring, isfinite
 from ...element import HexTiles
 from ...util.transform import dim as dim_transform
+from ..util import (
+    cartesian_to_axial, combine_hex_partials, hex_aggregate, hex_partials,
+    hex_reduction
+)
 from .element import ColorbarPlot
 from .selection import BokehOverlaySelectionDisplay
 from .styles import base_properties, line_properties, fill_properties
@@ -41,6 +40,40 @@ class hex_binning(Operation):
 
     orientation = param.ObjectSelector(default='pointy', objects=['flat', 'pointy'])
 
+    def _hex_dask(self, element, indexes, size, scale, reduction, vdims):
+        """
+        Computes partial aggregates on each partition of a dask
+        DataFrame and combines them, avoiding loading all the samples
+        into memory at once.
+        """
+        import pandas as pd
+        xd, yd = (element.get_dimension(i).name for i in indexes)
+        vnames = [element.get_dimension(vd).name for vd in vdims]
+        orientation = self.p.orientation+'top'
+
+        def partial(df):
+            x, y = df[xd].values, df[yd].values
+            finite = isfinite(x) & isfinite(y)
+            q, r = cartesian_to_axial(x[finite], y[finite], size, orientation, scale)
+            values = [df[v].values[finite] for v in vnames]
+            q, r, counts, partials = hex_partials(q, r, values, reduction)
+            columns = OrderedDict([('q', q), ('r', r), ('count', counts)])
+            for i, parts in enumerate(partials):
+                for j, p in enumerate(parts):
+                    columns['%d_%d' % (i, j)] = p
+            return pd.DataFrame(columns)
+
+        meta = partial(element.data._meta)
+        parts = element.data.map_partitions(partial, meta=meta).compute()
+        npartials = len(meta.columns)-3
+        partials = [[parts['%d_%d' % (i, j)].values
+                     for j in range(npartials//len(vnames))]
+                    for i in range(len(vnames))] if vnames else []
+        q, r, counts, aggs = combine_hex_partials(
+            parts['q'].values, parts['r'].values, parts['count'].values,
+            partials, reduction)
+        return (q, r), counts, aggs
+
     def _process(self, element, key=None):
         gridsize, aggregator, orientation = self.p.gridsize, self.p.aggregator, self.p.orientation
 
@@ -59,36 +92,57 @@ class hex_binning(Operation):
         else:
             scale = 1
 
-        # Compute hexagonal coordinates
-        x, y = (element.dimension_values(i) for i in indexes)
-        if not len(x):
-            return element.clone([])
-        finite = isfinite(x) & isfinite(y)
-        x, y = x[finite], y[finite]
-        q, r = cartesian_to_axial(x, y, size, orientation+'top', scale)
-        coords = q, r
-
         # Get aggregation values
         if aggregator is np.size:
-            aggregator = np.sum
-            values = (np.full_like(q, 1),)
             vdims = ['Count']
         elif not element.vdims:
             raise ValueError('HexTiles aggregated by value must '
                              'define a value dimensions.')
         else:
             vdims = element.vdims
-            values = tuple(element.dimension_values(vdim) for vdim in vdims)
+        reduction = hex_reduction(aggregator)
 
-        # Construct aggregate
-        data = coords + values
         xd, yd = (element.get_dimension(i) for i in indexes)
         xd, yd = xd.clone(range=(x0, x1)), yd.clone(range=(y0, y1))
         kdims = [yd, xd] if self.p.invert_axes else [xd, yd]
-        agg = (
-            element.clone(data, kdims=kdims, vdims=vdims)
-            .aggregate(function=aggregator)
-        )
+
+        if reduction is not None and element.interface.datatype == 'dask':
+            agg_vdims = [] if reduction == 'count' else vdims
+            coords, counts, values = self._hex_dask(
+                element, indexes, size, scale, reduction, agg_vdims)
+            if not len(counts):
+                return element.clone([])
+            values = (counts,) if reduction == 'count' else tuple(values)
+            agg = element.clone(coords + values, kdims=kdims, vdims=vdims)
+        else:
+            # Compute hexagonal coordinates
+            x, y = (element.dimension_values(i) for i in indexes)
+            if not len(x):
+                return element.clone([])
+            finite = isfinite(x) & isfinite(y)
+            x, y = x[finite], y[finite]
+            q, r = cartesian_to_axial(x, y, size, orientation+'top', scale)
+            coords = q, r
+
+            if reduction == 'count':
+                q, r, counts, _ = hex_aggregate(q, r)
+                agg = element.clone((q, r, counts), kdims=kdims, vdims=vdims)
+            elif reduction is not None:
+                values = [element.dimension_values(vdim)[finite] for vdim in vdims]
+                q, r, _, values = hex_aggregate(q, r, values, reduction)
+                agg = element.clone((q, r)+tuple(values), kdims=kdims, vdims=vdims)
+            else:
+                # Fall back to a generic aggregate for other functions
+                if aggregator is np.size:
+                    values = (np.full_like(q, 1),)
+                    aggregator = np.sum
+                else:
+                    values = tuple(element.dimension_values(vdim)[finite]
+                                   for vdim in vdims)
+                agg = (
+                    element.clone(coords + values, kdims=kdims, vdims=vdims)
+                    .aggregate(function=aggregator)
+                )
         if self.p.min_count is not None and self.p.min_count > 1:
             agg = agg[:, :, self.p.min_count:]
         return agg
@@ -3,17 +3,73 @@ from __future__ import absolute_import, division, unicode_literals
 import numpy as np
 import param
 
-from bokeh.models import DatetimeAxis, CustomJSHover
+from bokeh.models import DatetimeAxis, CustomJSHover, LinearColorMapper
 
 from ...core.util import cartesian_product, dimension_sanitizer, isfinite
 from ...element import Raster
 from .element import ElementPlot, ColorbarPlot
 from .selection import BokehOverlaySelectionDisplay
 from .styles import base_properties, fill_properties, line_properties, mpl_to_bokeh
-from .util import colormesh
+from .util import colormesh, downcast_array, downcast_coords, quantize_array
 
 
-class RasterPlot(ColorbarPlot):
+class RasterTransferMixin(object):
+    """
+    Mixin for raster plots which handles the transfer_dtype option,
+    downcasting or quantizing the color mapped array before it is
+    sent to the browser.
+    """
+
+    _quantized = False
+
+    def _current_mapper(self, cmapper):
+        """
+        Returns the color mapper applied to the data the last time it
+        was transferred, used when the data source is not updated.
+        """
+        if self._quantized:
+            return self.handles.get('quantized_mapper', cmapper)
+        return cmapper
+
+    def _transfer_array(self, array, cmapper):
+        """
+        Casts the array to the transfer_dtype returning the array and
+        the color mapper to apply to it. Quantized arrays are mapped
+        with a separate color mapper spanning the quantized levels, so
+        the colorbar continues to display the original values.
+        """
+        self._quantized = False
+        dtype = self.transfer_dtype
+        if dtype is None or array.dtype.kind not in 'uif':
+            return array, cmapper
+        elif dtype == 'float32':
+            return downcast_array(array), cmapper
+
+        qdtype = np.dtype(dtype)
+        if array.dtype.kind in 'ui' and array.dtype.itemsize <= qdtype.itemsize:
+            return array, cmapper
+        elif ('hover' in self.handles or type(cmapper) is not LinearColorMapper or
+              cmapper.low is None or cmapper.high is None):
+            # Hover would display quantized values and only linear
+            # mappings can be rescaled to the quantized levels
+            return downcast_array(array), cmapper
+
+        qmapper = self.handles.get('quantized_mapper')
+        opts = dict(palette=cmapper.palette, low=1, high=np.iinfo(qdtype).max,
+                    low_color=cmapper.nan_color)
+        if qmapper is None:
+            qmapper = LinearColorMapper(**opts)
+            self.handles['quantized_mapper'] = qmapper
+        else:
+            opts = {k: v for k, v in opts.items() if getattr(qmapper, k) != v}
+            if opts:
+                qmapper.update(**opts)
+        self._quantized = True
+        return quantize_array(array, cmapper.low, cmapper.high, qdtype), qmapper
+
+
+
+class RasterPlot(RasterTransferMixin, ColorbarPlot):
 
     clipping_colors = param.Dict(default={'NaN': 'transparent'})
 
@@ -22,6 +78,14 @@ class RasterPlot(ColorbarPlot):
     show_legend = param.Boolean(default=False, doc="""
         Whether to show legend for the plot.""")
 
+    transfer_dtype = param.ObjectSelector(default=None, objects=[
+        None, 'float32', 'uint8', 'uint16'], doc="""
+        Data type used to send the image data to the browser. 'float32'
+        downcasts double precision data, while 'uint8' and 'uint16'
+        quantize the data to the levels of the integer type across the
+        color range. Quantization falls back to 'float32' if hover is
+        enabled or the color mapping is not linear.""")
+
     style_opts = base_properties + ['cmap', 'alpha']
 
     _nonvectorized_styles = style_opts
@@ -78,11 +142,13 @@ class RasterPlot(ColorbarPlot):
     def get_data(self, element, ranges, style):
         mapping = dict(image='image', x='x', y='y', dw='dw', dh='dh')
         val_dim = element.vdims[0]
-        style['color_mapper'] = self._get_colormapper(val_dim, element, ranges, style)
+        cmapper = self._get_colormapper(val_dim, element, ranges, style)
+        style['color_mapper'] = cmapper
         if 'alpha' in style:
             style['global_alpha'] = style['alpha']
 
         if self.static_source:
+            style['color_mapper'] = self._current_mapper(cmapper)
             return {}, mapping, style
 
         if type(element) is Raster:
@@ -116,7 +182,12 @@ class RasterPlot(ColorbarPlot):
                 img = img[:, ::-1]
             if self.invert_yaxis:
                 img = img[::-1]
-            key = 'image' if i == 2 else dimension_sanitizer(vdim.name)
+            if i == 2:
+                key = 'image'
+                img, style['color_mapper'] = self._transfer_array(img, cmapper)
+            else:
+                key = dimension_sanitizer(vdim.name)
+                img = downcast_array(img) if self.transfer_dtype else img
             data[key] = [img]
 
         return (data, mapping, style)
@@ -199,7 +270,7 @@ class HSVPlot(RGBPlot):
 
 
 
-class QuadMeshPlot(ColorbarPlot):
+class QuadMeshPlot(RasterTransferMixin, ColorbarPlot):
 
     clipping_colors = param.Dict(default={'NaN': 'transparent'})
 
@@ -208,6 +279,15 @@ class QuadMeshPlot(ColorbarPlot):
     show_legend = param.Boolean(default=False, doc="""
         Whether to show legend for the plot.""")
 
+    transfer_dtype = param.ObjectSelector(default=None, objects=[
+        None, 'float32', 'uint8', 'uint16'], doc="""
+        Data type used to send the color mapped values to the browser.
+        'float32' downcasts double precision values and regularly
+        sampled coordinates, while 'uint8' and 'uint16' quantize the
+        values to the levels of the integer type across the color
+        range. Quantization falls back to 'float32' if hover is enabled
+        or the color mapping is not linear.""")
+
     selection_display = BokehOverlaySelectionDisplay()
 
     style_opts = ['cmap'] + base_properties + line_properties + fill_properties
@@ -221,15 +301,15 @@ class QuadMeshPlot(ColorbarPlot):
 
         if self.invert_axes: x, y = y, x
         cmapper = self._get_colormapper(z, element, ranges, style)
-        cmapper = {'field': z.name, 'transform': cmapper}
+        fill_color = {'field': z.name, 'transform': self._current_mapper(cmapper)}
 
         irregular = (element.interface.irregular(element, x) or
                      element.interface.irregular(element, y))
         if irregular:
-            mapping = dict(xs='xs', ys='ys', fill_color=cmapper)
+            mapping = dict(xs='xs', ys='ys', fill_color=fill_color)
         else:
             mapping = {'left': 'left', 'right': 'right',
-                       'fill_color': cmapper,
+                       'fill_color': fill_color,
                        'top': 'top', 'bottom': 'bottom'}
 
         if self.static_source:
@@ -260,17 +340,22 @@ class QuadMeshPlot(ColorbarPlot):
                 else:
                     mask.append(False)
 
-            data = {'xs': XS, 'ys': YS, z.name: zvals[np.array(mask)]}
+            zvals, fill_color['transform'] = self._transfer_array(
+                zvals[np.array(mask)], cmapper)
+            data = {'xs': XS, 'ys': YS, z.name: zvals}
             if 'hover' in self.handles:
                 data[x] = np.array(xc)
                 data[y] = np.array(yc)
         else:
             xc, yc = (element.interface.coords(element, x, edges=True, ordered=True),
                       element.interface.coords(element, y, edges=True, ordered=True))
+            if self.transfer_dtype:
+                xc, yc = downcast_coords(xc), downcast_coords(yc)
 
             x0, y0 = cartesian_product([xc[:-1], yc[:-1]], copy=True)
             x1, y1 = cartesian_product([xc[1:], yc[1:]], copy=True)
             zvals = zdata.flatten() if self.invert_axes else zdata.T.flatten()
+            zvals, fill_color['transform'] = self._transfer_array(zvals, cmapper)
             data = {'left': x0, 'right': x1, dimension_sanitizer(z.name): zvals,
                     'bottom': y0, 'top': y1}
 
@@ -40,6 +40,10 @@ class SankeyPlot(GraphPlot):
     node_sort = param.Boolean(default=True, doc="""
         Sort nodes in ascending breadth.""")
 
+    method = param.ObjectSelector(default='dict', objects=['dict', 'array'], doc="""
+        Whether to compute the layout on dictionaries of node and link
+        attributes or on NumPy arrays, which scales to larger graphs.""")
+
     width = param.Integer(default=1000, allow_None=True, bounds=(0, None), doc="""
         The width of the component (in pixels). This can be either
         fixed or preferred width, depending on width sizing policy.""")
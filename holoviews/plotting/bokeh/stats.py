@@ -1,7 +1,6 @@
 from __future__ import absolute_import, division, unicode_literals
 
 from collections import defaultdict
-from functools import partial
 
 import param
 import numpy as np
@@ -21,6 +20,7 @@ from .element import CompositeElementPlot, ColorbarPlot, LegendPlot
 from .path import PolygonPlot
 from .styles import base_properties, fill_properties, line_properties
 from .util import bokeh_version, decode_bytes
+from ..util import group_distributions, grouped_box_stats
 
 
 class DistributionPlot(AreaPlot):
@@ -34,6 +34,10 @@ class DistributionPlot(AreaPlot):
     cut = param.Number(default=3, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'binned'], doc="""
+        Method used to compute the KDE, 'binned' approximates the
+        density using FFT convolution which scales to large datasets.""")
+
     filled = param.Boolean(default=True, doc="""
         Whether the bivariate contours should be filled.""")
 
@@ -54,6 +58,10 @@ class BivariatePlot(PolygonPlot):
     cut = param.Number(default=3, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'binned'], doc="""
+        Method used to compute the KDE, 'binned' approximates the
+        density using FFT convolution which scales to large datasets.""")
+
     filled = param.Boolean(default=False, doc="""
         Whether the bivariate contours should be filled.""")
 
@@ -124,7 +132,7 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         if not element.kdims:
             xfactors, yfactors = [element.label], []
         else:
-            factors = [key for key in element.groupby(element.kdims).data.keys()]
+            factors = group_distributions(element, element.kdims)[0]
             if element.ndims > 1:
                 factors = sorted(factors)
             factors = [tuple(d.pprint_value(k) for d, k in zip(element.kdims, key))
@@ -139,34 +147,15 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         super(BoxWhiskerPlot, self)._postprocess_hover(renderer, source)
 
     def _box_stats(self, vals):
-        vals = vals[isfinite(vals)]
-
-        if len(vals):
-            q1, q2, q3 = (np.percentile(vals, q=q)
-                          for q in range(25, 100, 25))
-            iqr = q3 - q1
-            upper = vals[vals <= q3 + 1.5*iqr].max()
-            lower = vals[vals >= q1 - 1.5*iqr].min()
-        else:
-            q1, q2, q3 = 0, 0, 0
-            upper, lower = 0, 0
-        outliers = vals[(vals > upper) | (vals < lower)]
-        return q1, q2, q3, upper, lower, outliers
+        stats = grouped_box_stats(vals, [0, len(vals)])
+        q1, q2, q3, upper, lower = (stats[k][0] for k in ('q1', 'q2', 'q3', 'upper', 'lower'))
+        return q1, q2, q3, upper, lower, vals[stats['outliers']]
 
     def get_data(self, element, ranges, style):
-        if element.kdims:
-            with sorted_context(False):
-                groups = element.groupby(element.kdims).data
-        else:
-            groups = dict([(element.label, element)])
+        keys, values, offsets = group_distributions(element, element.kdims)
+        stats = grouped_box_stats(values, offsets)
         vdim = dimension_sanitizer(element.vdims[0].name)
 
-        # Define CDS data
-        r1_data, r2_data = ({'index': [], 'top': [], 'bottom': []} for i in range(2))
-        s1_data, s2_data = ({'x0': [], 'y0': [], 'x1': [], 'y1': []} for i in range(2))
-        w1_data, w2_data = ({'x0': [], 'y0': [], 'x1': [], 'y1': []} for i in range(2))
-        out_data = defaultdict(list, {'index': [], vdim: []})
-
         # Define glyph-data mapping
         width = style.get('box_width', 0.7)
         whisker_width = style.pop('whisker_width', 0.4)/2.
@@ -190,73 +179,44 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         else:
             cdim, cidx = None, None
 
-        factors = []
-        for key, g in groups.items():
-            # Compute group label
+        # Compute group labels and color factors
+        labels, factors = [], []
+        for key in keys:
             if element.kdims:
                 label = tuple(d.pprint_value(v) for d, v in zip(element.kdims, key))
                 if len(label) == 1:
                     label = label[0]
             else:
-                label = key
-            hover = 'hover' in self.handles
-
-            # Add color factor
+                label = element.label
+            labels.append(label)
             if cidx is not None and cidx<element.ndims:
-                factors.append(cdim.pprint_value(wrap_tuple(key)[cidx]))
+                factors.append(cdim.pprint_value(key[cidx]))
             else:
                 factors.append(label)
 
-            # Compute statistics
-            vals = g.dimension_values(g.vdims[0])
-            q1, q2, q3, upper, lower, outliers = self._box_stats(vals)
-
-            # Add to CDS data
-            for data in [r1_data, r2_data]:
-                data['index'].append(label)
-            for data in [s1_data, s2_data]:
-                data['x0'].append(label)
-                data['x1'].append(label)
-            for data in [w1_data, w2_data]:
-                data['x0'].append(wrap_tuple(label)+(-whisker_width,))
-                data['x1'].append(wrap_tuple(label)+(whisker_width,))
-            r1_data['top'].append(q2)
-            r2_data['top'].append(q1)
-            r1_data['bottom'].append(q3)
-            r2_data['bottom'].append(q2)
-            s1_data['y0'].append(upper)
-            s2_data['y0'].append(lower)
-            s1_data['y1'].append(q3)
-            s2_data['y1'].append(q1)
-            w1_data['y0'].append(lower)
-            w1_data['y1'].append(lower)
-            w2_data['y0'].append(upper)
-            w2_data['y1'].append(upper)
-            if len(outliers):
-                out_data['index'] += [label]*len(outliers)
-                out_data[vdim] += list(outliers)
-                if hover:
-                    for kd, k in zip(element.kdims, wrap_tuple(key)):
-                        out_data[dimension_sanitizer(kd.name)] += [k]*len(outliers)
-            if hover:
-                for kd, k in zip(element.kdims, wrap_tuple(key)):
-                    kd_name = dimension_sanitizer(kd.name)
-                    if kd_name in r1_data:
-                        r1_data[kd_name].append(k)
-                    else:
-                        r1_data[kd_name] = [k]
-                    if kd_name in r2_data:
-                        r2_data[kd_name].append(k)
-                    else:
-                        r2_data[kd_name] = [k]
-                if vdim in r1_data:
-                    r1_data[vdim].append(q2)
-                else:
-                    r1_data[vdim] = [q2]
-                if vdim in r2_data:
-                    r2_data[vdim].append(q2)
-                else:
-                    r2_data[vdim] = [q2]
+        # Define CDS data
+        q1, q2, q3 = stats['q1'], stats['q2'], stats['q3']
+        lower, upper = stats['lower'], stats['upper']
+        r1_data = {'index': list(labels), 'top': q2, 'bottom': q3}
+        r2_data = {'index': list(labels), 'top': q1, 'bottom': q2}
+        s1_data = {'x0': list(labels), 'x1': list(labels), 'y0': upper, 'y1': q3}
+        s2_data = {'x0': list(labels), 'x1': list(labels), 'y0': lower, 'y1': q1}
+        w1_data, w2_data = ({'x0': [wrap_tuple(l)+(-whisker_width,) for l in labels],
+                             'x1': [wrap_tuple(l)+(whisker_width,) for l in labels],
+                             'y0': ys, 'y1': ys} for ys in (lower, upper))
+
+        outliers = stats['outliers']
+        out_groups = np.repeat(np.arange(len(keys)), np.diff(offsets))[outliers]
+        out_data = {'index': [labels[i] for i in out_groups], vdim: values[outliers]}
+        if 'hover' in self.handles:
+            for i, kd in enumerate(element.kdims):
+                kd_name = dimension_sanitizer(kd.name)
+                kvals = np.array([key[i] for key in keys])
+                out_data[kd_name] = kvals[out_groups]
+                r1_data[kd_name] = kvals
+                r2_data[kd_name] = kvals
+            r1_data[vdim] = q2
+            r2_data[vdim] = q2
 
         # Define combined data and mappings
         bar_glyph = 'hbar' if self.invert_axes else 'vbar'
@@ -308,6 +268,10 @@ class ViolinPlot(BoxWhiskerPlot):
     cut = param.Number(default=5, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'binned'], doc="""
+        Method used to compute the KDE, 'binned' approximates the
+        density using FFT convolution which scales to large datasets.""")
+
     inner = param.ObjectSelector(objects=['box', 'quartiles', 'stick', None],
                                  default='box', doc="""
         Inner visual indicator for distribution values:
@@ -344,8 +308,6 @@ class ViolinPlot(BoxWhiskerPlot):
                    for glyph in ('box', 'violin', 'stats', 'median')] +
                   ['cmap', 'box_cmap', 'violin_cmap'])
 
-    _stat_fns = [partial(np.percentile, q=q) for q in [25, 50, 75]]
-
     selection_display = BokehOverlaySelectionDisplay(color_prop='violin_fill_color')
 
     def _get_axis_dims(self, element):
@@ -362,7 +324,7 @@ class ViolinPlot(BoxWhiskerPlot):
         if not kdims:
             xfactors, yfactors = [element.label], []
         else:
-            factors = [key for key in element.groupby(kdims).data.keys()]
+            factors = group_distributions(element, kdims)[0]
             if element.ndims > 1:
                 factors = sorted(factors)
             factors = [tuple(d.pprint_value(k) for d, k in zip(kdims, key))
@@ -371,7 +333,7 @@ class ViolinPlot(BoxWhiskerPlot):
             xfactors, yfactors = factors, []
         return (yfactors, xfactors) if self.invert_axes else (xfactors, yfactors)
 
-    def _kde_data(self, element, el, key, split_dim, **kwargs):
+    def _kde_data(self, element, el, key, split_dim, box_stats=None, **kwargs):
         vdims = el.vdims
         vdim = vdims[0]
         if self.clip:
@@ -437,12 +399,13 @@ class ViolinPlot(BoxWhiskerPlot):
         bars, segments, scatter = defaultdict(list), defaultdict(list), {}
         values = el.dimension_values(vdim)
         values = values[isfinite(values)]
+        if len(values) and self.inner in ('box', 'quartiles') and box_stats is None:
+            box_stats = self._box_stats(values)[:5]
         if not len(values):
             pass
         elif self.inner == 'quartiles':
             if len(xs):
-                for stat_fn in self._stat_fns:
-                    stat = stat_fn(values)
+                for stat in box_stats[:3]:
                     sidx = np.argmin(np.abs(xs-stat))
                     sx, sy = xs[sidx], ys[sidx]
                     segments['x'].append(sx)
@@ -458,7 +421,7 @@ class ViolinPlot(BoxWhiskerPlot):
                     segments['y1'].append(sy)
         elif self.inner == 'box':
             xpos = key+(0,)
-            q1, q2, q3, upper, lower, _ = self._box_stats(values)
+            q1, q2, q3, upper, lower = box_stats
             segments['x'].append(xpos)
             segments['y0'].append(lower)
             segments['y1'].append(upper)
@@ -502,12 +465,22 @@ class ViolinPlot(BoxWhiskerPlot):
             scatter_map = {'x': 'x', 'y': 'y'}
             bar_glyph = 'vbar'
 
-        kwargs = {'bandwidth': self.bandwidth, 'cut': self.cut}
+        # Compute the box statistics of all groups at once
+        if self.inner in ('box', 'quartiles'):
+            keys, values, offsets = group_distributions(element, kdims)
+            stats = grouped_box_stats(values, offsets)
+            stats = list(zip(*(stats[s] for s in ('q1', 'q2', 'q3', 'upper', 'lower'))))
+            box_stats = dict(zip(keys, stats)) if kdims else {(element.label,): stats[0]}
+        else:
+            box_stats = {}
+
+        kwargs = {'bandwidth': self.bandwidth, 'cut': self.cut,
+                  'method': self.method}
         mapping, data = {}, {}
         kde_data, line_data, seg_data, bar_data, scatter_data = (defaultdict(list) for i in range(5))
         for i, (key, g) in enumerate(groups.items()):
-            key = decode_bytes(key)
-            kde, line, segs, bars, scatter = self._kde_data(element, g, key, split_dim, **kwargs)
+            kde, line, segs, bars, scatter = self._kde_data(
+                element, g, decode_bytes(key), split_dim, box_stats.get(key), **kwargs)
             for k, v in segs.items():
                 seg_data[k] += v
             for k, v in bars.items():
@@ -886,6 +886,49 @@ def colormesh(X, Y):
     return X, Y
 
 
+def quantize_array(array, low, high, dtype):
+    """
+    Quantizes an array to the levels of an unsigned integer dtype,
+    mapping the range low to high onto the levels 1 to the maximum of
+    the dtype and reserving level 0 for NaNs. Values outside the range
+    are clipped to it.
+    """
+    dtype = np.dtype(dtype)
+    levels = np.iinfo(dtype).max
+    scale = (levels-1) / float((high-low) or 1)
+    nans = np.isnan(array)
+    scaled = (np.clip(array, low, high) - low) * scale + 1
+    scaled[nans] = 0
+    return np.rint(scaled).astype(dtype)
+
+
+def downcast_array(array):
+    """
+    Downcasts double precision float arrays to single precision,
+    leaving all other arrays unchanged.
+    """
+    if array.dtype == np.float64:
+        return array.astype(np.float32)
+    return array
+
+
+def downcast_coords(coords):
+    """
+    Downcasts double precision coordinates to single precision if
+    the rounding error is small relative to the sample spacing, so
+    that neighbouring coordinates cannot collapse onto each other.
+    """
+    if coords.dtype != np.float64 or len(coords) < 2:
+        return coords
+    downcast = coords.astype(np.float32)
+    spacing = np.abs(np.diff(coords))
+    spacing = spacing[spacing > 0]
+    if not len(spacing):
+        return coords
+    error = np.nanmax(np.abs(downcast - coords))
+    return downcast if error < 1e-3 * spacing.min() else coords
+
+
 def theme_attr_json(theme, attr):
     if isinstance(theme, str) and theme in built_in_themes:
         return built_in_themes[theme]._json['attrs'].get(attr, {})
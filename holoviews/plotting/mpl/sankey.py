@@ -35,6 +35,10 @@ class SankeyPlot(GraphPlot):
     node_sort = param.Boolean(default=True, doc="""
         Sort nodes in ascending breadth.""")
 
+    method = param.ObjectSelector(default='dict', objects=['dict', 'array'], doc="""
+        Whether to compute the layout on dictionaries of node and link
+        attributes or on NumPy arrays, which scales to larger graphs.""")
+
     # Deprecated options
 
     color_index = param.ClassSelector(default=2, class_=(basestring, int),
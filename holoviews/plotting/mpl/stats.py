@@ -3,7 +3,8 @@ from __future__ import absolute_import, division, unicode_literals
 import param
 import numpy as np
 
-from ...core.ndmapping import sorted_context
+from ...core.util import is_number
+from ..util import group_distributions, grouped_box_stats
 from .chart import AreaPlot, ChartPlot
 from .path import PolygonPlot
 from .plot import AdjoinedPlot
@@ -20,6 +21,10 @@ class DistributionPlot(AreaPlot):
     cut = param.Number(default=3, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'binned'], doc="""
+        Method used to compute the KDE, 'binned' approximates the
+        density using FFT convolution which scales to large datasets.""")
+
     filled = param.Boolean(default=True, doc="""
         Whether the bivariate contours should be filled.""")
 
@@ -39,6 +44,10 @@ class BivariatePlot(PolygonPlot):
     cut = param.Number(default=3, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'binned'], doc="""
+        Method used to compute the KDE, 'binned' approximates the
+        density using FFT convolution which scales to large datasets.""")
+
     filled = param.Boolean(default=False, doc="""
         Whether the bivariate contours should be filled.""")
 
@@ -64,35 +73,69 @@ class BoxPlot(ChartPlot):
 
     _plot_methods = dict(single='boxplot')
 
+    # Options which require matplotlib to compute the statistics
+    _boxplot_opts = ['sym', 'bootstrap', 'conf_intervals']
+
     def get_extents(self, element, ranges, range_type='combined'):
         return super(BoxPlot, self).get_extents(
             element, ranges, range_type, 'categorical', element.vdims[0]
         )
 
-    def get_data(self, element, ranges, style):
+    def _group_data(self, element):
+        """
+        Groups the values of the element returning the group labels,
+        the values sorted by group and the group offsets.
+        """
+        keys, values, offsets = group_distributions(element, element.kdims)
         if element.kdims:
-            with sorted_context(False):
-                groups = element.groupby(element.kdims).data.items()
+            labels = [','.join([d.pprint_value(v) for d, v in zip(element.kdims, key)])
+                      for key in keys]
         else:
-            groups = [(element.label, element)]
-
-        data, labels = [], []
-        for key, group in groups:
-            if element.kdims:
-                label = ','.join([d.pprint_value(v) for d, v in zip(element.kdims, key)])
-            else:
-                label = key
-            data.append(group[group.vdims[0]])
-            labels.append(label)
-        style['labels'] = labels
+            labels = [element.label]
+        return labels, values, offsets
+
+    def _box_stats(self, labels, values, offsets, whis=1.5):
+        """
+        Computes the statistics of all groups at once in the format
+        accepted by Axes.bxp.
+        """
+        stats = grouped_box_stats(values, offsets, whis)
+        iqr = stats['q3'] - stats['q1']
+        # Like Axes.boxplot the whiskers never end inside the box
+        whislo = np.minimum(stats['lower'], stats['q1'])
+        whishi = np.maximum(stats['upper'], stats['q3'])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            notch = 1.57*iqr/np.sqrt(stats['count'])
+        return [dict(label=label, med=stats['q2'][i], q1=stats['q1'][i],
+                     q3=stats['q3'][i], whislo=whislo[i],
+                     whishi=whishi[i], mean=stats['mean'][i],
+                     cilo=stats['q2'][i]-notch[i], cihi=stats['q2'][i]+notch[i],
+                     fliers=values[start:end][stats['outliers'][start:end]])
+                for i, (label, start, end) in enumerate(zip(labels, offsets[:-1], offsets[1:]))]
+
+    def get_data(self, element, ranges, style):
+        labels, values, offsets = self._group_data(element)
         style = {k: v for k, v in style.items()
                  if k not in ['zorder', 'label']}
         style['vert'] = not self.invert_axes
         format_kdims = [kd.clone(value_format=None) for kd in element.kdims]
-        return (data,), style, {'dimensions': [format_kdims, element.vdims[0]]}
+        dims = {'dimensions': [format_kdims, element.vdims[0]]}
+        whis = style.get('whis', 1.5)
+        if any(opt in style for opt in self._boxplot_opts) or not is_number(whis):
+            style['labels'] = labels
+            data = [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+            return (data,), style, dims
+        style.pop('whis', None)
+        if 'notch' in style:
+            style['shownotches'] = style.pop('notch')
+        return (self._box_stats(labels, values, offsets, whis),), style, dims
 
     def init_artists(self, ax, plot_args, plot_kwargs):
-        artists = ax.boxplot(*plot_args, **plot_kwargs)
+        # Raw data is supplied with labels, precomputed statistics without
+        if 'labels' in plot_kwargs:
+            artists = ax.boxplot(*plot_args, **plot_kwargs)
+        else:
+            artists = ax.bxp(*plot_args, **plot_kwargs)
         artists['artist'] = artists['boxes']
         return artists
 
@@ -161,22 +204,23 @@ class ViolinPlot(BoxPlot):
     ]
 
     def init_artists(self, ax, plot_args, plot_kwargs):
+        box_stats = plot_kwargs.pop('box_stats', [])
         box_color = plot_kwargs.pop('box_color', 'black')
         stats_color = plot_kwargs.pop('stats_color', 'black')
         facecolors = plot_kwargs.pop('facecolors', [])
         edgecolors = plot_kwargs.pop('edgecolors', 'black')
-        labels = plot_kwargs.pop('labels')
+        plot_kwargs.pop('labels')
         alpha = plot_kwargs.pop('alpha', 1.)
         showmedians = self.inner == 'medians'
         bw_method = self.bandwidth or 'scott'
         artists = ax.violinplot(*plot_args, bw_method=bw_method,
                                showmedians=showmedians, **plot_kwargs)
         if self.inner == 'box':
-            box = ax.boxplot(*plot_args, positions=plot_kwargs['positions'],
-                             showfliers=False, showcaps=False, patch_artist=True,
-                             boxprops={'facecolor': box_color},
-                             medianprops={'color': 'white'}, widths=0.1,
-                             labels=labels)
+            box = ax.bxp(box_stats, positions=plot_kwargs['positions'],
+                         showfliers=False, showcaps=False, patch_artist=True,
+                         boxprops={'facecolor': box_color},
+                         medianprops={'color': 'white'}, widths=0.1,
+                         vert=plot_kwargs.get('vert', True))
             artists.update(box)
         for body, color in zip(artists['bodies'], facecolors):
             body.set_facecolors(color)
@@ -189,25 +233,15 @@ class ViolinPlot(BoxPlot):
         return artists
 
     def get_data(self, element, ranges, style):
-        if element.kdims:
-            with sorted_context(False):
-                groups = element.groupby(element.kdims).data.items()
-        else:
-            groups = [(element.label, element)]
-
-        data, labels, colors = [], [], []
+        labels, values, offsets = self._group_data(element)
+        data = [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
         elstyle = self.lookup_options(element, 'style')
-        for i, (key, group) in enumerate(groups):
-            if element.kdims:
-                label = ','.join([d.pprint_value(v) for d, v in zip(element.kdims, key)])
-            else:
-                label = key
-            data.append(group[group.vdims[0]])
-            labels.append(label)
-            colors.append(elstyle[i].get('facecolors', 'blue'))
+        colors = [elstyle[i].get('facecolors', 'blue') for i in range(len(data))]
         style['positions'] = list(range(len(data)))
         style['labels'] = labels
         style['facecolors'] = colors
+        if self.inner == 'box':
+            style['box_stats'] = self._box_stats(labels, values, offsets)
 
         if element.ndims > 0:
             element = element.aggregate(function=np.mean)
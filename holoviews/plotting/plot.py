@@ -25,6 +25,7 @@ from pyviz_comms import JupyterComm
 from ..selection import NoOpSelectionDisplay
 from ..core import OrderedDict
 from ..core import util, traversal
+from ..core.data import Dataset
 from ..core.element import Element, Element3D
 from ..core.overlay import Overlay, CompositeOverlay
 from ..core.layout import Empty, NdLayout, Layout
@@ -763,6 +764,9 @@ class DimensionedPlot(Plot):
                         if isinstance(el, Graph) and el_dim in el.kdims[:2]:
                             # Graph start/end normalization should include all node indices
                             values = el.nodes.dimension_values(2, expanded=False)
+                        elif isinstance(el, Dataset):
+                            group_ranges[dim_name]['factors'].append(el._factors(el_dim))
+                            continue
                         else:
                             values = el.dimension_values(el_dim, expanded=False)
                     elif isinstance(el, Graph) and el_dim in el.nodes:
@@ -61,6 +61,10 @@ class DistributionPlot(ElementPlot):
     cut = param.Number(default=3, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'binned'], doc="""
+        Method used to compute the KDE, 'binned' approximates the
+        density using FFT convolution which scales to large datasets.""")
+
     filled = param.Boolean(default=True, doc="""
         Whether the bivariate contours should be filled.""")
 
@@ -17,7 +17,8 @@ from ..core.ndmapping import item_check
 from ..core.spaces import get_nested_streams
 from ..core.util import (match_spec, wrap_tuple, basestring, get_overlay_spec,
                          unique_iterator, closest_match, is_number, isfinite,
-                         python2sort, disable_constant, arraylike_types)
+                         python2sort, disable_constant, arraylike_types,
+                         factorize_groups)
 from ..streams import LinkedStream
 from ..util.transform import dim
 
@@ -1046,19 +1047,325 @@ def get_directed_graph_paths(element, arrow_length):
     """
     edgepaths = element._split_edgepaths
     edges = edgepaths.split(datatype='array', dimensions=edgepaths.kdims)
-    arrows = []
-    for e in edges:
-        sx, sy = e[0]
-        ex, ey = e[1]
-        rad = np.arctan2(ey-sy, ex-sx)
-        xa0 = ex - np.cos(rad+np.pi/8)*arrow_length
-        ya0 = ey - np.sin(rad+np.pi/8)*arrow_length
-        xa1 = ex - np.cos(rad-np.pi/8)*arrow_length
-        ya1 = ey - np.sin(rad-np.pi/8)*arrow_length
-        arrow = np.array([(sx, sy), (ex, ey), (np.nan, np.nan),
-                          (xa0, ya0), (ex, ey), (xa1, ya1)])
-        arrows.append(arrow)
-    return arrows
+    if not edges:
+        return []
+    starts = np.array([e[0] for e in edges], dtype=float)
+    ends = np.array([e[1] for e in edges], dtype=float)
+    (sx, sy), (ex, ey) = starts.T, ends.T
+    rad = np.arctan2(ey-sy, ex-sx)
+    arrow0 = np.column_stack([ex - np.cos(rad+np.pi/8)*arrow_length,
+                              ey - np.sin(rad+np.pi/8)*arrow_length])
+    arrow1 = np.column_stack([ex - np.cos(rad-np.pi/8)*arrow_length,
+                              ey - np.sin(rad-np.pi/8)*arrow_length])
+    gaps = np.full_like(starts, np.nan)
+    arrows = np.stack([starts, ends, gaps, arrow0, ends, arrow1], axis=1)
+    return list(arrows)
+
+
+def cartesian_to_axial(x, y, size, orientation, aspect_scale=1):
+    """
+    Maps arrays of cartesian coordinates to the integer axial (q, r)
+    coordinates of the hexagonal tiles of the given size, matching
+    the tiling of bokeh.util.hex.cartesian_to_axial. The orientation
+    may be 'pointytop' or 'flattop'.
+    """
+    if orientation == 'flattop':
+        coeffs = [2.0/3.0, 0.0, -1.0/3.0, np.sqrt(3.0)/3.0]
+        x = x / size
+        y = -y / size / aspect_scale
+    else:
+        coeffs = [np.sqrt(3.0)/3.0, -1.0/3.0, 0.0, 2.0/3.0]
+        x = x / size * aspect_scale
+        y = -y / size
+    q = coeffs[0]*x + coeffs[1]*y
+    r = coeffs[2]*x + coeffs[3]*y
+
+    # Round the cube coordinates to the nearest hexagon
+    s = -q-r
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq-q), np.abs(rr-r), np.abs(rs-s)
+    round_q = (dq > dr) & (dq > ds)
+    q = np.where(round_q, -(rr+rs), rq)
+    r = np.where(~round_q & ~(ds > dr), -(rq+rs), rr)
+    return q.astype('int64'), r.astype('int64')
+
+
+# Mapping from aggregation functions to the reductions hex_aggregate
+# computes directly
+# Like a pandas groupby aggregation the reductions skip NaNs
+_hex_reductions = [
+    (np.size, 'count'), (len, 'count'),
+    (np.sum, 'nansum'), (np.nansum, 'nansum'),
+    (np.mean, 'nanmean'), (np.nanmean, 'nanmean'),
+    (np.min, 'nanmin'), (np.amin, 'nanmin'), (np.nanmin, 'nanmin'),
+    (np.max, 'nanmax'), (np.amax, 'nanmax'), (np.nanmax, 'nanmax')
+]
+
+
+def hex_reduction(function):
+    """
+    Returns the name of the reduction hex_aggregate computes for the
+    supplied aggregation function or None if it is not supported.
+    """
+    for fn, reduction in _hex_reductions:
+        if function is fn:
+            return reduction
+    return None
+
+
+def _first_occurrences(inverse, nbins):
+    """
+    Returns the index of the first sample in each bin given the bin
+    index of each sample, scanning chunks of growing size until all
+    bins have been seen.
+    """
+    first = np.full(nbins, -1, dtype='int64')
+    start, chunk, found = 0, 2**16, 0
+    while found < nbins and start < len(inverse):
+        uniq, index = np.unique(inverse[start:start+chunk], return_index=True)
+        new = first[uniq] < 0
+        first[uniq[new]] = index[new] + start
+        found += new.sum()
+        start += chunk
+        chunk *= 2
+    return first
+
+
+def _hex_groups(q, r):
+    """
+    Packs integer axial coordinates into a single integer key per
+    sample and returns the coordinates of the non-empty bins, the
+    bin index of each sample and the number of samples in each bin.
+    Bins are ordered by first occurrence, matching the order of a
+    groupby on the coordinates.
+    """
+    q, r = np.asarray(q, dtype='int64'), np.asarray(r, dtype='int64')
+    q0, r0 = q.min(), r.min()
+    nq, nr = q.max()-q0+1, r.max()-r0+1
+    keys = (q-q0)*nr + (r-r0)
+    nbins = nq*nr
+    if nbins <= max(4*len(keys), 2**20):
+        # Dense key space, count with bincount and look up bin indexes
+        counts = np.bincount(keys, minlength=nbins)
+        bins = np.flatnonzero(counts)
+        lookup = np.empty(nbins, dtype='int64')
+        lookup[bins] = np.arange(len(bins))
+        inverse, counts = lookup[keys], counts[bins]
+        first = _first_occurrences(inverse, len(bins))
+    else:
+        bins, first, inverse, counts = np.unique(
+            keys, return_index=True, return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+
+    # Reorder bins by first occurrence
+    order = np.argsort(first)
+    rank = np.empty(len(order), dtype='int64')
+    rank[order] = np.arange(len(order))
+    bins, counts, inverse = bins[order], counts[order], rank[inverse]
+    return bins // nr + q0, bins % nr + r0, inverse, counts
+
+
+def _hex_reduce(values, inverse, counts, reduction, order):
+    """
+    Applies a reduction to the values of each bin given the bin index
+    of each sample. The order argument is a single element list used
+    to cache the argsort of the bin indexes between calls.
+    """
+    values = np.asarray(values)
+    nbins = len(counts)
+    isfloat = values.dtype.kind in 'fc'
+    if reduction in ('nansum', 'nanmean', 'valid') and isfloat:
+        valid = ~np.isnan(values)
+        values = np.where(valid, values, 0)
+    else:
+        valid = None
+        reduction = {'nansum': 'sum', 'nanmean': 'mean'}.get(reduction, reduction)
+
+    if reduction == 'valid':
+        if valid is None:
+            return counts
+        return np.bincount(inverse, weights=valid, minlength=nbins).astype('int64')
+    elif reduction in ('sum', 'nansum', 'mean', 'nanmean') and isfloat:
+        sums = np.bincount(inverse, weights=values, minlength=nbins)
+        if reduction == 'mean':
+            return sums/counts
+        elif reduction == 'nanmean':
+            nvalid = np.bincount(inverse, weights=valid, minlength=nbins)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return sums/nvalid
+        return sums
+
+    # Reduce contiguous runs of the values sorted by bin
+    if order[0] is None:
+        order[0] = np.argsort(inverse, kind='mergesort')
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    sorted_values = values[order[0]]
+    if reduction in ('sum', 'mean'):
+        sums = np.add.reduceat(sorted_values, starts)
+        return sums/counts if reduction == 'mean' else sums
+    ufunc = {'min': np.minimum, 'max': np.maximum,
+             'nanmin': np.fmin, 'nanmax': np.fmax}[reduction]
+    return ufunc.reduceat(sorted_values, starts)
+
+
+def hex_aggregate(q, r, values=(), reduction='count'):
+    """
+    Aggregates samples into hexagonal bins given the integer axial
+    coordinates (q, r) of each sample. Instead of a generic groupby
+    the coordinates are packed into integer keys and reduced with
+    np.bincount or np.ufunc.reduceat on the values sorted by bin.
+
+    Supports 'count', 'sum', 'mean', 'min' and 'max' reductions and
+    the NaN ignoring variants of the latter four (e.g. 'nansum').
+
+    Returns the (q, r) coordinates of the non-empty bins, the number
+    of samples in each bin and a list of the reduced values for each
+    of the supplied value arrays.
+    """
+    if not len(q):
+        empty = np.array([], dtype='int64')
+        return empty, empty, empty, [np.array([]) for _ in values]
+    bq, br, inverse, counts = _hex_groups(q, r)
+    if reduction == 'count':
+        return bq, br, counts, [counts for _ in values]
+    order = [None]
+    reduced = [_hex_reduce(vals, inverse, counts, reduction, order)
+               for vals in values]
+    return bq, br, counts, reduced
+
+
+def hex_partials(q, r, values=(), reduction='count'):
+    """
+    Computes partial aggregates of the samples in one partition of
+    the data, which may be combined across partitions using
+    combine_hex_partials. Returns the (q, r) coordinates of the
+    non-empty bins, the counts and a list of partial arrays for each
+    value array.
+    """
+    if reduction in ('mean', 'nanmean'):
+        partial = ('nansum', 'valid') if reduction == 'nanmean' else ('sum',)
+    elif reduction == 'count':
+        partial = ()
+    else:
+        partial = (reduction,)
+    if not len(q):
+        empty = np.array([], dtype='int64')
+        return empty, empty, empty, [[np.array([]) for _ in partial] for _ in values]
+    bq, br, inverse, counts = _hex_groups(q, r)
+    order = [None]
+    partials = [[_hex_reduce(vals, inverse, counts, p, order) for p in partial]
+                for vals in values]
+    return bq, br, counts, partials
+
+
+def combine_hex_partials(q, r, counts, partials, reduction='count'):
+    """
+    Combines concatenated partial aggregates computed by hex_partials
+    into the final aggregates, returning the (q, r) coordinates, the
+    counts and a list of the reduced values for each value array.
+    """
+    if not len(q):
+        empty = np.array([], dtype='int64')
+        return empty, empty, empty, [np.array([]) for _ in partials]
+    bq, br, inverse, _ = _hex_groups(q, r)
+    nbins = len(bq)
+    total = np.bincount(inverse, weights=counts, minlength=nbins).astype('int64')
+    if reduction == 'count':
+        return bq, br, total, [total for _ in partials]
+    bin_counts = np.bincount(inverse, minlength=nbins)
+    combine = {'mean': 'sum', 'nanmean': 'sum', 'nansum': 'sum'}.get(reduction, reduction)
+    order = [None]
+    reduced = []
+    for parts in partials:
+        combined = [_hex_reduce(p, inverse, bin_counts, combine, order) for p in parts]
+        if reduction == 'mean':
+            combined = combined[0]/total
+        elif reduction == 'nanmean':
+            with np.errstate(invalid='ignore', divide='ignore'):
+                combined = combined[0]/combined[1]
+        else:
+            combined = combined[0]
+        reduced.append(combined)
+    return bq, br, total, reduced
+
+
+def group_distributions(element, kdims):
+    """
+    Groups the values of the first value dimension of an element by
+    the supplied key dimensions without splitting the element into
+    one element per group. Returns a list of key tuples in order of
+    first occurrence, the values sorted by group (preserving their
+    order within each group) and the offsets of each group in the
+    sorted values (with an additional final offset).
+    """
+    values = element.dimension_values(element.vdims[0])
+    if not kdims:
+        return [()], values, np.array([0, len(values)])
+    columns = [element.dimension_values(kd) for kd in kdims]
+    uniques, order, offsets = factorize_groups(columns)
+    return list(zip(*uniques)), values[order], offsets
+
+
+def _lerp(a, b, t):
+    """
+    Linearly interpolates between a and b, matching np.percentile.
+    """
+    diff = b - a
+    return np.where(t >= 0.5, b - diff*(1-t), a + diff*t)
+
+
+def grouped_box_stats(values, offsets, whis=1.5):
+    """
+    Computes box-whisker statistics for many groups at once given
+    values sorted by group and the offsets of each group, as returned
+    by group_distributions. Instead of computing percentiles and
+    outlier masks per group the finite values are sorted by group and
+    value once, after which the quartiles and whiskers are looked up
+    by index arithmetic. Non-finite values are ignored.
+
+    Returns a dictionary of per group arrays containing the quartiles
+    ('q1', 'q2', 'q3'), the 'lower' and 'upper' whiskers (the most
+    extreme values within whis times the interquartile range), the
+    'mean' and 'count' of the finite values and an 'outliers' mask
+    over the supplied values. Empty groups have zero statistics.
+    """
+    values = np.asarray(values, dtype='float64')
+    offsets = np.asarray(offsets, dtype='int64')
+    ngroups = len(offsets)-1
+    groups = np.repeat(np.arange(ngroups), np.diff(offsets))
+    finite = isfinite(values)
+    vals, gids = values[finite], groups[finite]
+    counts = np.bincount(gids, minlength=ngroups)
+    stats = {k: np.zeros(ngroups) for k in ('q1', 'q2', 'q3', 'lower', 'upper', 'mean')}
+    stats['count'] = counts
+    stats['outliers'] = np.zeros(len(values), dtype=bool)
+    if not len(vals):
+        return stats
+
+    sort = np.lexsort((vals, gids))
+    svals, sgids = vals[sort], gids[sort]
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    nonempty = counts > 0
+    last = len(svals)-1
+    for name, q in (('q1', 0.25), ('q2', 0.5), ('q3', 0.75)):
+        pos = q*np.maximum(counts-1, 0)
+        lower = np.floor(pos)
+        lo = np.minimum(starts+lower.astype('int64'), last)
+        hi = np.minimum(lo+1, np.minimum(starts+counts-1, last))
+        stats[name] = np.where(nonempty, _lerp(svals[lo], svals[hi], pos-lower), 0)
+
+    iqr = stats['q3'] - stats['q1']
+    below = np.bincount(sgids, svals < (stats['q1']-whis*iqr)[sgids], minlength=ngroups)
+    within = np.bincount(sgids, svals <= (stats['q3']+whis*iqr)[sgids], minlength=ngroups)
+    lower_idx = np.minimum(starts+below.astype('int64'), last)
+    upper_idx = np.clip(starts+within.astype('int64')-1, 0, last)
+    stats['lower'] = np.where(nonempty, svals[lower_idx], 0)
+    stats['upper'] = np.where(nonempty, svals[upper_idx], 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        stats['mean'] = np.where(nonempty, np.bincount(gids, vals, minlength=ngroups)/counts, 0)
+    stats['outliers'][finite] = ((vals > stats['upper'][gids]) |
+                                 (vals < stats['lower'][gids]))
+    return stats
 
 
 def rgb2hex(rgb):
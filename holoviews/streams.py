@@ -498,9 +498,22 @@ class Buffer(Pipe):
     subscribed to this stream will update the axis ranges when an
     update is pushed. This makes it possible to control whether zooming
     is allowed while streaming.
-    """
 
-    def __init__(self, data, length=1000, index=True, following=True, **params):
+    By default each chunk is concatenated with the previous window of
+    rows, allocating new data on every update. When ``circular=True``
+    the rows are instead written in place into a preallocated circular
+    buffer, which holds each row twice so that the last N rows are
+    always available as a contiguous, ordered view without copying.
+    The columns of a DataFrame are stored in one 2D block per dtype.
+    The DataFrame view wraps the largest block without copying, while
+    the columns of any other dtype, e.g. the integer index column
+    added to float data, are copied into the view. Since the views
+    share memory with the buffer, they are overwritten by subsequent
+    chunks and should be copied if they have to persist.
+    """
+
+    def __init__(self, data, length=1000, index=True, following=True,
+                 circular=False, **params):
         if (util.pd and isinstance(data, util.pd.DataFrame)):
             example = data
         elif isinstance(data, np.ndarray):
@@ -541,6 +554,11 @@ class Buffer(Pipe):
         self._chunk_length = 0
         self._count = 0
         self._index = index
+        self.circular = circular
+        if circular:
+            self._init_ring(self.data)
+            with util.disable_constant(self):
+                self.data = self._ring_view()
 
 
     def verify(self, x):
@@ -574,17 +592,130 @@ class Buffer(Pipe):
             data = self.data.iloc[:0]
         elif isinstance(self.data, dict):
             data = {k: v[:0] for k, v in self.data.items()}
+        if self.circular:
+            self._ring_size = 0
+            self._ring_pos = 0
+            data = self._ring_view()
         with util.disable_constant(self):
             self.data = data
         self.send(data)
 
 
+    def _ring_columns(self, data):
+        """
+        Returns the columns of the supplied data as a list of arrays
+        in the order they are stored in the circular buffer.
+        """
+        if isinstance(data, np.ndarray):
+            return [data]
+        elif util.pd and isinstance(data, util.pd.DataFrame):
+            return [data.index.values]+[data.iloc[:, group].values
+                                        for group in self._ring_groups]
+        return [np.asarray(data[k]) for k in self._ring_keys]
+
+
+    def _init_ring(self, data):
+        """
+        Preallocates a circular buffer holding twice the buffer length
+        of each column and writes the initial data into it.
+        """
+        if util.pd and isinstance(data, util.pd.DataFrame):
+            self._ring_keys = list(data.columns)
+            groups = defaultdict(list)
+            for i, dtype in enumerate(data.dtypes):
+                groups[dtype].append(i)
+            self._ring_groups = sorted(groups.values(), key=lambda g: (-len(g), g[0]))
+        elif isinstance(data, dict):
+            self._ring_keys = list(data.keys())
+        columns = self._ring_columns(data)
+        self._ring = [np.empty((2*self.length,)+col.shape[1:], dtype=col.dtype)
+                      for col in columns]
+        self._ring_size = 0
+        self._ring_pos = 0
+        self._ring_write(columns)
+
+
+    def _promote_ring_groups(self, data):
+        """
+        Regroups the DataFrame columns of the circular buffer when the
+        supplied chunk promotes the dtype of any column, e.g. when
+        floats are streamed into an integer column.
+        """
+        dtypes = {}
+        for group, ring in zip(self._ring_groups, self._ring[1:]):
+            dtypes.update((i, ring.dtype) for i in group)
+        promoted = [np.result_type(dtypes[i], dtype)
+                    for i, dtype in enumerate(data.dtypes)]
+        if all(dtypes[i] == dtype for i, dtype in enumerate(promoted)):
+            return
+        view = self._ring_view()
+        self._init_ring(view.astype(dict(zip(self._ring_keys, promoted))))
+
+
+    def _ring_write(self, columns):
+        """
+        Writes the rows of the supplied columns into both halves of the
+        circular buffer, wrapping around at the buffer length. Columns
+        which cannot be cast to the buffer dtype without loss, e.g.
+        floats written to an integer column, reallocate the buffer
+        with the promoted dtype.
+        """
+        for i, col in enumerate(columns):
+            dtype = np.result_type(self._ring[i].dtype, col.dtype)
+            if dtype != self._ring[i].dtype:
+                self._ring[i] = self._ring[i].astype(dtype)
+        length = self.length
+        nrows = len(columns[0])
+        if nrows > length:
+            columns = [col[-length:] for col in columns]
+            nrows = length
+        pos = self._ring_pos
+        head = min(nrows, length-pos)
+        for ring, col in zip(self._ring, columns):
+            ring[pos:pos+head] = col[:head]
+            ring[pos+length:pos+length+head] = col[:head]
+            if head < nrows:
+                ring[:nrows-head] = col[head:]
+                ring[length:length+nrows-head] = col[head:]
+        self._ring_pos = (pos+nrows) % length
+        self._ring_size = min(self._ring_size+nrows, length)
+
+
+    def _ring_view(self):
+        """
+        Returns an ordered view of the rows in the circular buffer in
+        the format of the streamed data.
+        """
+        start = (self._ring_pos-self._ring_size) % self.length
+        views = [ring[start:start+self._ring_size] for ring in self._ring]
+        if isinstance(self.data, np.ndarray):
+            return views[0]
+        elif util.pd and isinstance(self.data, util.pd.DataFrame):
+            index = util.pd.Index(views[0], name=self.data.index.name)
+            keys, groups = self._ring_keys, self._ring_groups
+            dframe = util.pd.DataFrame(views[1], index=index, copy=False,
+                                       columns=[keys[i] for i in groups[0]])
+            columns = sorted((i, view[:, j]) for group, view in zip(groups[1:], views[2:])
+                             for j, i in enumerate(group))
+            for i, column in columns:
+                dframe.insert(i, keys[i], column)
+            return dframe
+        return dict(zip(self._ring_keys, views))
+
+
     def _concat(self, data):
         """
         Concatenate and slice the accepted data types to the defined
         length.
         """
-        if isinstance(data, np.ndarray):
+        if self.circular:
+            if util.pd and isinstance(data, util.pd.DataFrame):
+                self._promote_ring_groups(data)
+            columns = self._ring_columns(data)
+            self._chunk_length = len(columns[0])
+            self._ring_write(columns)
+            return self._ring_view()
+        elif isinstance(data, np.ndarray):
             data_length = len(data)
             if data_length < self.length:
                 prev_chunk = self.data[-(self.length-data_length):]
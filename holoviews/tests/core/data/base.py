@@ -152,6 +152,30 @@ class HomogeneousColumnTests(object):
     def test_dataset_range(self):
         self.assertEqual(self.dataset_hm.range('y'), (0, 20))
 
+    def test_dataset_range_cached_clone(self):
+        ds = self.dataset_hm
+        ds.range('y')
+        clone = ds.clone()
+        self.assertEqual(clone.range('y'), (0, 20))
+
+    def test_dataset_range_cache_not_shared_with_new_data(self):
+        ds = self.dataset_hm
+        ds.range('y')
+        clone = ds.clone((self.xs, self.xs_2))
+        self.assertEqual(clone.range('y'), (0, 100))
+
+    def test_dataset_range_cache_redim(self):
+        ds = self.dataset_hm
+        ds.range('y')
+        redimmed = ds.redim(x='y', y='x')
+        self.assertEqual(redimmed.range('x'), (0, 20))
+        self.assertEqual(redimmed.range('y'), (0, 10))
+
+    def test_dataset_nbytes(self):
+        ds = self.dataset_hm
+        nbytes = sum(ds.dimension_values(d).nbytes for d in ds.dimensions())
+        self.assertGreaterEqual(ds.interface.nbytes(ds), nbytes)
+
     def test_dataset_closest(self):
         closest = self.dataset_hm.closest([0.51, 1, 9.9])
         self.assertEqual(closest, [1., 1., 10.])
@@ -288,6 +312,24 @@ class HomogeneousColumnTests(object):
         self.assertEqual(dataset.aggregate(['x'], np.mean),
                          Dataset({'x':self.xs, 'z':z_ints}, kdims=['x'], vdims=['z']))
 
+    def test_dataset_aggregate_repeated_keys_hm(self):
+        dataset = Dataset({'x': [3., 1., 3., 2., 1., 3.], 'z': [1., 2., 3., 4., 5., 6.]},
+                          kdims=['x'], vdims=['z'])
+        for function, zs in [(np.sum, [7., 4., 10.]), (np.mean, [3.5, 4., 10/3.]),
+                             (np.min, [2., 4., 1.]), (np.max, [5., 4., 6.]),
+                             (np.median, [3.5, 4., 3.])]:
+            aggregated = dataset.aggregate('x', function).sort()
+            self.assertEqual(aggregated, Dataset({'x': [1., 2., 3.], 'z': zs},
+                                                 kdims=['x'], vdims=['z']))
+
+    def test_dataset_groupby_multiple_keys_order_hm(self):
+        dataset = Dataset({'x': [2, 1, 2, 1, 2], 'y': [1, 1, 1, 0, 0], 'z': [0, 1, 2, 3, 4]},
+                          kdims=['x', 'y'], vdims=['z'])
+        grouped = dataset.groupby(['x', 'y'], container_type=list)
+        self.assertEqual([k for k, _ in grouped], [(2, 1), (1, 1), (1, 0), (2, 0)])
+        self.assertEqual([list(g.dimension_values('z')) for _, g in grouped],
+                         [[0, 2], [1], [3], [4]])
+
     # Indexing
 
     def test_dataset_index_column_idx_hm(self):
@@ -703,6 +745,23 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
                           kdims=self.kdims, vdims=self.vdims)
         self.assertEquals(row, indexed)
 
+    def test_dataset_select_rows_gender_list(self):
+        row = self.table.select(Gender=['M', 'X'])
+        indexed = Dataset({'Gender':['M', 'M'], 'Age':[10, 16],
+                           'Weight':[15,18], 'Height':[0.8,0.6]},
+                          kdims=self.kdims, vdims=self.vdims)
+        self.assertEquals(row, indexed)
+
+    def test_dataset_select_rows_age_set(self):
+        row = self.table.select(Age={10, 16})
+        indexed = Dataset({'Gender':['M', 'M'], 'Age':[10, 16],
+                           'Weight':[15,18], 'Height':[0.8,0.6]},
+                          kdims=self.kdims, vdims=self.vdims)
+        self.assertEquals(row, indexed)
+
+    def test_dataset_select_rows_empty_list(self):
+        self.assertEqual(len(self.table.select(Gender=[])), 0)
+
     def test_dataset_select_rows_gender_male_expr(self):
         row = self.table.select(selection_expr=dim('Gender') == 'M')
         indexed = Dataset({'Gender': ['M', 'M'], 'Age': [10, 16],
@@ -983,6 +1042,12 @@ class GriddedInterfaceTests(object):
         )
         self.assertEqual(self.dataset_grid.select(y=(0, 0.25)), ds)
 
+    def test_select_slice_inverted(self):
+        ds = self.element(
+            (self.grid_xs[::-1], self.grid_ys[::-1][:2], self.grid_zs[:2]), ['x', 'y'], ['z']
+        )
+        self.assertEqual(self.dataset_grid_inv.select(y=slice(0.15, 0.35)), ds)
+
     def test_dataset_ndloc_index(self):
         xs, ys = np.linspace(0.12, 0.81, 10), np.linspace(0.12, 0.391, 5)
         arr = np.arange(10)*np.arange(5)[np.newaxis].T
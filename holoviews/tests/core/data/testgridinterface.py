@@ -75,6 +75,12 @@ class BaseGridInterfaceTests(GriddedInterfaceTests, HomogeneousColumnTests, Inte
     def test_dataset_sort_reverse_hm(self):
         raise SkipTest("Not supported")
 
+    def test_dataset_aggregate_repeated_keys_hm(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_groupby_multiple_keys_order_hm(self):
+        raise SkipTest("Not supported")
+
     def test_dataset_sort_vdim_hm(self):
         exception = ('Compressed format cannot be sorted, either instantiate '
                      'in the desired order or use the expanded format.')
@@ -352,6 +358,13 @@ class GridInterfaceTests(BaseGridInterfaceTests):
 
     __test__ = True
 
+    def test_dataset_select_range_unsorted_coordinates(self):
+        ds = Dataset({'x': np.array([3, 1, 2, 5]), 'y': np.arange(4.)},
+                     'x', 'y', datatype=[self.datatype])
+        selected = ds.select(x=(1, 3))
+        self.assertEqual(selected.dimension_values('x'), np.array([1, 2]))
+        self.assertEqual(selected.dimension_values('y'), np.array([1., 2.]))
+
 
 class DaskGridInterfaceTests(GridInterfaceTests):
 
@@ -328,6 +328,12 @@ class ImageElement_ImageInterfaceTests(BaseImageElementInterfaceTests):
 
     __test__ = True
 
+    def test_range_clone_with_new_bounds(self):
+        self.image.range(0, dimension_range=False)
+        clone = self.image.clone(bounds=(-20, 0, 20, 10))
+        self.assertEqual(clone.range(0, dimension_range=False), (-20, 20))
+        self.assertEqual(clone.range(2), (0, 81))
+
 
 class BaseRGBElementInterfaceTests(InterfaceTests):
 
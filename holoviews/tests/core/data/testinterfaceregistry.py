@@ -0,0 +1,45 @@
+"""
+Tests for the deferred registration of data interfaces.
+"""
+from unittest import skipIf
+
+from holoviews.core.data import Dataset
+from holoviews.core.data.interface import Interface, InterfaceRegistry
+from holoviews.element.comparison import ComparisonTestCase
+
+try:
+    import xarray
+except ImportError:
+    xarray = None
+
+
+class InterfaceRegistryTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.registry = InterfaceRegistry()
+        self.registry.defer('test', 'holoviews.core.data.missing', 'missing_library')
+
+    def test_deferred_datatype_contained(self):
+        self.assertTrue('test' in self.registry)
+        self.assertTrue(self.registry.deferred('test'))
+
+    def test_deferred_datatype_not_resolved_by_values(self):
+        self.assertEqual(list(self.registry.values()), [])
+        self.assertTrue(self.registry.deferred('test'))
+
+    def test_deferred_datatype_failed_import(self):
+        self.assertIs(self.registry.get('test'), None)
+        self.assertFalse('test' in self.registry)
+        self.assertFalse(self.registry.deferred('test'))
+
+    @skipIf(xarray is None, 'Test requires xarray')
+    def test_deferred_datatype_resolves_on_lookup(self):
+        interface = Interface.interfaces['xarray']
+        self.assertEqual(interface.datatype, 'xarray')
+        self.assertFalse(Interface.interfaces.deferred('xarray'))
+
+    @skipIf(xarray is None, 'Test requires xarray')
+    def test_explicit_deferred_datatype(self):
+        ds = Dataset(([0, 1], [0, 1], [[0, 1], [2, 3]]), ['x', 'y'], 'z',
+                     datatype=['xarray'])
+        self.assertEqual(ds.interface.datatype, 'xarray')
@@ -28,6 +28,14 @@ class BasePandasInterfaceTests(HeterogeneousColumnTests, InterfaceTests):
         ds = Dataset(([1, 2, 3], [1, 2, 3]), ['A', 'B'], ['A'])
         self.assertEqual(list(ds.data.columns), ['A', 'B'])
 
+    def test_dataset_range_cache_shared_with_clone(self):
+        ds = Dataset(([1, 2, 3], [4, 5, 6]), ['A'], ['B'])
+        self.assertEqual(ds.range('B'), (4, 6))
+        clone = ds.clone()
+        self.assertIs(clone.data, ds.data)
+        self.assertIs(clone._get_range_cache(), ds._get_range_cache())
+        self.assertEqual(clone.range('B'), (4, 6))
+
     def test_dataset_empty_list_init_dtypes(self):
         dataset = Dataset([], kdims=['x'], vdims=['y'])
         for d in 'xy':
@@ -304,6 +304,11 @@ class DaskXArrayInterfaceTest(XArrayInterfaceTests):
         self.dataset_hm_alias = Dataset((self.xs, dask_y),
                                         kdims=[('x', 'X')], vdims=[('y', 'Y')])
 
+    def test_dataset_nbytes(self):
+        # Only the in-memory coordinates are counted
+        ds = self.dataset_hm
+        self.assertEqual(ds.interface.nbytes(ds), self.xs.nbytes)
+
     def init_grid_data(self):
         import dask.array
         self.grid_xs = [0, 1]
@@ -10,6 +10,8 @@ except:
 
 from holoviews import Dataset, Curve, Dimension, Scatter, Distribution
 from holoviews.core import Apply, Redim
+from holoviews.core.data import disable_pipeline
+from holoviews.core.util import config
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.operation import histogram, function
 
@@ -844,3 +846,70 @@ class OperationTestCase(DatasetPropertyTestCase):
         op._propagate_dataset = False
         new_ds = op(self.ds)
         self.assertEqual(new_ds.dataset, new_ds)
+
+
+class PipelineCompactionTestCase(DatasetPropertyTestCase):
+    def test_select_disjoint_dimensions_compacted(self):
+        ds_select = self.ds.select(a=(1, 3)).select(b=10)
+
+        ops = ds_select.pipeline.operations
+        self.assertEqual(len(ops), 2)
+        self.assertEqual(ops[1].method_name, 'select')
+        self.assertEqual(ops[1].kwargs, {'a': (1, 3), 'b': 10})
+        self.assertEqual(ds_select.pipeline(ds_select.dataset), ds_select)
+
+    def test_select_same_dimension_not_compacted(self):
+        ds_select = self.ds.select(b=(10, 30)).select(b=(20, 40))
+
+        ops = ds_select.pipeline.operations
+        self.assertEqual(len(ops), 3)
+        self.assertEqual(ds_select.pipeline(ds_select.dataset), ds_select)
+
+    def test_repeated_sort_compacted(self):
+        curve = self.ds.to.curve('a', 'b', groupby=[])
+        curve_sorted = curve.sort('a').sort('a')
+
+        ops = curve_sorted.pipeline.operations
+        self.assertEqual(len(ops), 3)
+        self.assertEqual(ops[2].method_name, 'sort')
+        self.assertEqual(curve_sorted.pipeline(curve_sorted.dataset), curve_sorted)
+
+    def test_repeated_constructor_compacted(self):
+        curve = Curve(self.df, 'a', 'b')
+        curve2 = Curve(curve, 'a', 'b')
+
+        ops = curve2.pipeline.operations
+        self.assertEqual(len(ops), 1)
+        self.assertIs(ops[0].output_type, Curve)
+
+
+class DisablePipelineTestCase(DatasetPropertyTestCase):
+    def test_disable_pipeline_context(self):
+        with disable_pipeline():
+            ds_select = self.ds.select(b=10)
+        self.assertTrue(config.track_pipelines)
+
+        # Untracked pipeline starts from the object itself
+        ops = ds_select.pipeline.operations
+        self.assertEqual(len(ops), 1)
+        self.assertIs(ds_select.dataset, ds_select)
+        self.assertEqual(ds_select.pipeline(ds_select.dataset), ds_select)
+
+    def test_disable_pipeline_config(self):
+        config.track_pipelines = False
+        try:
+            curve = Curve(self.ds, 'a', 'b')
+        finally:
+            config.track_pipelines = True
+        self.assertIs(curve._pipeline, None)
+        self.assertEqual(curve.pipeline(curve.dataset), curve)
+
+    def test_pipeline_resumes_after_disabled(self):
+        with disable_pipeline():
+            ds_select = self.ds.select(b=10)
+        ds_sorted = ds_select.sort('a')
+
+        ops = ds_sorted.pipeline.operations
+        self.assertEqual(len(ops), 2)
+        self.assertEqual(ops[1].method_name, 'sort')
+        self.assertEqual(ds_sorted.pipeline(ds_sorted.dataset), ds_sorted)
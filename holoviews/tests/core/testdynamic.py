@@ -706,6 +706,145 @@ class DynamicCallableMemoize(ComparisonTestCase):
         self.assertEqual(dmap[()], Curve([1, 1, 1, 2, 2, 2]))
 
 
+class CallableMemoizeSize(ComparisonTestCase):
+
+    def setUp(self):
+        self.calls = []
+        def callback(x):
+            self.calls.append(x)
+            return Curve([(0, x)])
+        self.callback = callback
+
+    def test_callable_memoize_single_value(self):
+        callable_obj = Callable(self.callback)
+        for x in [0, 1, 0, 1]:
+            callable_obj(x)
+        self.assertEqual(self.calls, [0, 1, 0, 1])
+
+    def test_callable_memoize_multiple_values(self):
+        callable_obj = Callable(self.callback, memoize_size=2)
+        for x in [0, 1, 0, 1]:
+            callable_obj(x)
+        self.assertEqual(self.calls, [0, 1])
+
+    def test_callable_memoize_discards_least_recently_used(self):
+        callable_obj = Callable(self.callback, memoize_size=2)
+        for x in [0, 1, 0, 2, 0, 1]:
+            callable_obj(x)
+        self.assertEqual(self.calls, [0, 1, 2, 1])
+
+    def test_callable_memoize_timeout(self):
+        callable_obj = Callable(self.callback, memoize_size=2, memoize_timeout=0)
+        callable_obj(0)
+        time.sleep(0.01)
+        callable_obj(0)
+        self.assertEqual(self.calls, [0, 0])
+
+    def test_callable_memoize_shared_with_clone(self):
+        callable_obj = Callable(self.callback, memoize_size=2)
+        clone = callable_obj.clone()
+        callable_obj(0)
+        self.assertIs(clone(0), callable_obj(0))
+        self.assertEqual(self.calls, [0])
+
+    def test_callable_memoize_not_shared_with_new_callable(self):
+        callable_obj = Callable(self.callback, memoize_size=2)
+        clone = callable_obj.clone(lambda x: Curve([(1, x)]))
+        callable_obj(0)
+        self.assertEqual(clone(0), Curve([(1, 0)]))
+
+    def test_dynamic_stream_toggle_memoized(self):
+        stream = PointerX(x=0)
+        dmap = DynamicMap(Callable(self.callback, memoize_size=2), streams=[stream])
+        for x in [0, 1, 0, 1]:
+            stream.event(x=x)
+            dmap[()]
+        self.assertEqual(self.calls, [0, 1])
+
+
+class DynamicMapCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.calls = []
+        def callback(x):
+            self.calls.append(x)
+            return Image(np.zeros((10, 10)))
+        self.callback = callback
+
+    def test_dynamic_cache_evicts_least_recently_used(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_size=2)
+        dmap[0]
+        dmap[1]
+        dmap[0]
+        dmap[2]
+        self.assertEqual(list(dmap.keys()), [0, 2])
+
+    def test_dynamic_cache_eviction_keeps_sort_index(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_size=2)
+        for key in [3, 1, 2, 0]:
+            dmap[key]
+        self.assertEqual(list(dmap.keys()), [0, 2])
+        self.assertEqual(dmap._get_sort_index(), [(0,), (2,)])
+
+    def test_dynamic_cache_hit_skips_callback(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_size=2)
+        for key in [0, 1, 0, 1, 0]:
+            dmap[key]
+        self.assertEqual(self.calls, [0, 1])
+
+    def test_dynamic_cache_bytes_budget(self):
+        nbytes = DynamicMap._estimate_nbytes(Image(np.zeros((10, 10))))
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_bytes=nbytes*2)
+        for key in [0, 1, 0, 2]:
+            dmap[key]
+        self.assertEqual(list(dmap.keys()), [0, 2])
+        self.assertEqual(dmap.cache_info['nbytes'], nbytes*2)
+
+    def test_dynamic_cache_bytes_keeps_oversized_item(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_bytes=1)
+        dmap[0]
+        dmap[1]
+        self.assertEqual(list(dmap.keys()), [1])
+
+    def test_dynamic_cache_info(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_size=2)
+        for key in [0, 1, 0, 2, 1]:
+            dmap[key]
+        info = dmap.cache_info
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 4)
+        self.assertEqual(info['evictions'], 2)
+        self.assertEqual(info['size'], 2)
+
+    def test_dynamic_cache_reset_clears_info(self):
+        dmap = DynamicMap(self.callback, kdims=['x'])
+        dmap[0]
+        dmap[0]
+        dmap.reset()
+        self.assertEqual(dmap.cache_info, dict(hits=0, misses=0, evictions=0,
+                                               size=0, nbytes=0))
+
+    def test_dynamic_cache_info_nbytes_after_direct_modification(self):
+        nbytes = DynamicMap._estimate_nbytes(Image(np.zeros((10, 10))))
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_size=3)
+        dmap[0]
+        dmap.data[(5,)] = Image(np.zeros((10, 10)))
+        self.assertEqual(dmap.cache_info['nbytes'], nbytes*2)
+        dmap[1]
+        dmap[2]
+        self.assertEqual(list(dmap.keys()), [0, 1, 2])
+        self.assertEqual(dmap.cache_info['nbytes'], nbytes*3)
+        dmap.data.pop((0,))
+        self.assertEqual(dmap.cache_info['nbytes'], nbytes*2)
+
+    def test_dynamic_cache_initial_items_evicted_first(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_size=2)
+        dmap.data[(5,)] = Image(np.zeros((10, 10)))
+        dmap[0]
+        dmap[1]
+        self.assertEqual(list(dmap.keys()), [0, 1])
+
+
 class StreamSubscribersAddandClear(ComparisonTestCase):
 
     def setUp(self):
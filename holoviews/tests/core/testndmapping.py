@@ -1,3 +1,5 @@
+import pickle
+
 from collections import OrderedDict
 
 from holoviews.core import Dimension
@@ -201,6 +203,82 @@ class NdIndexableMappingTest(ComparisonTestCase):
         ndmap.update({'A': nested2})
         self.assertEqual(ndmap['A'].data, nested_clone.data)
 
+    def test_setitem_sorted_insertion(self):
+        ndmap = MultiDimensionalMapping(kdims=[self.dim1])
+        for key in [3, 1, 4, 0, 5, 2]:
+            ndmap[key] = str(key)
+        self.assertEqual(ndmap.keys(), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(ndmap.values(), ['0', '1', '2', '3', '4', '5'])
+
+    def test_setitem_sorted_insertion_categorical(self):
+        dim = Dimension('cat', values=['C', 'A', 'B'])
+        ndmap = MultiDimensionalMapping([('A', 1)], kdims=[dim])
+        ndmap['B'] = 2
+        ndmap['C'] = 0
+        self.assertEqual(ndmap.keys(), ['C', 'A', 'B'])
+
+    def test_setitem_sorted_insertion_mixed_types(self):
+        ndmap = MultiDimensionalMapping([(1, 'a'), ('B', 'b')])
+        ndmap[0] = 'c'
+        ndmap['A'] = 'd'
+        self.assertEqual(ndmap.keys(), [0, 1, 'A', 'B'])
+
+    def test_setitem_sorted_insertion_preserves_data(self):
+        ndmap = MultiDimensionalMapping([(1, 'a'), (3, 'b'), (4, 'c')], kdims=[self.dim1])
+        data = ndmap.data
+        ndmap[2] = 'd'
+        self.assertIs(ndmap.data, data)
+        self.assertEqual(ndmap.keys(), [1, 2, 3, 4])
+        self.assertEqual(ndmap.values(), ['a', 'd', 'b', 'c'])
+
+    def test_setitem_sorted_insertion_after_pickling(self):
+        ndmap = MultiDimensionalMapping([(1, 'a'), (3, 'b')], kdims=[self.dim1])
+        ndmap = pickle.loads(pickle.dumps(ndmap))
+        ndmap[2] = 'c'
+        self.assertEqual(ndmap.keys(), [1, 2, 3])
+
+    def test_setitem_sorted_insertion_after_direct_modification(self):
+        ndmap = MultiDimensionalMapping([(1, 'a'), (3, 'b')], kdims=[self.dim1])
+        ndmap.data[(0,)] = 'c'
+        ndmap[2] = 'd'
+        self.assertEqual(ndmap.keys(), [0, 1, 2, 3])
+
+    def test_ndmapping_slice_after_insertion(self):
+        ndmap = NdMapping(self.init_item_list, kdims=[self.dim1, self.dim2])
+        ndmap[3, 1.0] = 'c'
+        ndmap[0, 3.0] = 'd'
+        self.assertEqual(ndmap[1:5, 1.5:].keys(), [(1, 2.0)])
+        self.assertEqual(ndmap[:, 3.0].keys(), [(0, 3.0), (5, 3.0)])
+        self.assertEqual(ndmap[[5, 3], :].keys(), [(3, 1.0), (5, 3.0)])
+
+    def test_ndmapping_slice_categorical(self):
+        dim = Dimension('cat', values=['C', 'A', 'B'])
+        ndmap = NdMapping([(('A', 1), 'a'), (('B', 2), 'b'), (('C', 3), 'c')],
+                          kdims=[dim, self.dim1])
+        self.assertEqual(ndmap['C':'B', :].keys(), [('C', 3), ('A', 1)])
+        self.assertEqual(ndmap[['B', 'C'], 2:].keys(), [('C', 3), ('B', 2)])
+
+    def test_ndmapping_slice_unsorted(self):
+        data = [((3, 'B'), 1), ((1, 'C'), 2), ((2, 'A'), 3)]
+        ndmap = NdMapping(data, kdims=['X', 'Y'], sort=False)
+        self.assertEqual(ndmap[2:, :].keys(), [(3, 'B'), (2, 'A')])
+
+    def test_ndmapping_slice_callable(self):
+        ndmap = NdMapping(self.init_item_list, kdims=['intdim', self.dim2])
+        self.assertEqual(ndmap[lambda x: x > 2, :].keys(), [(5, 3.0)])
+
+    def test_ndmapping_slice_after_pickling(self):
+        ndmap = NdMapping(self.init_item_list, kdims=[self.dim1, self.dim2])
+        ndmap[[5], :]
+        ndmap = pickle.loads(pickle.dumps(ndmap))
+        ndmap[3, 1.0] = 'c'
+        self.assertEqual(ndmap[[3, 5], :].keys(), [(3, 1.0), (5, 3.0)])
+
+    def test_ndmapping_slice_list_missing_keys(self):
+        ndmap = NdMapping(self.init_item_list, kdims=[self.dim1, self.dim2])
+        self.assertEqual(ndmap._select_keys(([0, 5, 7], slice(None))), [(5, 3.0)])
+        self.assertEqual(ndmap[[0, 5, 7], :].keys(), [(5, 3.0)])
+
 
 class UniformNdMappingTest(ComparisonTestCase):
 
@@ -1,6 +1,9 @@
+import time
+
 import param
 
 from holoviews.core.operation import Operation
+from holoviews.core.spaces import HoloMap
 from holoviews.element import Curve
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.streams import Stream, Params
@@ -68,3 +71,86 @@ class TestOperationBroadcast(ComparisonTestCase):
         inst = ParamClass(label='Test')
         applied = TestOperation(curve, dynamic=False, label=inst.dynamic_label)
         self.assertEqual(applied, curve.relabel('Test!'))
+
+
+class PerElementOperation(TestOperation):
+
+    _per_element = True
+
+
+class StatefulOperation(TestOperation):
+
+    _per_element = True
+
+    def _process(self, obj, key=None):
+        # Consumes the label like histogram consumes its groupby
+        time.sleep(0.05)
+        label = self.p.label
+        self.p.label = 'Consumed'
+        return obj.relabel(label)
+
+
+class FailingOperation(Operation):
+
+    def _process(self, obj, key=None):
+        if obj.range(1) == (1, 2):
+            raise ValueError('Frame failed')
+        return obj
+
+
+class TestOperationParallel(ComparisonTestCase):
+
+    def setUp(self):
+        self.hmap = HoloMap({i: Curve([1, 2, i]) for i in range(4)}, kdims='X')
+
+    def test_holomap_executor_threads(self):
+        applied = TestOperation(self.hmap, label='Test', executor='threads')
+        expected = TestOperation(self.hmap, label='Test')
+        self.assertEqual(applied, expected)
+        self.assertEqual(list(applied.keys()), list(self.hmap.keys()))
+
+    def test_holomap_executor_threads_max_workers(self):
+        applied = TestOperation(self.hmap, label='Test', executor='threads',
+                                max_workers=2)
+        self.assertEqual(applied, self.hmap.map(lambda x: x.relabel('Test'), Curve))
+
+    def test_holomap_executor_instance(self):
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(2) as pool:
+            applied = TestOperation(self.hmap, label='Test', executor=pool)
+        self.assertEqual(applied, TestOperation(self.hmap, label='Test'))
+
+    def test_holomap_executor_processes_per_element(self):
+        hmap = self.hmap * self.hmap
+        applied = PerElementOperation(hmap, label='Test', executor='processes',
+                                      max_workers=2)
+        expected = PerElementOperation(hmap, label='Test')
+        self.assertEqual(applied, expected)
+        self.assertEqual([el.label for el in applied.last], ['Test', 'Test'])
+
+    def test_holomap_executor_stateful_operation_multiple_workers(self):
+        from concurrent.futures import ThreadPoolExecutor
+        hmap = self.hmap * self.hmap
+        with ThreadPoolExecutor(4) as pool:
+            applied = StatefulOperation(hmap, label='Test', executor=pool)
+        self.assertEqual(applied, StatefulOperation(hmap, label='Test'))
+        for overlay in applied:
+            self.assertEqual([el.label for el in overlay], ['Test', 'Test'])
+
+    def test_holomap_executor_error_propagates(self):
+        with self.assertRaises(ValueError):
+            FailingOperation(self.hmap, executor='threads')
+
+    def test_holomap_invalid_executor(self):
+        with self.assertRaises(ValueError):
+            TestOperation(self.hmap, executor='fibers')
+
+    def test_holomap_map_executor_threads(self):
+        fn = lambda x: x.relabel('Test')
+        self.assertEqual(self.hmap.map(fn, Curve, executor='threads'),
+                         self.hmap.map(fn, Curve))
+
+    def test_holomap_apply_executor_threads(self):
+        fn = lambda x: x.relabel('Test')
+        self.assertEqual(self.hmap.apply(fn, executor='threads'),
+                         self.hmap.apply(fn))
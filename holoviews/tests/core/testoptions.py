@@ -568,6 +568,30 @@ class TestStoreInheritance(ComparisonTestCase):
         opts = Store.lookup_options('matplotlib', hist2, 'style').kwargs
         self.assertEqual(opts, {'style1': 'style_child', 'style2': 'style2'})
 
+    def test_lookup_options_cached(self):
+        lookup = self.lookup_options(self.hist, 'style')
+        self.assertIs(self.lookup_options(self.hist, 'style'), lookup)
+
+    def test_lookup_options_cache_invalidated_on_tree_update(self):
+        self.lookup_options(self.hist, 'style')
+        Store.options().Histogram = Options('style', style1='updated')
+        self.assertEqual(self.lookup_options(self.hist, 'style').options,
+                         dict(style1='updated', style2='style2'))
+
+    def test_lookup_options_cache_kept_on_unrelated_tree_update(self):
+        lookup = self.lookup_options(self.hist, 'style')
+        options = OptionTree(groups=['plot', 'style'])
+        options.Histogram = Options('style', style1='unrelated')
+        self.assertIs(self.lookup_options(self.hist, 'style'), lookup)
+
+    def test_lookup_options_cache_invalidated_on_tree_replacement(self):
+        self.lookup_options(self.hist, 'plot')
+        options = OptionTree(groups=['plot', 'style'])
+        options.Histogram = Options('plot', plot1='replaced')
+        Store.options(val=options)
+        self.assertEqual(self.lookup_options(self.hist, 'plot').options,
+                         dict(plot1='replaced'))
+
 
 
 class TestOptionsMethod(ComparisonTestCase):
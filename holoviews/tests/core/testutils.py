@@ -19,7 +19,8 @@ from holoviews.core.util import (
     sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams,
     deephash, merge_dimensions, get_path, make_path_unique, compute_density,
     date_range, dt_to_int, compute_edges, isfinite, cross_index, closest_match,
-    dimension_range, tree_attribute
+    dimension_range, tree_attribute, fingerprint, parallel_map,
+    isin, sorted_range_mask, finite_ranges, uniform_bin_counts
 )
 from holoviews import Dimension, Element
 from holoviews.streams import PointerXY
@@ -141,6 +142,96 @@ class TestDeepHash(ComparisonTestCase):
         self.assertNotEqual(deephash(obj1), deephash(obj2))
 
 
+class TestFingerprint(ComparisonTestCase):
+    """
+    Tests of fingerprint function used to hash array-like data.
+    """
+
+    def test_fingerprint_unsupported_type(self):
+        self.assertIs(fingerprint([1, 2, 3]), None)
+
+    def test_fingerprint_numpy_equality(self):
+        self.assertEqual(fingerprint(np.arange(10)), fingerprint(np.arange(10)))
+
+    def test_fingerprint_numpy_dtype_inequality(self):
+        self.assertNotEqual(fingerprint(np.arange(10)),
+                            fingerprint(np.arange(10).astype('int32')))
+
+    def test_fingerprint_numpy_shape_inequality(self):
+        self.assertNotEqual(fingerprint(np.arange(10)),
+                            fingerprint(np.arange(10).reshape(2, 5)))
+
+    def test_fingerprint_numpy_noncontiguous(self):
+        arr = np.arange(20).reshape(4, 5)
+        self.assertEqual(fingerprint(arr.T), fingerprint(arr.T.copy()))
+
+    def test_fingerprint_numpy_datetime(self):
+        arr = np.array(['2020-01-01', '2020-01-02'], dtype='datetime64[ns]')
+        self.assertNotEqual(fingerprint(arr), fingerprint(arr+1))
+
+    def test_fingerprint_numpy_object(self):
+        self.assertEqual(fingerprint(np.array(['a', 1], dtype=object)),
+                         fingerprint(np.array(['a', 1], dtype=object)))
+
+    def test_fingerprint_numpy_readonly_cached(self):
+        from holoviews.core import util
+        arr = np.arange(10)
+        arr.flags.writeable = False
+        self.assertEqual(fingerprint(arr), fingerprint(np.arange(10)))
+        self.assertIn(id(arr), util._array_fingerprints)
+        key = id(arr)
+        del arr
+        self.assertNotIn(key, util._array_fingerprints)
+
+    def test_fingerprint_numpy_readonly_made_writeable(self):
+        arr = np.arange(10)
+        arr.flags.writeable = False
+        before = fingerprint(arr)
+        arr.flags.writeable = True
+        arr[0] = 10
+        self.assertNotEqual(fingerprint(arr), before)
+
+    @pd_skip
+    def test_fingerprint_dataframe_column_inequality(self):
+        self.assertNotEqual(fingerprint(pd.DataFrame({'a': [1, 2]})),
+                            fingerprint(pd.DataFrame({'b': [1, 2]})))
+
+    @pd_skip
+    def test_fingerprint_dataframe_index_inequality(self):
+        self.assertNotEqual(fingerprint(pd.DataFrame({'a': [1, 2]})),
+                            fingerprint(pd.DataFrame({'a': [1, 2]}, index=[1, 2])))
+
+    @pd_skip
+    def test_fingerprint_dataframe_object_inequality(self):
+        self.assertNotEqual(fingerprint(pd.DataFrame({'a': ['x', 'y']})),
+                            fingerprint(pd.DataFrame({'a': ['x', 'z']})))
+
+    @pd_skip
+    def test_fingerprint_categorical_series_equality(self):
+        self.assertEqual(fingerprint(pd.Series(['a', 'b'], dtype='category')),
+                         fingerprint(pd.Series(['a', 'b'], dtype='category')))
+
+    def test_fingerprint_xarray_inequality(self):
+        try:
+            import xarray as xr
+        except ImportError:
+            raise SkipTest('Test requires xarray')
+        arr = xr.DataArray(np.zeros((2, 3)), dims=['y', 'x'],
+                           coords={'x': [0, 1, 2], 'y': [0, 1]})
+        self.assertEqual(fingerprint(arr), fingerprint(arr.copy()))
+        self.assertNotEqual(fingerprint(arr), fingerprint(arr+1))
+
+    def test_fingerprint_dask_array_equality(self):
+        try:
+            import dask.array as da
+        except ImportError:
+            raise SkipTest('Test requires dask')
+        self.assertEqual(fingerprint(da.zeros(10, chunks=5)),
+                         fingerprint(da.zeros(10, chunks=5)))
+        self.assertNotEqual(fingerprint(da.zeros(10, chunks=5)),
+                            fingerprint(da.ones(10, chunks=5)))
+
+
 class TestAllowablePrefix(ComparisonTestCase):
     """
     Tests of allowable and hasprefix method.
@@ -883,3 +974,88 @@ class TestClosestMatch(ComparisonTestCase):
         self.assertEqual(closest_match(spec, specs), None)
         spec = ('Scatter', 'Foo', 'Bar', 5)
         self.assertEqual(closest_match(spec, specs), None)
+
+
+class TestParallelMap(ComparisonTestCase):
+
+    def test_parallel_map_sequential(self):
+        self.assertEqual(parallel_map(lambda x, y: x+y, [1, 2], [3, 4]), [4, 6])
+
+    def test_parallel_map_threads_preserves_order(self):
+        self.assertEqual(parallel_map(lambda x: x*2, range(10), executor='threads'),
+                         [x*2 for x in range(10)])
+
+    def test_parallel_map_invalid_executor(self):
+        with self.assertRaises(ValueError):
+            parallel_map(lambda x: x, [1], executor='fibers')
+
+    def test_parallel_map_unknown_keyword(self):
+        with self.assertRaises(TypeError):
+            parallel_map(lambda x: x, [1], workers=2)
+
+
+class TestIsin(ComparisonTestCase):
+
+    def test_isin_numeric(self):
+        self.assertEqual(isin(np.array([1, 2, 3, 4]), [2, 4.0]),
+                         np.array([False, True, False, True]))
+
+    def test_isin_nan_not_matched(self):
+        self.assertEqual(isin(np.array([1, np.nan]), [np.nan]),
+                         np.array([False, False]))
+
+    def test_isin_strings(self):
+        self.assertEqual(isin(np.array(['A', 'B', 'C']), {'A', 'C'}),
+                         np.array([True, False, True]))
+
+    def test_isin_mixed_object(self):
+        arr = np.array(['A', 1, None], dtype=object)
+        self.assertEqual(isin(arr, ['A', 1]), np.array([True, True, False]))
+
+    def test_isin_empty_selection(self):
+        self.assertEqual(isin(np.array([1, 2]), []), np.array([False, False]))
+
+    def test_sorted_range_mask_ascending(self):
+        arr = np.arange(10)
+        self.assertEqual(sorted_range_mask(arr, 2, 5), (arr >= 2) & (arr < 5))
+
+    def test_sorted_range_mask_descending(self):
+        arr = np.arange(10)[::-1]
+        self.assertEqual(sorted_range_mask(arr, 2, 5), (arr >= 2) & (arr < 5))
+
+    def test_sorted_range_mask_open_bounds(self):
+        arr = np.arange(10)
+        self.assertEqual(sorted_range_mask(arr, None, 3), arr < 3)
+        self.assertEqual(sorted_range_mask(arr[::-1], 7, None), arr[::-1] >= 7)
+
+
+class TestHistogramKernels(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.values = np.random.randn(1000)
+        self.values[::10] = np.NaN
+        self.values[5] = np.inf
+
+    def test_finite_ranges(self):
+        finite = self.values[np.isfinite(self.values)]
+        ranges = finite_ranges([self.values, np.arange(5)], chunksize=64)
+        self.assertEqual(ranges, [(finite.min(), finite.max()), (0, 4)])
+
+    def test_finite_ranges_no_finite_values(self):
+        (lower, upper), = finite_ranges([np.array([np.NaN, np.inf])])
+        self.assertTrue(np.isnan(lower) and np.isnan(upper))
+
+    def test_uniform_bin_counts_matches_histogram(self):
+        finite = self.values[np.isfinite(self.values)]
+        for bin_range in [(finite.min(), finite.max()), (-1, 0.5)]:
+            counts, = uniform_bin_counts([self.values], [bin_range], 17, chunksize=64)
+            self.assertEqual(counts, np.histogram(finite, 17, bin_range)[0])
+
+    def test_uniform_bin_counts_weighted_nonzero(self):
+        weights = np.random.rand(1000)
+        mask = np.isfinite(self.values) & (self.values > 0)
+        counts, = uniform_bin_counts([self.values], [(-1, 2)], 10, weights,
+                                     nonzero=True, chunksize=64)
+        expected = np.histogram(self.values[mask], 10, (-1, 2), weights=weights[mask])[0]
+        self.assertEqual(counts, expected)
@@ -8,8 +8,10 @@ except ImportError:
     pd = None
 
 from holoviews.core import HoloMap
-from holoviews.element import Image, Contours, Curve
+from holoviews.core.util import config
+from holoviews.element import Image, Contours, Curve, Points, Scatter
 from holoviews.element.comparison import ComparisonTestCase
+from holoviews.element.util import SpatialIndex
 
 class DimensionedSelectionTest(ComparisonTestCase):
 
@@ -121,3 +123,56 @@ class DimensionedSelectionTest(ComparisonTestCase):
                 ValueError, "Use the selection_specs keyword"
         ):
             curve.select((Curve,), time=(s, e))
+
+
+class SpatialIndexSelectionTest(ComparisonTestCase):
+
+    def setUp(self):
+        self._spatial_index = config.spatial_index
+        config.spatial_index = True
+        xs, ys = np.random.randn(2, 1000)
+        xs[::50] = np.nan
+        self.points = Points((xs, ys, np.arange(1000)), vdims='z')
+
+    def tearDown(self):
+        config.spatial_index = self._spatial_index
+
+    def test_spatial_index_query(self):
+        xs, ys = self.points.array([0, 1]).T
+        index = SpatialIndex(xs, ys)
+        mask = (xs >= -0.5) & (xs < 1) & (ys >= 0) & (ys < 2)
+        self.assertEqual(index.query((-0.5, 1), (0, 2)), np.flatnonzero(mask))
+
+    def test_spatial_index_query_open_range(self):
+        xs, ys = self.points.array([0, 1]).T
+        index = SpatialIndex(xs, ys)
+        mask = np.isfinite(xs) & (ys < 0)
+        self.assertEqual(index.query((None, None), (None, 0)), np.flatnonzero(mask))
+
+    def test_spatial_index_nearest(self):
+        xs, ys = self.points.array([0, 1]).T
+        index = SpatialIndex(xs, ys)
+        for x, y in [(0, 0), (5, -5), (0.3, 0.1)]:
+            self.assertEqual(index.nearest(x, y), np.nanargmin(np.hypot(xs-x, ys-y)))
+
+    def test_points_select_box(self):
+        selected = self.points.select(x=(-0.5, 1), y=(0, 2))
+        config.spatial_index = False
+        self.assertEqual(selected, self.points.select(x=(-0.5, 1), y=(0, 2)))
+        self.assertIs(self.points._spatial_index[0], self.points.data)
+
+    def test_points_select_scalar_not_indexed(self):
+        self.points.select(z=(0, 10))
+        self.assertFalse(hasattr(self.points, '_spatial_index'))
+
+    def test_scatter_select_box(self):
+        scatter = Scatter(self.points.array([0, 1]))
+        selected = scatter.select(x=(-0.5, 1), y=(0, 2))
+        config.spatial_index = False
+        self.assertEqual(selected, scatter.select(x=(-0.5, 1), y=(0, 2)))
+
+    def test_points_closest(self):
+        points = Points([(0, 0), (1, 1), (2, 0)])
+        self.assertEqual(points.closest([(0.9, 0.8), (2.5, -1)]), [(1, 1), (2, 0)])
+        config.spatial_index = False
+        self.assertEqual(points.closest([(0.9, 0.8), (2.5, -1)]), [(1, 1), (2, 0)])
@@ -11,7 +11,7 @@ from holoviews.element.chart import Points
 from holoviews.element.graphs import (
     Graph, Nodes, TriMesh, Chord, circular_layout, connect_edges,
     connect_edges_pd)
-from holoviews.element.sankey import Sankey
+from holoviews.element.sankey import Sankey, _layout_sankey
 from holoviews.element.comparison import ComparisonTestCase
 
 pd_skip = skipIf(util.pd is None, 'Pandas not available')
@@ -45,6 +45,19 @@ class GraphTests(ComparisonTestCase):
             paths.append(np.array([start[:2], end[:2]]))
         self.assertEqual(segments, paths)
 
+    def test_graph_edge_segments_unsorted_string_ids(self):
+        nodes = Nodes(([0, 1, 2], [3, 4, 5], ['C', 'A', 'B']))
+        graph = Graph(((['A', 'C'], ['B', 'A']), nodes))
+        segments = connect_edges(graph)
+        self.assertEqual(segments, [np.array([[1, 4], [2, 5]]),
+                                    np.array([[0, 3], [1, 4]])])
+
+    def test_graph_edge_segments_missing_node_raises(self):
+        nodes = Nodes(([0, 1], [0, 1], [0, 1]))
+        graph = Graph((([0, 1], [1, 2]), nodes))
+        with self.assertRaises(ValueError):
+            connect_edges(graph)
+
     def test_graph_node_info_no_index(self):
         node_info = Dataset(np.arange(8), vdims=['Label'])
         graph = Graph(((self.source, self.target), node_info))
@@ -335,3 +348,23 @@ class TestSankey(ComparisonTestCase):
             'y1': 0.0
         }
         self.assertEqual(links[0], link)
+
+    def test_sankey_array_layout(self):
+        edges = [('A', 'X', 5), ('A', 'Y', 7), ('A', 'Z', 6), ('B', 'X', 2),
+                 ('B', 'Y', 9), ('B', 'Z', 4), ('X', 'C', 6), ('Y', 'C', 10)]
+        sankey = Sankey(edges)
+        nodes, edgepaths, graph = _layout_sankey.instance(method='array').layout(sankey)
+        self.assertEqual(nodes, sankey.nodes)
+        self.assertEqual(edgepaths, sankey.edgepaths)
+        for node, expected in zip(graph['nodes'], sankey._sankey['nodes']):
+            self.assertEqual([l['index'] for l in node['sourceLinks']],
+                             [l['index'] for l in expected['sourceLinks']])
+            self.assertEqual([l['index'] for l in node['targetLinks']],
+                             [l['index'] for l in expected['targetLinks']])
+
+    def test_single_edge_sankey_array_layout(self):
+        sankey = Sankey([('A', 'B', 1)])
+        _, _, graph = _layout_sankey.instance(method='array').layout(sankey)
+        self.assertEqual([(n['x0'], n['x1'], n['y0'], n['y1']) for n in graph['nodes']],
+                         [(0, 15, 0, 500), (985, 1000, 0, 500)])
+        self.assertEqual(graph['links'][0]['width'], 500)
@@ -1,12 +1,15 @@
 import datetime as dt
+import gc
+import weakref
 
 from unittest import SkipTest, skipIf
 
 import numpy as np
 from holoviews import (Dimension, Curve, Points, Image, Dataset, RGB, Path,
                        Graph, TriMesh, QuadMesh, NdOverlay, Contours, Spikes,
-                       Spread, Area, Segments, Polygons)
+                       Spread, Area, Segments, Polygons, DynamicMap)
 from holoviews.element.comparison import ComparisonTestCase
+from holoviews.streams import Buffer
 
 try:
     import datashader as ds
@@ -59,6 +62,21 @@ class DatashaderAggregateTests(ComparisonTestCase):
         self.assertIsInstance(img.data.Count.data, cupy.ndarray)
         self.assertEqual(img, expected)
 
+    def test_aggregate_points_incremental_buffer(self):
+        buff = Buffer(pd.DataFrame({'x': [], 'y': [], 'z': []}), length=50, index=False)
+        dmap = DynamicMap(lambda data: Points(data, vdims='z'), streams=[buff])
+        for agg_fn in [ds.count(), ds.sum('z')]:
+            img = aggregate(dmap, incremental=True, aggregator=agg_fn, x_range=(0, 1),
+                            y_range=(0, 1), width=4, height=4)
+            for i in range(5):
+                buff.send(pd.DataFrame({'x': np.random.rand(20), 'y': np.random.rand(20),
+                                        'z': np.random.rand(20)}))
+                expected = aggregate(Points(buff.data, vdims='z'), dynamic=False,
+                                     aggregator=agg_fn, x_range=(0, 1), y_range=(0, 1),
+                                     width=4, height=4)
+                self.assertEqual(img[()], expected)
+            buff.clear()
+
     def test_aggregate_zero_range_points(self):
         p = Points([(0, 0), (1, 1)])
         agg = rasterize(p, x_range=(0, 0), y_range=(0, 1), expand=False, dynamic=False,
@@ -704,6 +722,34 @@ class DatashaderRegridTests(ComparisonTestCase):
         expected = Image(([2., 7.], [0.75, 3.25], [[8, 18], [16, 36]]))
         self.assertEqual(regridded, expected)
 
+    def test_regrid_max_pyramid(self):
+        arr = np.random.rand(16, 16)
+        img = Image((range(16), range(16), arr))
+        regridded = regrid(img, aggregator='max', width=4, height=4, dynamic=False)
+        pyramid = regrid(img, aggregator='max', width=4, height=4, pyramid=True,
+                         dynamic=False)
+        self.assertEqual(pyramid, regridded)
+        refs, levels = regrid._pyramid_cache[img._plot_id]
+        self.assertTrue(all(ref() is v for ref, v in zip(refs, img.data.values())))
+        self.assertEqual(list(levels), [('max', (4, 4))])
+
+    def test_regrid_pyramid_cache_does_not_keep_data_alive(self):
+        img = Image(np.random.rand(16, 16))
+        regrid(img, width=4, height=4, pyramid=True, dynamic=False)
+        refs, levels = regrid._pyramid_cache[img._plot_id]
+        self.assertEqual(len(levels), 1)
+        ref = weakref.ref(img.data)
+        del img
+        gc.collect()
+        self.assertIs(ref(), None)
+
+    def test_regrid_pyramid_full_zoom(self):
+        arr = np.random.rand(16, 16)
+        img = Image((range(16), range(16), arr))
+        regridded = regrid(img, width=16, height=16, pyramid=True, dynamic=False)
+        self.assertNotIn(img._plot_id, regrid._pyramid_cache)
+        self.assertEqual(regridded, regrid(img, width=16, height=16, dynamic=False))
+
     def test_regrid_upsampling(self):
         img = Image(([0.5, 1.5], [0.5, 1.5], [[0, 1], [2, 3]]))
         regridded = regrid(img, width=4, height=4, upsample=True, dynamic=False)
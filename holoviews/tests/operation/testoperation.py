@@ -15,13 +15,15 @@ except:
 
 from holoviews import (HoloMap, NdOverlay, NdLayout, GridSpace, Image,
                        Contours, Polygons, Points, Histogram, Curve, Area,
-                       QuadMesh, Dataset)
+                       QuadMesh, Dataset, Layout, DynamicMap)
 from holoviews.core.data.grid import GridInterface
-from holoviews.core.util import pd
+from holoviews.core.util import pd, config
 from holoviews.element.comparison import ComparisonTestCase
+from holoviews.streams import Buffer
 from holoviews.operation.element import (operation, transform, threshold,
                                          gradient, contours, histogram,
-                                         interpolate_curve)
+                                         interpolate_curve, downsample_image,
+                                         decimate)
 
 pd_skip = skipIf(pd is None, "Pandas not available")
 mpl_skip = skipIf(mpl is None, "Matplotlib is not available")
@@ -275,6 +277,99 @@ class OperationTests(ComparisonTestCase):
         hist = Histogram(([1.,  4., 7.5], [0, 3, 6, 9]), vdims=['y'])
         self.assertEqual(op_hist, hist)
 
+    def test_dataset_histogram_non_finite(self):
+        ds = Dataset([0., 1., np.NaN, 2., np.inf, 3.], 'x')
+        op_hist = histogram(ds, num_bins=3, normed=False)
+        hist = Histogram(([0, 1, 2, 3], [1, 1, 2]),
+                         vdims=('x_count', 'Count'))
+        self.assertEqual(op_hist, hist)
+
+    def test_points_histogram_nonzero(self):
+        points = Points([float(i) for i in range(10)])
+        op_hist = histogram(points, num_bins=3, normed=False, nonzero=True)
+        hist = Histogram(([0, 3, 6, 9], [2, 3, 4]),
+                         vdims=('x_count', 'Count'))
+        self.assertEqual(op_hist, hist)
+
+    def test_dataset_histogram_dimensions(self):
+        ds = Dataset({'x': np.arange(10.), 'y': np.arange(10.)[::-1]*2}, ['x', 'y'])
+        layout = histogram(ds, dimensions=['x', 'y'], num_bins=3, normed=False)
+        self.assertIsInstance(layout, Layout)
+        self.assertEqual(layout.Histogram.I, histogram(ds, dimension='x', num_bins=3, normed=False))
+        self.assertEqual(layout.Histogram.II, histogram(ds, dimension='y', num_bins=3, normed=False))
+
+    @pd_skip
+    def test_points_histogram_incremental_buffer(self):
+        buff = Buffer(pd.DataFrame({'x': [], 'y': []}), length=50, index=False)
+        dmap = DynamicMap(Points, streams=[buff])
+        hist = histogram(dmap, incremental=True, bin_range=(0, 1), normed=False)
+        for i in range(5):
+            buff.send(pd.DataFrame({'x': np.random.rand(20), 'y': np.random.rand(20)}))
+            expected = histogram(Points(buff.data), bin_range=(0, 1), normed=False)
+            self.assertEqual(hist[()], expected)
+        self.assertIsNot(hist.callback.operation._buffer_state, None)
+
+    @pd_skip
+    def test_points_histogram_incremental_buffer_auto_range(self):
+        buff = Buffer(pd.DataFrame({'x': [], 'y': []}), length=50, index=False)
+        dmap = DynamicMap(Points, streams=[buff])
+        hist = histogram(dmap, incremental=True, num_bins=5)
+        baseline = histogram(dmap, num_bins=5)
+        for i in range(5):
+            xs = np.random.rand(20)*(i+1)
+            buff.send(pd.DataFrame({'x': xs, 'y': np.random.rand(20)}))
+            # The bins of the first window are reused as the range grows
+            self.assertEqual(hist[()], baseline[()])
+            edges = list(hist[()].edges)
+            self.assertEqual(hist[()], histogram(Points(buff.data), bins=edges))
+        self.assertIsNot(hist.callback.operation._buffer_state, None)
+
+    def test_decimate_spatial_index(self):
+        points = Points(np.random.randn(1000, 2))
+        decimated = decimate(points, x_range=(-1, 1), y_range=(-1, 1),
+                             max_samples=100, dynamic=False)
+        config.spatial_index = True
+        try:
+            indexed = decimate(points, x_range=(-1, 1), y_range=(-1, 1),
+                               max_samples=100, dynamic=False)
+        finally:
+            config.spatial_index = False
+        self.assertEqual(indexed, decimated)
+
+    def test_downsample_image_mean(self):
+        img = Image(np.arange(64.).reshape(8, 8), bounds=(0, 0, 8, 8))
+        downsampled = downsample_image(img, width=4, height=2, dynamic=False)
+        expected = np.arange(64.).reshape(2, 4, 4, 2).mean(axis=(1, 3))
+        self.assertEqual(downsampled.bounds.lbrt(), (0, 0, 8, 8))
+        self.assertEqual(downsampled.dimension_values(2, flat=False),
+                         np.flipud(expected))
+
+    def test_downsample_image_no_downsampling(self):
+        img = Image(np.random.rand(8, 8))
+        downsampled = downsample_image(img, width=8, height=8, dynamic=False)
+        self.assertEqual(downsampled, img)
+
+    def test_downsample_image_x_range(self):
+        img = Image(np.arange(64.).reshape(8, 8), bounds=(0, 0, 8, 8))
+        downsampled = downsample_image(img, width=4, height=8, x_range=(0, 4),
+                                       dynamic=False)
+        self.assertEqual(downsampled, img.select(x=(0, 4)))
+
+    def test_downsample_image_max_padded(self):
+        img = Image(np.arange(15.).reshape(3, 5), bounds=(0, 0, 5, 3))
+        downsampled = downsample_image(img, width=3, height=3, aggregator='max',
+                                       dynamic=False)
+        self.assertEqual(downsampled.bounds.lbrt(), (0, 0, 6, 3))
+        self.assertEqual(downsampled.dimension_values(2, flat=False),
+                         np.array([[11, 13, 14], [6, 8, 9], [1, 3, 4]]))
+
+    def test_downsample_quadmesh_min(self):
+        xs, ys = np.array([0, 1, 3, 6, 10]), np.array([0, 1])
+        qmesh = QuadMesh((xs, ys, np.array([[4, 3, 2, 1]])))
+        downsampled = downsample_image(qmesh, width=2, height=1, aggregator='min',
+                                       dynamic=False)
+        self.assertEqual(downsampled, QuadMesh((np.array([0, 3, 10]), ys, np.array([[3, 1]]))))
+
     def test_interpolate_curve_pre(self):
         interpolated = interpolate_curve(Curve([0, 0.5, 1]), interpolation='steps-pre')
         curve = Curve([(0, 0), (0, 0.5), (1, 0.5), (1, 1), (2, 1)])
@@ -76,3 +76,45 @@ class KDEOperationTests(ComparisonTestCase):
                             y_range=(0, 4), contours=False)
         img = Image(np.zeros((2, 2)), bounds=(-2, -2, 6, 6), vdims=['Density'])
         self.assertEqual(kde, img)
+
+    def test_univariate_kde_binned(self):
+        np.random.seed(1)
+        dist = Distribution(np.random.randn(1000))
+        exact = univariate_kde(dist, n_samples=100)
+        binned = univariate_kde(dist, n_samples=100, method='binned')
+        self.assertEqual(binned.dimension_values(0), exact.dimension_values(0))
+        ys, exact_ys = binned.dimension_values(1), exact.dimension_values(1)
+        self.assertLess(np.abs(ys-exact_ys).max(), 0.01*exact_ys.max())
+
+    def test_univariate_kde_binned_small_bandwidth(self):
+        np.random.seed(1)
+        dist = Distribution(np.random.randn(1000))
+        exact = univariate_kde(dist, n_samples=100, bandwidth=0.05)
+        binned = univariate_kde(dist, n_samples=100, bandwidth=0.05, method='binned')
+        ys, exact_ys = binned.dimension_values(1), exact.dimension_values(1)
+        self.assertLess(np.abs(ys-exact_ys).max(), 0.01*exact_ys.max())
+
+    def test_univariate_kde_binned_flat_distribution(self):
+        dist = Distribution([1, 1, 1])
+        kde = univariate_kde(dist, n_samples=5, bin_range=(0, 4), method='binned')
+        area = Area([], 'Value', ('Value_density', 'Density'))
+        self.assertEqual(kde, area)
+
+    def test_bivariate_kde_binned(self):
+        np.random.seed(1)
+        bivariate = Bivariate(np.random.randn(1000, 2))
+        exact = bivariate_kde(bivariate, n_samples=100, contours=False)
+        binned = bivariate_kde(bivariate, n_samples=100, contours=False,
+                               method='binned')
+        self.assertEqual(binned.bounds, exact.bounds)
+        density, exact_density = binned.dimension_values(2), exact.dimension_values(2)
+        self.assertLess(np.abs(density-exact_density).max(), 0.01*exact_density.max())
+
+    def test_bivariate_kde_binned_small_bandwidth(self):
+        np.random.seed(1)
+        bivariate = Bivariate(np.random.randn(1000, 2))
+        exact = bivariate_kde(bivariate, n_samples=100, contours=False, bandwidth=0.1)
+        binned = bivariate_kde(bivariate, n_samples=100, contours=False,
+                               bandwidth=0.1, method='binned')
+        density, exact_density = binned.dimension_values(2), exact.dimension_values(2)
+        self.assertLess(np.abs(density-exact_density).max(), 0.01*exact_density.max())
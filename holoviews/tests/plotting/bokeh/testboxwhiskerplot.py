@@ -36,6 +36,11 @@ class TestBoxWhiskerPlot(TestBokehPlot):
         self.assertIn(plot.handles['vbar_2_glyph_renderer'], hover_tool.renderers)
         self.assertIn(plot.handles['circle_1_glyph_renderer'], hover_tool.renderers)
 
+    def test_box_whisker_factors_data_order(self):
+        el = BoxWhisker(([3, 1, 2, 3, 1], [1, 2, 3, 4, 5]), 'x', 'y')
+        plot = bokeh_renderer.get_plot(el)
+        self.assertEqual(plot.handles['x_range'].factors, ['3', '1', '2'])
+
     def test_box_whisker_multi_level(self):
         box= BoxWhisker((['A', 'B']*15, [3, 10, 1]*10, np.random.randn(30)),
                         ['Group', 'Category'], 'Value')
@@ -44,6 +49,16 @@ class TestBoxWhiskerPlot(TestBokehPlot):
         self.assertEqual(x_range.factors, [
             ('A', '1'), ('A', '3'), ('A', '10'), ('B', '1'), ('B', '3'), ('B', '10')])
 
+    def test_box_whisker_grouped_outliers(self):
+        box = BoxWhisker((['B', 'A']*6, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, -100, 100]), 'x', 'y')
+        plot = bokeh_renderer.get_plot(box)
+        src = plot.handles['vbar_1_source']
+        self.assertEqual(src.data['index'], np.array(['B', 'A']))
+        self.assertEqual(src.data['top'], np.array([4, 7]))
+        out = plot.handles['circle_1_source']
+        self.assertEqual(out.data['index'], np.array(['B', 'A']))
+        self.assertEqual(out.data['y'], np.array([-100, 100]))
+
     def test_box_whisker_padding_square(self):
         curve = BoxWhisker([1, 2, 3]).options(padding=0.1)
         plot = bokeh_renderer.get_plot(curve)
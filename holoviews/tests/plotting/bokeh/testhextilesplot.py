@@ -36,6 +36,36 @@ class TestHexTilesOperation(TestBokehPlot):
                             vdims='z')
         self.assertEqual(binned, expected)
 
+    def test_hex_tiles_mean_value_aggregation(self):
+        tiles = HexTiles([(0, 0, 1), (0.5, 0.5, 2), (-0.5, -0.5, 3), (-0.4, -0.4, 4)], vdims='z')
+        binned = hex_binning(tiles, gridsize=3, aggregator=np.mean)
+        expected = HexTiles([(0, 0, 1), (2, -1, 2), (-2, 1, 3.5)],
+                            kdims=[Dimension('x', range=(-0.5, 0.5)),
+                                   Dimension('y', range=(-0.5, 0.5))],
+                            vdims='z')
+        self.assertEqual(binned, expected)
+
+    def test_hex_tiles_value_aggregation_skips_nans(self):
+        xs = np.random.RandomState(1).randn(1000, 2)
+        zs = np.arange(1000.)
+        zs[::7] = np.nan
+        tiles = HexTiles((xs[:, 0], xs[:, 1], zs), vdims='z')
+        for agg in (np.sum, np.mean, np.min, np.amin, np.max, np.amax):
+            binned = hex_binning(tiles, gridsize=5, aggregator=agg)
+            expected = hex_binning(tiles, gridsize=5, aggregator=lambda x: agg(x))
+            self.assertEqual(binned, expected)
+        summed = hex_binning(tiles, gridsize=5, aggregator=np.sum)
+        self.assertFalse(np.isnan(summed.dimension_values('z')).any())
+
+    def test_hex_tiles_custom_function_aggregation(self):
+        tiles = HexTiles([(0, 0, 1), (0.5, 0.5, 2), (-0.5, -0.5, 3), (-0.4, -0.4, 4)], vdims='z')
+        binned = hex_binning(tiles, gridsize=3, aggregator=np.median)
+        expected = HexTiles([(0, 0, 1), (2, -1, 2), (-2, 1, 3.5)],
+                            kdims=[Dimension('x', range=(-0.5, 0.5)),
+                                   Dimension('y', range=(-0.5, 0.5))],
+                            vdims='z')
+        self.assertEqual(binned, expected)
+
 
 
 class TestHexTilesPlot(TestBokehPlot):
@@ -37,6 +37,24 @@ class TestQuadMeshPlot(TestBokehPlot):
         self.assertIsInstance(plot.handles['colorbar'], ColorBar)
         self.assertIs(plot.handles['colorbar'].color_mapper, plot.handles['color_mapper'])
 
+    def test_quadmesh_transfer_dtype_float32(self):
+        qmesh = QuadMesh(Image(np.random.rand(10, 10))).opts(transfer_dtype='float32')
+        plot = bokeh_renderer.get_plot(qmesh)
+        source = plot.handles['source']
+        for col in ('z', 'left', 'right', 'bottom', 'top'):
+            self.assertEqual(source.data[col].dtype, np.float32)
+
+    def test_quadmesh_transfer_dtype_uint16(self):
+        arr = np.array([[0, 0.5], [np.nan, 1]])
+        qmesh = QuadMesh(Image(arr)).opts(transfer_dtype='uint16')
+        plot = bokeh_renderer.get_plot(qmesh)
+        source = plot.handles['source']
+        qmapper = plot.handles['quantized_mapper']
+        self.assertEqual(source.data['z'].dtype, np.uint16)
+        self.assertEqual(sorted(source.data['z']), [0, 1, 32768, 65535])
+        self.assertIs(plot.handles['glyph'].fill_color['transform'], qmapper)
+        self.assertEqual((qmapper.low, qmapper.high), (1, 65535))
+
     def test_quadmesh_inverted_coords(self):
         xs = [0, 1, 2]
         ys = [2, 1, 0]
@@ -21,6 +21,35 @@ class TestRasterPlot(TestBokehPlot):
         self.assertEqual(source.data['image'][0],
                          np.array([[0, 1], [1, 0]]))
 
+    def test_image_transfer_dtype_float32(self):
+        img = Image(np.random.rand(10, 10)).opts(transfer_dtype='float32')
+        plot = bokeh_renderer.get_plot(img)
+        source = plot.handles['source']
+        self.assertEqual(source.data['image'][0].dtype, np.float32)
+        self.assertIs(plot.handles['glyph'].color_mapper, plot.handles['color_mapper'])
+
+    def test_image_transfer_dtype_uint8(self):
+        arr = np.array([[0, 0.5], [np.nan, 1]])
+        img = Image(arr).opts(transfer_dtype='uint8', colorbar=True)
+        plot = bokeh_renderer.get_plot(img)
+        source = plot.handles['source']
+        cmapper = plot.handles['color_mapper']
+        qmapper = plot.handles['quantized_mapper']
+        self.assertEqual(source.data['image'][0],
+                         np.array([[0, 255], [1, 128]], dtype=np.uint8))
+        self.assertIs(plot.handles['glyph'].color_mapper, qmapper)
+        self.assertIs(plot.handles['colorbar'].color_mapper, cmapper)
+        self.assertEqual((qmapper.low, qmapper.high), (1, 255))
+        self.assertEqual(qmapper.palette, cmapper.palette)
+        self.assertEqual(qmapper.low_color, cmapper.nan_color)
+
+    def test_image_transfer_dtype_uint8_hover(self):
+        img = Image(np.random.rand(10, 10)).opts(transfer_dtype='uint8', tools=['hover'])
+        plot = bokeh_renderer.get_plot(img)
+        source = plot.handles['source']
+        self.assertEqual(source.data['image'][0].dtype, np.float32)
+        self.assertIs(plot.handles['glyph'].color_mapper, plot.handles['color_mapper'])
+
     def test_raster_invert_axes(self):
         arr = np.array([[0, 1, 2], [3, 4,  5]])
         raster = Raster(arr).opts(plot=dict(invert_axes=True))
@@ -57,6 +57,11 @@ class TestBokehViolinPlot(TestBokehPlot):
         self.assertEqual(patch_source.data['xs'], [kde['y']])
         self.assertEqual(patch_source.data['ys'], [kde['x']])
 
+    def test_violin_factors_data_order(self):
+        el = Violin(([3, 1, 2, 3, 1], [1, 2, 3, 4, 5]), 'x', 'y')
+        plot = bokeh_renderer.get_plot(el)
+        self.assertEqual(plot.handles['x_range'].factors, ['3', '1', '2'])
+
     def test_violin_multi_level(self):
         box= Violin((['A', 'B']*15, [3, 10, 1]*10, np.random.randn(30)),
                     ['Group', 'Category'], 'Value')
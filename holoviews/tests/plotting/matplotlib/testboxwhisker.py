@@ -2,6 +2,8 @@ from __future__ import absolute_import
 
 import numpy as np
 
+from matplotlib.cbook import boxplot_stats
+
 from holoviews.element import BoxWhisker
 
 from .testplot import TestMPLPlot, mpl_renderer
@@ -14,6 +16,35 @@ class TestMPLBoxWhiskerPlot(TestMPLPlot):
         boxwhisker = BoxWhisker(values)
         plot = mpl_renderer.get_plot(boxwhisker)
         data, style, axis_opts = plot.get_data(boxwhisker, {}, {})
+        stats = data[0][0]
+        self.assertEqual(stats['label'], '')
+        self.assertEqual(stats['med'], np.median(values))
+        self.assertEqual(stats['q1'], np.percentile(values, 25))
+        self.assertEqual(stats['q3'], np.percentile(values, 75))
+
+    def test_boxwhisker_grouped_stats(self):
+        boxwhisker = BoxWhisker((['B', 'A']*5, [1, 2, 3, 4, 5, 6, 7, 8, 9, 100]), 'x', 'y')
+        plot = mpl_renderer.get_plot(boxwhisker)
+        data, style, axis_opts = plot.get_data(boxwhisker, {}, {})
+        self.assertEqual([s['label'] for s in data[0]], ['B', 'A'])
+        self.assertEqual([s['med'] for s in data[0]], [5, 6])
+        self.assertEqual(data[0][0]['fliers'], np.array([]))
+        self.assertEqual(data[0][1]['fliers'], np.array([100.]))
+
+    def test_boxwhisker_whiskers_match_matplotlib(self):
+        values = np.array([0, 1, 2, 3, 4, 5, 6, 100.])
+        boxwhisker = BoxWhisker(values)
+        plot = mpl_renderer.get_plot(boxwhisker)
+        data, style, axis_opts = plot.get_data(boxwhisker, {}, {'whis': 0.1})
+        expected = boxplot_stats(values, whis=0.1)[0]
+        for stat in ('q1', 'med', 'q3', 'whislo', 'whishi', 'fliers'):
+            self.assertEqual(data[0][0][stat], expected[stat])
+
+    def test_boxwhisker_sym_computed_by_matplotlib(self):
+        values = np.random.rand(100)
+        boxwhisker = BoxWhisker(values)
+        plot = mpl_renderer.get_plot(boxwhisker)
+        data, style, axis_opts = plot.get_data(boxwhisker, {}, {'sym': 'x'})
         self.assertEqual(data[0][0], values)
         self.assertEqual(style['labels'], [''])
 
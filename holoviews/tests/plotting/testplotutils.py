@@ -9,13 +9,14 @@ from holoviews.core.spaces import DynamicMap, HoloMap
 from holoviews.core.options import Store, Cycle
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.element import (Image, Scatter, Curve, Points,
-                               Area, VectorField, HLine, Path)
+                               Area, VectorField, HLine, Path, BoxWhisker)
 from holoviews.operation import operation
 from holoviews.plotting.util import (
     compute_overlayable_zorders, get_min_distance, process_cmap,
     initialize_dynamic, split_dmap_overlay, _get_min_distance_numpy,
     bokeh_palette_to_palette, mplcmap_to_palette, color_intervals,
-    get_range, get_axis_padding)
+    get_range, get_axis_padding, hex_aggregate, hex_partials,
+    combine_hex_partials, group_distributions, grouped_box_stats)
 from holoviews.streams import PointerX
 
 try:
@@ -613,6 +614,100 @@ class TestPlotUtils(ComparisonTestCase):
         self.assertEqual(dist, 1.0)
 
 
+class TestHexAggregate(ComparisonTestCase):
+
+    def setUp(self):
+        self.q = np.array([0, 2, -2, -2, 0, 2])
+        self.r = np.array([0, -1, 1, 1, 0, 3])
+        self.values = np.array([1., 2., 3., np.nan, 5., 6.])
+
+    def test_hex_aggregate_count(self):
+        q, r, counts, _ = hex_aggregate(self.q, self.r)
+        self.assertEqual(q, np.array([0, 2, -2, 2]))
+        self.assertEqual(r, np.array([0, -1, 1, 3]))
+        self.assertEqual(counts, np.array([2, 1, 2, 1]))
+
+    def test_hex_aggregate_sum(self):
+        _, _, _, (agg,) = hex_aggregate(self.q, self.r, [self.values], 'sum')
+        self.assertEqual(agg, np.array([6., 2., np.nan, 6.]))
+
+    def test_hex_aggregate_nansum(self):
+        _, _, _, (agg,) = hex_aggregate(self.q, self.r, [self.values], 'nansum')
+        self.assertEqual(agg, np.array([6., 2., 3., 6.]))
+
+    def test_hex_aggregate_nanmean(self):
+        _, _, _, (agg,) = hex_aggregate(self.q, self.r, [self.values], 'nanmean')
+        self.assertEqual(agg, np.array([3., 2., 3., 6.]))
+
+    def test_hex_aggregate_integer_max(self):
+        values = np.array([1, 2, 3, 4, 5, 6])
+        _, _, _, (agg,) = hex_aggregate(self.q, self.r, [values], 'max')
+        self.assertEqual(agg, np.array([5, 2, 4, 6]))
+
+    def test_hex_aggregate_sparse_keys(self):
+        q, r = np.array([0, 10**7, 0]), np.array([-10**7, 10**7, -10**7])
+        bq, br, counts, (agg,) = hex_aggregate(q, r, [np.array([1, 2, 3])], 'min')
+        self.assertEqual(bq, np.array([0, 10**7]))
+        self.assertEqual(br, np.array([-10**7, 10**7]))
+        self.assertEqual(agg, np.array([1, 2]))
+
+    def test_hex_partials_combined_mean(self):
+        partials = [hex_partials(self.q[s], self.r[s], [self.values[s]], 'nanmean')
+                    for s in (slice(0, 3), slice(3, None))]
+        q, r, counts = (np.concatenate([p[i] for p in partials]) for i in range(3))
+        parts = [[np.concatenate([p[3][0][i] for p in partials]) for i in range(2)]]
+        bq, br, total, (agg,) = combine_hex_partials(q, r, counts, parts, 'nanmean')
+        self.assertEqual(bq, np.array([0, 2, -2, 2]))
+        self.assertEqual(total, np.array([2, 1, 2, 1]))
+        self.assertEqual(agg, np.array([3., 2., 3., 6.]))
+
+
+class TestGroupedBoxStats(ComparisonTestCase):
+
+    def test_group_distributions(self):
+        box = BoxWhisker((['B', 'A', 'B', 'A', 'C'], [1, 2, 3, 4, 5]), 'x', 'y')
+        keys, values, offsets = group_distributions(box, box.kdims)
+        self.assertEqual(keys, [('B',), ('A',), ('C',)])
+        self.assertEqual(values, np.array([1, 3, 2, 4, 5]))
+        self.assertEqual(offsets, np.array([0, 2, 4, 5]))
+
+    def test_group_distributions_no_kdims(self):
+        box = BoxWhisker([3, 1, 2])
+        keys, values, offsets = group_distributions(box, [])
+        self.assertEqual(keys, [()])
+        self.assertEqual(values, np.array([3, 1, 2]))
+        self.assertEqual(offsets, np.array([0, 3]))
+
+    def test_grouped_box_stats_matches_percentiles(self):
+        np.random.seed(1)
+        groups = [np.random.standard_cauchy(n) for n in (1, 7, 20, 50)]
+        groups[2][3] = np.nan
+        values = np.concatenate(groups)
+        offsets = np.cumsum([0]+[len(g) for g in groups])
+        stats = grouped_box_stats(values, offsets)
+        for i, vals in enumerate(groups):
+            vals = vals[np.isfinite(vals)]
+            q1, q2, q3 = np.percentile(vals, [25, 50, 75])
+            iqr = q3 - q1
+            upper = vals[vals <= q3 + 1.5*iqr].max()
+            lower = vals[vals >= q1 - 1.5*iqr].min()
+            self.assertEqual(stats['q1'][i], q1)
+            self.assertEqual(stats['q2'][i], q2)
+            self.assertEqual(stats['q3'][i], q3)
+            self.assertEqual(stats['upper'][i], upper)
+            self.assertEqual(stats['lower'][i], lower)
+            group_values = values[offsets[i]:offsets[i+1]]
+            outliers = group_values[stats['outliers'][offsets[i]:offsets[i+1]]]
+            self.assertEqual(outliers, vals[(vals > upper) | (vals < lower)])
+
+    def test_grouped_box_stats_empty_group(self):
+        values = np.array([1., 2., np.nan, 3.])
+        stats = grouped_box_stats(values, np.array([0, 2, 3, 4]))
+        self.assertEqual(stats['q2'], np.array([1.5, 0, 3.]))
+        self.assertEqual(stats['count'], np.array([2, 0, 1]))
+        self.assertEqual(stats['outliers'], np.zeros(4, dtype=bool))
+
+
 class TestRangeUtilities(ComparisonTestCase):
 
     def test_get_axis_padding_scalar(self):
@@ -774,6 +774,39 @@ class TestBufferArrayStream(ComparisonTestCase):
         with self.assertRaisesRegexp(TypeError, error):
             buff.send([1])
 
+    def test_buffer_array_circular_send(self):
+        buff = Buffer(np.array([[0, 1]]), length=3, circular=True)
+        buff.send(np.array([[1, 2]]))
+        self.assertEqual(buff.data, np.array([[0, 1], [1, 2]]))
+
+    def test_buffer_array_circular_wraparound(self):
+        buff = Buffer(np.array([[0, 1]]), length=3, circular=True)
+        buff.send(np.array([[1, 2], [2, 3]]))
+        buff.send(np.array([[3, 4], [4, 5]]))
+        self.assertEqual(buff.data, np.array([[2, 3], [3, 4], [4, 5]]))
+        self.assertEqual(buff._chunk_length, 2)
+
+    def test_buffer_array_circular_patch_larger_than_length(self):
+        buff = Buffer(np.array([[0, 1]]), length=2, circular=True)
+        buff.send(np.array([[1, 2], [2, 3], [3, 4]]))
+        self.assertEqual(buff.data, np.array([[2, 3], [3, 4]]))
+
+    def test_buffer_array_circular_truncates_initial_data(self):
+        buff = Buffer(np.array([[0, 1], [1, 2], [2, 3]]), length=2, circular=True)
+        self.assertEqual(buff.data, np.array([[1, 2], [2, 3]]))
+
+    def test_buffer_array_circular_upcasts_dtype(self):
+        buff = Buffer(np.array([[0, 1]]), length=3, circular=True)
+        buff.send(np.array([[1.5, 2.5]]))
+        self.assertEqual(buff.data, np.array([[0, 1], [1.5, 2.5]]))
+
+    def test_buffer_array_circular_clear(self):
+        buff = Buffer(np.array([[0, 1]]), length=2, circular=True)
+        buff.clear()
+        self.assertEqual(buff.data, np.zeros((0, 2), dtype=int))
+        buff.send(np.array([[1, 2]]))
+        self.assertEqual(buff.data, np.array([[1, 2]]))
+
 
 class TestBufferDictionaryStream(ComparisonTestCase):
 
@@ -816,6 +849,18 @@ class TestBufferDictionaryStream(ComparisonTestCase):
         with self.assertRaisesRegexp(ValueError, error):
             buff.send({'x': np.array([2]), 'y': np.array([3, 4])})
 
+    def test_buffer_dict_circular_upcasts_strings(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array(['a'])}, length=2, circular=True)
+        buff.send({'x': np.array([1]), 'y': np.array(['bcd'])})
+        self.assertEqual(buff.data['y'], np.array(['a', 'bcd']))
+
+    def test_buffer_dict_circular_wraparound(self):
+        data = {'x': np.array([0]), 'y': np.array([1])}
+        buff = Buffer(data, length=2, circular=True)
+        buff.send({'x': np.array([1]), 'y': np.array([2])})
+        buff.send({'x': np.array([2]), 'y': np.array([3])})
+        self.assertEqual(buff.data, {'x': np.array([1, 2]), 'y': np.array([2, 3])})
+
 
 class TestBufferDataFrameStream(ComparisonTestCase):
 
@@ -876,6 +921,37 @@ class TestBufferDataFrameStream(ComparisonTestCase):
         buff.clear()
         self.assertEqual(buff.data, data.iloc[:0, :].reset_index())
 
+    def test_buffer_dframe_circular_wraparound(self):
+        data = pd.DataFrame({'x': np.array([0]), 'y': np.array([1])})
+        buff = Buffer(data, length=2, index=False, circular=True)
+        buff.send(pd.DataFrame({'x': np.array([1, 2]), 'y': np.array([2, 3])}))
+        dframe = pd.DataFrame({'x': np.array([1, 2]), 'y': np.array([2, 3])}, index=[0, 1])
+        self.assertEqual(buff.data, dframe)
+
+    def test_buffer_dframe_circular_with_index(self):
+        data = pd.DataFrame({'x': np.array([0]), 'y': np.array([1])})
+        buff = Buffer(data, length=2, circular=True)
+        buff.send(pd.DataFrame({'x': np.array([1]), 'y': np.array([2])}))
+        dframe = pd.DataFrame({'x': np.array([0, 1]), 'y': np.array([1, 2])}, index=[0, 0])
+        self.assertEqual(buff.data.values, dframe.reset_index().values)
+
+    def test_buffer_dframe_circular_shares_memory(self):
+        data = pd.DataFrame({'x': np.array([0.]), 'y': np.array([1.])})
+        buff = Buffer(data, length=2, circular=True)
+        buff.send(pd.DataFrame({'x': np.array([1.]), 'y': np.array([2.])}))
+        self.assertTrue(np.shares_memory(buff.data['x'].values, buff._ring[1]))
+        self.assertTrue(np.shares_memory(buff.data['y'].values, buff._ring[1]))
+        self.assertEqual(list(buff.data.columns), ['index', 'x', 'y'])
+
+    def test_buffer_dframe_circular_upcasts_column(self):
+        data = pd.DataFrame({'x': np.array([0]), 'y': np.array([1])})
+        buff = Buffer(data, length=2, index=False, circular=True)
+        buff.send(pd.DataFrame({'x': np.array([1]), 'y': np.array([2.5])}))
+        dframe = pd.DataFrame({'x': np.array([0, 1]), 'y': np.array([1., 2.5])},
+                              index=[0, 0])
+        self.assertEqual(buff.data, dframe)
+        self.assertEqual(buff.data['x'].dtype, np.dtype('int64'))
+
 
 class TestExprSelectionStream(ComparisonTestCase):
 
@@ -17,9 +17,10 @@ from ..core.options import options_policy, Keywords, Options
 from ..core.operation import Operation
 from ..core.util import basestring, merge_options_to_dict, OrderedDict
 from ..core.operation import OperationCallable
+from ..core.spaces import get_nested_streams
 from ..core import util
 from ..operation.element import function
-from ..streams import Stream, Params
+from ..streams import Buffer, Stream, Params
 from .settings import OutputSettings, list_formats, list_backends
 
 Store.output_settings = OutputSettings
@@ -961,6 +962,8 @@ class Dynamic(param.ParameterizedFunction):
             return self.p.operation(**kwargs)
         elif isinstance(self.p.operation, Operation):
             kwargs = {k: v for k, v in kwargs.items() if k in self.p.operation.param}
+            if 'incremental' in self.p.operation.param:
+                self.p.operation._buffer = self._buffer
             return self.p.operation.process_element(element, key, **kwargs)
         else:
             return self.p.operation(element, **kwargs)
@@ -985,6 +988,13 @@ class Dynamic(param.ParameterizedFunction):
             key, obj = resolve(key, kwargs)
             return apply(obj, *key, **kwargs)
 
+        # Operations supporting incremental updates require the single
+        # Buffer stream supplying the data of the input elements
+        buffers = []
+        if isinstance(map_obj, DynamicMap):
+            buffers = [s for s in get_nested_streams(map_obj) if isinstance(s, Buffer)]
+        self._buffer = buffers[0] if len(buffers) == 1 else None
+
         operation = self.p.operation
         if not isinstance(operation, Operation):
             operation = function.instance(fn=apply)